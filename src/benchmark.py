@@ -0,0 +1,294 @@
+"""
+Micro-benchmarks for the game's hot paths.
+
+Engine benchmarks run on their own; the widget benchmarks (deck construction,
+undo/redo and card rendering) run inside a headless app so they go through
+the same code as a real session. Every benchmark is warmed up and calibrated
+until one batch takes at least ``--min-time`` seconds, then timed
+``--repeat`` times with the garbage collector off, like `timeit`. Benchmarks
+that are coroutines are awaited, so they can include the widget updates a
+move defers to the next message and the repaint after it.
+
+Usage::
+
+    python benchmark.py                       # table on stdout
+    python benchmark.py --json results.json   # machine-readable results
+    python benchmark.py --compare results.json --threshold 1.25
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from typing import Awaitable, Callable, Iterator
+
+Benchmark = tuple[str, Callable[[], None] | Callable[[], Awaitable[None]]]
+
+# Fixed deal so every run measures the same positions.
+DEAL_NUMBER = 2024
+
+
+def engine_benchmarks() -> Iterator[Benchmark]:
+    from engine import deals
+    from engine.klondike import REROLL, TABLEAU, Klondike
+
+    yield "deal_order", lambda: deals.deal_order(DEAL_NUMBER)
+    yield "klondike_deal", lambda: Klondike.deal(3, DEAL_NUMBER)
+
+    game = Klondike.deal(1, DEAL_NUMBER)
+    yield "klondike_copy", game.copy
+    yield "legal_moves", game.legal_moves
+
+    # Validation of every pile-to-pile and to-foundation move, legal or not
+    candidates = [
+        (TABLEAU, source, 1, target, target_index)
+        for source in range(7)
+        for target, count in ((TABLEAU, 7), (2, 4))
+        for target_index in range(count)
+    ]
+
+    def validate_moves() -> None:
+        for move in candidates:
+            game.can_move(*move)
+
+    yield "can_move_x77", validate_moves
+
+    # Recording a move for undo and undoing it; replaces the old board snapshots
+    moves = [move for move in game.legal_moves() if move != REROLL]
+
+    def apply_revert() -> None:
+        for move in moves:
+            game.revert(game.apply(move))
+
+    yield f"apply_revert_x{len(moves)}", apply_revert
+
+
+def widget_benchmarks(app, pilot) -> Iterator[Benchmark]:
+    from controllers.card_interact_controller import CardInteractController
+    from controllers.service_locator import ServiceLocator
+    from managers.game_state_manager import GameStateManager
+    from managers.render_cache_manager import RenderCacheManager
+    from widgets.card import Card
+    from widgets.game_layout import GameLayout
+
+    controller = ServiceLocator.get(CardInteractController)
+    game = controller.game
+    screen = app.screen
+    layout = GameLayout()
+
+    def build_deal() -> None:
+        layout._create_tableau_piles(GameLayout.create_deck(), game)
+
+    yield "create_deck_and_piles", build_deal
+
+    # Play a few moves so there is something to undo
+    for _ in range(3):
+        controller._play(game.legal_moves()[0])
+    game_state_manager = ServiceLocator.get(GameStateManager)
+
+    assert game_state_manager.undo_stack
+
+    async def undo_redo() -> None:
+        # Without this, the undo budget runs out and the "Undo limit reached" notice is timed instead
+        game_state_manager.remaining_undo = 1
+        game_state_manager.undo_last_operation(screen)
+        game_state_manager.redo_last_operation(screen)
+        # Wait for every widget to handle the reconciles the move queued, then repaint
+        await pilot.pause(0)
+
+    yield "undo_redo", undo_redo
+
+    # The fixed cost of settling included in undo_redo, with nothing to reconcile or repaint
+    async def settle_idle() -> None:
+        await pilot.pause(0)
+
+    yield "settle_idle", settle_idle
+
+    card: Card = controller.cards[game.tableau[6][-1]]
+    render_cache = ServiceLocator.get(RenderCacheManager)
+    yield "card_render_cached", card.render
+
+    def render_uncached() -> None:
+        render_cache.clear()
+        card.render()
+
+    yield "card_render_uncached", render_uncached
+
+
+def _time(operation: Callable[[], None], number: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(number):
+            operation()
+        return time.perf_counter() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+async def _time_async(operation: Callable[[], Awaitable[None]], number: int) -> float:
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        started = time.perf_counter()
+        for _ in range(number):
+            await operation()
+        return time.perf_counter() - started
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _next_number(number: int, elapsed: float, min_time: float) -> int:
+    return max(number * 2, int(number * min_time / max(elapsed, 1e-9)))
+
+
+def measure(name: str, operation: Callable[[], None], repeat: int, min_time: float) -> dict:
+    """
+    Time one benchmark.
+
+    :return: Per-operation statistics in nanoseconds.
+    """
+    # Warm up and find a batch size that runs for at least `min_time`
+    number = 1
+    while True:
+        elapsed = _time(operation, number)
+        if elapsed >= min_time:
+            break
+        number = _next_number(number, elapsed, min_time)
+
+    samples = [_time(operation, number) / number * 1e9 for _ in range(repeat)]
+    return _statistics(name, number, repeat, samples)
+
+
+async def measure_async(
+    name: str, operation: Callable[[], Awaitable[None]], repeat: int, min_time: float
+) -> dict:
+    """Time one benchmark that is a coroutine, like `measure`."""
+    number = 1
+    while True:
+        elapsed = await _time_async(operation, number)
+        if elapsed >= min_time:
+            break
+        number = _next_number(number, elapsed, min_time)
+
+    samples = [await _time_async(operation, number) / number * 1e9 for _ in range(repeat)]
+    return _statistics(name, number, repeat, samples)
+
+
+def _statistics(name: str, number: int, repeat: int, samples: list[float]) -> dict:
+    return {
+        "name": name,
+        "number": number,
+        "repeat": repeat,
+        "min_ns": min(samples),
+        "median_ns": statistics.median(samples),
+        "mean_ns": statistics.fmean(samples),
+        "stdev_ns": statistics.stdev(samples) if repeat > 1 else 0.0,
+    }
+
+
+async def _run_widget_benchmarks(args: argparse.Namespace, results: list[dict]) -> None:
+    from pasjans import Pasjans
+    from screens.game import Game
+
+    app = Pasjans()
+    async with app.run_test() as pilot:
+        await app.push_screen(Game(True, True, seed=DEAL_NUMBER))
+        await pilot.pause()
+        for name, operation in widget_benchmarks(app, pilot):
+            if args.filter in name:
+                if inspect.iscoroutinefunction(operation):
+                    result = await measure_async(name, operation, args.repeat, args.min_time)
+                else:
+                    result = measure(name, operation, args.repeat, args.min_time)
+                results.append(result)
+                _report(results[-1])
+            # Let the deferred widget updates of the last benchmark run before the next one
+            await pilot.pause()
+
+
+def _report(result: dict) -> None:
+    print(
+        f"{result['name']:<24} {result['median_ns'] / 1000:>12,.2f} µs"
+        f"  ± {result['stdev_ns'] / 1000:,.2f}  (min {result['min_ns'] / 1000:,.2f}, "
+        f"{result['repeat']}×{result['number']})",
+        file=sys.stderr,
+    )
+
+
+def compare(results: list[dict], baseline_path: str, threshold: float) -> bool:
+    """Print the ratio to a previous run and return False if any benchmark got slower than `threshold`."""
+    with open(baseline_path, encoding="utf-8") as file:
+        baseline = {result["name"]: result for result in json.load(file)["results"]}
+
+    ok = True
+    for result in results:
+        before = baseline.get(result["name"])
+        if before is None:
+            continue
+        ratio = result["median_ns"] / before["median_ns"]
+        regressed = ratio > threshold
+        ok &= not regressed
+        print(
+            f"{result['name']:<24} {ratio:>6.2f}x{'  REGRESSION' if regressed else ''}",
+            file=sys.stderr,
+        )
+    return ok
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the game's hot paths.")
+    parser.add_argument("--repeat", type=int, default=7, help="timed batches per benchmark")
+    parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per batch")
+    parser.add_argument("--filter", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    parser.add_argument("--compare", metavar="PATH", help="JSON results of a previous run")
+    parser.add_argument(
+        "--threshold", type=float, default=1.25, help="slowdown ratio reported as a regression"
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    os.environ.setdefault("PASJANS_AUDIO", "0")
+    os.environ.setdefault("PASJANS_REPLAYS", "0")
+    os.environ.setdefault("PASJANS_AUTOSAVE", "0")
+
+    results: list[dict] = []
+    for name, operation in engine_benchmarks():
+        if args.filter in name:
+            results.append(measure(name, operation, args.repeat, args.min_time))
+            _report(results[-1])
+    asyncio.run(_run_widget_benchmarks(args, results))
+
+    if args.json:
+        output = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": results,
+        }
+        if args.json == "-":
+            json.dump(output, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w", encoding="utf-8") as file:
+                json.dump(output, file, indent=2)
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
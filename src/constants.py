@@ -1,6 +1,36 @@
+import os
+
 VALUES = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 SUITS = ["♥", "♦", "♠", "♣"]
 RED_SUITS = ["♥", "♦"]
 BLACK_SUITS = ["♠", "♣"]
 THEMES = ["default", "ascii"]
 MAX_UNDO = 3
+SOLVER_MAX_NODES = 200_000
+# Winnable deals are typically solved in a few milliseconds, but 13 of deals 0-39 in easy
+# mode and 12 in hard use up the whole second and come out "unknown"; 5 seconds only
+# settles two more, so a longer default would just keep the solve key busy
+SOLVER_MAX_SECONDS = 1.0
+SOLVER_MAX_REROLLS = 3
+RAINBOW_FPS = 30
+RAINBOW_PALETTE_SIZE = 360
+RENDER_CACHE_SIZE = 2048
+AUDIO_ENABLED = os.environ.get("PASJANS_AUDIO", "1") != "0"
+SOUND_EFFECTS = {
+    "flip": "sounds/flip.ogg",
+    "shuffle": "sounds/shuffle.ogg",
+    "win": "sounds/winscreen.ogg",
+}
+LOBBY_MUSIC = "sounds/lobby.mp3"
+CLOCK_RESOLUTION = 1.0
+DB_BUSY_TIMEOUT_MS = 5000
+DB_LOCK_RETRIES = 5
+LEADERBOARD_PAGE_SIZE = 20
+LEADERBOARD_CACHED_PAGES = 32
+REPLAYS_ENABLED = os.environ.get("PASJANS_REPLAYS", "1") != "0"
+REPLAY_KEYFRAME_INTERVAL = 32
+AUTOSAVE_ENABLED = os.environ.get("PASJANS_AUTOSAVE", "1") != "0"
+JOURNAL_SNAPSHOT_INTERVAL = 64
+SIMULATION_MAX_MOVES = 1000
+SIMULATION_MAX_REROLLS = 5
+STARTUP_BUDGET_SECONDS = 0.5
@@ -1,41 +1,81 @@
 from __future__ import annotations
 
-from random import shuffle
-from typing import cast
+from typing import TYPE_CHECKING
 
-from textual.css.query import DOMQuery
 from textual.screen import Screen
 
-import constants
 from controllers.service_locator import ServiceLocator
-from managers.move_event_manager import MoveEventManager
+from engine.klondike import (
+    DRAW,
+    EMPTY,
+    FOUNDATION,
+    REROLL,
+    STASH,
+    TABLEAU,
+    WASTE,
+    Klondike,
+    Move,
+    Record,
+    Step,
+)
+from managers.event_bus import CardFlipped, EventBus, GameWon, MoveApplied, MoveUndone, StashCycled
+from managers.trace_manager import TraceManager
 from widgets.card import Card
 from widgets.card_holder import CardHolder
 from widgets.foundation import Foundation
 from widgets.stash_waste import StashWaste
 from widgets.tableau import Pile
 
+if TYPE_CHECKING:
+    from engine.replay import ReplayWriter
+
 
 class CardInteractController:
     """
     Controller for card interactions in the game.
 
-    This class handles all the logic related to card interactions, such as clicking on cards,
-    moving cards between piles, and handling game state changes. It separates the game logic
-    from the UI components.
+    This class translates clicks on card widgets into moves on the `Klondike` engine,
+    which owns the game state and rules, and then syncs only the affected widgets
+    from the engine. It separates the game logic from the UI components.
+
+    The selection is held here as engine cards, bottom card first, and changing it
+    only repaints the cards whose selected state changed.
     """
 
-    def __init__(self, screen: Screen, easy_mode: bool, move_event_manager: MoveEventManager = None):
+    def __init__(
+        self,
+        screen: Screen,
+        easy_mode: bool,
+        event_bus: EventBus = None,
+        seed: int | None = None,
+        trace_manager: TraceManager = None,
+        auto_play: bool = False,
+    ):
         """
         Initialize the card interaction controller.
 
         Args:
             screen: The game screen
             easy_mode: Whether the game is in easy mode
+            event_bus: Bus the moves are published on, for the screen's
+                subscribers to count them, play sounds and check for a win
+            seed: Deal number to play, a random deal when omitted
+            auto_play: Whether cards that are safe to play to the foundation are
+                played there automatically after every move
         """
         self.screen = screen
         self.easy_mode = easy_mode
-        self._move_event_manager = move_event_manager or ServiceLocator.get(MoveEventManager)
+        self.auto_play = auto_play
+        self.game = Klondike.deal(1 if easy_mode else 3, seed)
+        # Card widgets indexed by engine card and Pile widgets by tableau index, bound by GameLayout
+        self.cards: list[Card] = []
+        self.piles: list[Pile] = []
+        # Selected engine cards in order, as an insertion-ordered set
+        self.selection: dict[int, None] = {}
+        # Set by the game screen to record every move into its replay
+        self.recorder: ReplayWriter | None = None
+        self.event_bus = event_bus or EventBus()
+        self._trace_manager = trace_manager or ServiceLocator.get(TraceManager)
 
     def handle_card_click(self, card: Card) -> None:
         """
@@ -48,410 +88,366 @@ class CardInteractController:
             card: The card that was clicked
         """
 
-        stash_waste: StashWaste = self.screen.query_one(StashWaste)
-        top_stash_card = stash_waste.get_top_stash_card()
-
-        # Discovering new card from stash
-        if top_stash_card == card:
-            self._handle_stash_card_draw(stash_waste)
-            return
-
         # Rerolling cards if reached end of stash
-        elif top_stash_card is None and card.value == "⟳":
-            self._handle_stash_reroll(stash_waste)
+        if card.card_id is None:
+            if not self.game.stash:
+                self._handle_stash_reroll()
             return
 
-        # For rest we dont want to be able to click on hidden cards
-        if card.hidden:
-            return
+        zone, index, position = self.game.locate(card.card_id)
 
-        pile: Pile | None = card.get_pile()
-        selected_cards: DOMQuery[Card] = cast(
-            DOMQuery[Card], self.screen.query("Card.selected")
-        )
+        # Discovering new card from stash
+        if zone == STASH:
+            self._handle_stash_card_draw()
+            return
 
         # Clicked card belong to pile
-        if pile:
-            self._handle_pile_card_click(pile, selected_cards, stash_waste, card)
+        if zone == TABLEAU:
+            # For rest we dont want to be able to click on hidden cards
+            if self.game.is_face_up(index, position):
+                self._handle_pile_card_click(index, position, card)
             return
 
-        foundation: Foundation = self.screen.query_one(Foundation)
-
         # Moving to foundation
-        if card in foundation.cards:
-            self._handle_foundation_card_click(
-                foundation, selected_cards, stash_waste, card
-            )
+        if zone == FOUNDATION:
+            self._handle_foundation_card_click(index)
             return
 
         # Allow selecting cards in waste
-        if card in stash_waste.waste:
-            self._handle_waste_card_click(stash_waste, card)
+        if zone == WASTE:
+            self._handle_waste_card_click(position, card)
 
-    def _handle_stash_card_draw(self, stash_waste: StashWaste) -> None:
+    def _handle_stash_card_draw(self) -> None:
         """Handle drawing a card from the stash."""
 
-        self._move_event_manager.on_pre_move_event(self.screen)
-
-        for card in stash_waste.waste:
-            card.make_unselected()
-
-        waste = stash_waste.waste.copy()
-        stash = stash_waste.stash.copy()
-
-        if not self.easy_mode:
-            cards_to_pop = min(3, len(stash))
-            for _ in range(cards_to_pop):
-                if stash:
-                    card = stash.pop()
-                    card.unhide()
-                    waste.append(card)
-        else:
-            card = stash[-1]
-            waste.append(card)
-            stash.pop()
-            card.unhide()
-
-        stash_waste.waste = waste
-        stash_waste.stash = stash
-
-        self._move_event_manager.on_post_move_event(self.screen)
+        self._unselect_waste()
+        self._play(DRAW)
 
-    def _handle_stash_reroll(self, stash_waste: StashWaste) -> None:
+    def _handle_stash_reroll(self) -> None:
         """Handle rerolling the stash when it's empty."""
 
-        self._move_event_manager.on_pre_move_event(self.screen)
-
-        waste = stash_waste.waste.copy()
-        shuffle(waste)
-        for card in waste:
-            card.hide()
-        stash_waste.waste = []
-        stash_waste.stash = waste
-
-        self._move_event_manager.on_post_move_event(self.screen)
+        self._unselect_waste()
+        self._play(REROLL)
 
     def _handle_pile_card_click(
         self,
-        pile: Pile,
-        selected_cards: DOMQuery[Card],
-        stash_waste: StashWaste,
+        pile_index: int,
+        position: int,
         card: Card,
     ) -> None:
         """Handle clicking on a card in a pile."""
 
         if card.is_selected():
-            pile.unselect_cards()
+            self._unselect_all()
+        # Moving from pile
+        elif self.selection and position == len(self.game.tableau[pile_index]) - 1:
+            source = self._get_selection_source()
+            if source is not None:
+                self._apply_move(*source, TABLEAU, pile_index)
+        # Not moving from pile
         else:
-            top_card: Card = pile.cards[-1]
-
-            # Moving from pile
-            if selected_cards and top_card == card:
-                self._handle_move_to_pile(pile, selected_cards, stash_waste)
-            # Not moving from pile
-            else:
-                self._select_cards_in_pile(pile, stash_waste, card)
-
-    def _handle_move_to_pile(
-        self, pile: Pile, selected_cards: DOMQuery[Card], stash_waste: StashWaste
+            self._select_cards_in_pile(pile_index, position)
+
+    def _get_selection_source(self) -> tuple[int, int, int] | None:
+        """Find the zone, pile index and card count the selected cards would be moved from."""
+        bottom_card = next(iter(self.selection))
+        zone, index, position = self.game.locate(bottom_card)
+        if zone == TABLEAU:
+            return TABLEAU, index, len(self.game.tableau[index]) - position
+        if zone == WASTE:
+            return WASTE, 0, 1
+        return None
+
+    def _apply_move(
+        self,
+        source: int,
+        source_index: int,
+        count: int,
+        target: int,
+        target_index: int,
     ) -> None:
-        """Handle moving cards to a pile."""
-        top_card: Card = pile.cards[-1]
-        bottom_card: Card = selected_cards[0]
-
-        if not self._is_valid_pile_move(top_card, bottom_card):
+        """Apply a move to the engine if the rules allow it."""
+        if not self.game.can_move(source, source_index, count, target, target_index):
             return
 
-        self._move_event_manager.on_pre_move_event(self.screen)
+        self._unselect_all()
+        self._play((source, source_index, count, target, target_index))
 
-        pile_cards = pile.cards.copy()
-        for card in selected_cards:
-            pile_cards.append(card.copy())
-        pile.cards = pile_cards
+    def _play(self, move: Move) -> None:
+        """Apply a legal move to the engine, sync the two affected zones and report it."""
+        with self._trace_manager.span("move.apply"):
+            step = (self._recorded(self.game.apply(move)),)
+            if self.auto_play:
+                # Undone together with the move that made them possible
+                step += tuple(map(self._recorded, self.game.play_safe_moves()))
+        self._commit(step)
 
-        selected_pile = bottom_card.get_pile()
-
-        # Pile to pile
-        if selected_pile:
-            self._move_from_pile_to_pile(selected_pile, selected_cards)
-        # Waste to pile
-        elif bottom_card in stash_waste.waste:
-            self._move_from_waste_to_pile(stash_waste, bottom_card)
+    def _recorded(self, record: Record, undone: bool = False) -> Record:
+        """
+        Pass a record to the replay straight after the engine applied or reverted it,
+        so a keyframe falling inside a step holds the position at that record.
+        """
+        if self.recorder is not None:
+            self.recorder.record(record, undone)
+        return record
+
+    def _commit(self, step: Step) -> None:
+        """Sync the zones a step that was just applied touched and report it."""
+        with self._trace_manager.span("move.sync"):
+            self._sync_step(step)
+
+        with self._trace_manager.span("move.post"):
+            self.event_bus.publish(MoveApplied(step))
+            for record in step:
+                if record[5]:
+                    self.event_bus.publish(CardFlipped(record[1]))
+                elif record[:5] == REROLL:
+                    self.event_bus.publish(StashCycled())
+            if self.game.is_won():
+                self.event_bus.publish(GameWon())
+
+    def smart_move(self, card: Card) -> None:
+        """
+        Move a card, with the cards on top of it, to its best destination: the
+        foundation if it fits there, else the first tableau pile that takes it.
 
-        self._move_event_manager.on_post_move_event(self.screen)
+        Args:
+            card: A face-up tableau card or the top waste card
+        """
+        source = self._smart_move_source(card)
+        if source is None:
+            return
 
-    def _is_valid_pile_move(self, top_card: Card, bottom_card: Card) -> bool:
-        """Check if moving a card to a pile is valid."""
-        # Check card colors (red on black, black on red)
-        if (
-            top_card.suit in constants.RED_SUITS
-            and bottom_card.suit in constants.RED_SUITS
-        ) or (
-            top_card.suit in constants.BLACK_SUITS
-            and bottom_card.suit in constants.BLACK_SUITS
-        ):
-            return False
+        move = self.game.best_move(*source)
+        if move is None:
+            return
+        self._unselect_all()
+        self._play(move)
+
+    def _smart_move_source(self, card: Card) -> tuple[int, int, int] | None:
+        """Return the ``(zone, index, count)`` a smart move of `card` picks up, if it can be smart-moved."""
+        location = self.locate(card)
+        if location is None:
+            return None
+        zone, index, position = location
+        if zone == TABLEAU and self.game.is_face_up(index, position):
+            return TABLEAU, index, len(self.game.tableau[index]) - position
+        if zone == WASTE and position == len(self.game.waste) - 1:
+            return WASTE, 0, 1
+        return None
+
+    def handle_card_double_click(self, card: Card) -> None:
+        """
+        Smart-move a face-up tableau card or the top waste card on the second click
+        of a double click, when the first click selected it from no selection.
+        Any other second click, like a quick second draw from the stash, is a
+        plain click.
 
-        # Check card values (decreasing sequence)
+        Args:
+            card: The card clicked twice
+        """
         if (
-            constants.VALUES.index(bottom_card.value)
-            != constants.VALUES.index(top_card.value) - 1
+            card.card_id is not None
+            and self.selection
+            and next(iter(self.selection)) == card.card_id
+            and self._smart_move_source(card) is not None
         ):
-            return False
+            self.smart_move(card)
+        else:
+            self.handle_card_click(card)
 
-        return True
+    def smart_move_selection(self) -> None:
+        """Smart-move the selected cards, if any."""
+        if self.selection:
+            self.smart_move(self.cards[next(iter(self.selection))])
 
-    def _move_from_pile_to_pile(
-        self, source_pile: Pile, selected_cards: DOMQuery[Card]
-    ) -> None:
-        """Handle moving cards from one pile to another."""
-        source_pile_cards = source_pile.cards.copy()
-        for card in selected_cards:
-            source_pile_cards.remove(card)
-        if source_pile_cards:
-            source_pile_cards[-1].unhide()
-
-        source_pile.cards = source_pile_cards
-
-    def _move_from_waste_to_pile(self, stash_waste: StashWaste, card: Card) -> None:
-        """Handle moving a card from waste to a pile."""
-        waste_cards = stash_waste.waste.copy()
-        waste_cards.remove(card)
-        stash_waste.waste = waste_cards
-        if waste_cards:
-            waste_cards[-1].refresh()
-
-    def _select_cards_in_pile(
-        self, pile: Pile, stash_waste: StashWaste, clicked_card: Card
-    ) -> None:
+    def _select_cards_in_pile(self, pile_index: int, position: int) -> None:
         """Handle selecting cards in a pile."""
 
-        # Unselect all cards
-        for current_pile in self.screen.query(Pile):
-            current_pile.unselect_cards()
-
-        stash_waste.unselect_all_cards()
-
-        # Select all cards from selected to top
-        index = pile.cards.index(clicked_card)
-        card: Card
-        for card in pile.cards[index:]:
-            if not card.is_selected():
-                card.make_selected()
+        # Select all cards from selected to top, and nothing else
+        self._select(self.game.tableau[pile_index][position:])
 
-    def _handle_foundation_card_click(
-        self,
-        foundation: Foundation,
-        selected_cards: DOMQuery[Card],
-        stash_waste: StashWaste,
-        clicked_card: Card,
-    ) -> None:
+    def _handle_foundation_card_click(self, foundation_index: int) -> None:
         """Handle clicking on a card in the foundation."""
-        if len(selected_cards) != 1:
+        if len(self.selection) != 1:
             return
 
-        bottom_card = selected_cards[0]
-
-        if not self._is_valid_foundation_move(clicked_card, bottom_card):
+        source = self._get_selection_source()
+        if source is None:
             return
 
-        selected_card_pile = bottom_card.get_pile()
-
-        # Pile to foundation
-        if selected_card_pile:
-            self._move_from_pile_to_foundation(
-                selected_card_pile, foundation, bottom_card, clicked_card
-            )
-        # Waste to foundation
-        elif bottom_card in stash_waste.waste:
-            self._move_from_waste_to_foundation(
-                stash_waste, foundation, bottom_card, clicked_card
-            )
-
-    def _is_valid_foundation_move(
-        self, foundation_card: Card, card_to_move: Card
-    ) -> bool:
-        """Check if moving a card to the foundation is valid."""
-        if card_to_move.suit != foundation_card.suit:
-            return False
-
-        current_value_index = constants.VALUES.index(foundation_card.value)
-        next_value_index = constants.VALUES.index(card_to_move.value)
-
-        if next_value_index != current_value_index + 1:
-            return False
-
-        return True
-
-    def _move_from_pile_to_foundation(
-        self, pile: Pile, foundation: Foundation, card: Card, foundation_card: Card
-    ) -> None:
-        """Handle moving a card from a pile to the foundation."""
-
-        self._move_event_manager.on_pre_move_event(self.screen)
-
-        pile_cards = pile.cards.copy()
-        pile_cards.remove(card)
-
-        foundation_cards: list[Card | None] = foundation.cards.copy()
-        foundation_cards[foundation_cards.index(foundation_card)] = card
-        foundation.cards = foundation_cards
-
-        card.make_unselected()
-
-        if pile_cards:
-            pile_cards[-1].unhide()
-
-        pile.cards = pile_cards
-
-        self._move_event_manager.on_post_move_event(self.screen)
-
-    def _move_from_waste_to_foundation(
-        self,
-        stash_waste: StashWaste,
-        foundation: Foundation,
-        card: Card,
-        foundation_card: Card,
-    ) -> None:
-        """Handle moving a card from waste to the foundation."""
-
-        self._move_event_manager.on_pre_move_event(self.screen)
-
-        waste_cards = stash_waste.waste.copy()
-        waste_cards.remove(card)
-        stash_waste.waste = waste_cards
-        if waste_cards:
-            waste_cards[-1].refresh()
-
-        foundation_cards: list[Card | None] = foundation.cards.copy()
-        foundation_cards[foundation_cards.index(foundation_card)] = card
-        foundation.cards = foundation_cards
-
-        card.make_unselected()
+        zone, index, _ = source
+        self._apply_move(zone, index, 1, FOUNDATION, foundation_index)
 
-        self._move_event_manager.on_post_move_event(self.screen)
-
-    def _handle_waste_card_click(
-        self, stash_waste: StashWaste, card: Card
-    ) -> None:
+    def _handle_waste_card_click(self, position: int, card: Card) -> None:
         """Handle clicking on a card in the waste."""
 
         if card.is_selected():
-            card.make_unselected()
+            self._unselect_all()
         else:
             # Check if card is top one from waste if on hard mode
-            top_waste_card = stash_waste.get_top_waste_card()
-            if self.easy_mode or top_waste_card == card:
-                # Unselect all pile cards
-                for pile in self.screen.query(Pile):
-                    pile.unselect_cards()
-
-                card.make_selected()
+            if self.easy_mode or position == len(self.game.waste) - 1:
+                self._select((card.card_id,))
 
     def handle_card_holder_click(self, card_holder: CardHolder) -> None:
         """
         Handle the click event for a game card interaction. This method manages the logic for
         moving cards between piles, waste, and foundation during the game. Depending on the
         selected cards and their respective piles, it decides how cards should be moved or
-        whether a valid operation is being performed. It also handles specific rules for
-        moving cards such as placing only a king on an empty pile or only an ace on an
-        empty foundation.
+        whether a valid operation is being performed. The engine enforces the specific rules
+        for placing only a king on an empty pile or only an ace on an empty foundation.
         """
 
-        selected_cards = cast(DOMQuery[Card], self.screen.query("Card.selected"))
-
-        if not selected_cards:
+        if not self.selection:
             return
 
-        selected_card: Card = selected_cards[0]
-        holder_pile: Pile | None = card_holder.pile
-        selected_card_pile: Pile | None = selected_card.get_pile()
-        stash_waste: StashWaste = self.screen.query_one(StashWaste)
+        source = self._get_selection_source()
+        if source is None:
+            return
 
         # If holder is invisible one to make ability to put K
-        if holder_pile:
-            if selected_card.value == "K":
-                # Moving card from tableau
-                if selected_card_pile:
-                    self._move_event_manager.on_pre_move_event(self.screen)
-
-                    selected_pile_cards: list[Card] = selected_card_pile.cards.copy()
-                    card: Card
-                    for card in selected_cards:
-                        selected_pile_cards.remove(card)
-
-                    if selected_pile_cards:
-                        selected_pile_cards[-1].unhide()
-
-                    selected_card_pile.cards = selected_pile_cards
-
-                    holder_pile_cards: list[Card] = holder_pile.cards.copy()
-                    for card in selected_cards:
-                        card.make_unselected()
-                        holder_pile_cards.append(card)
-
-                    holder_pile.cards = holder_pile_cards
-
-                    self._move_event_manager.on_post_move_event(self.screen)
-                # Moving card from waste
-                elif selected_card in stash_waste.waste:
-                    self._move_event_manager.on_pre_move_event(self.screen)
-
-                    waste_cards: list[Card] = stash_waste.waste.copy()
-                    waste_cards.remove(selected_card)
-                    stash_waste.waste = waste_cards
-                    if waste_cards:
-                        waste_cards[-1].refresh()
-
-                    holder_pile_cards = holder_pile.cards.copy()
-                    holder_pile_cards.append(selected_card)
-                    selected_card.make_unselected()
-                    holder_pile.cards = holder_pile_cards
-
-                    self._move_event_manager.on_post_move_event(self.screen)
+        if card_holder.pile:
+            self._apply_move(*source, TABLEAU, card_holder.pile.pile_index)
             return
 
         # Card holders are only at foundation, waste, so dont allow more than 1 card to move
-        if len(selected_cards) != 1:
+        if len(self.selection) != 1:
             return
 
-        foundation = self.screen.query_one(Foundation)
-
         # If holder belong to foundation
         if card_holder.foundation_index is not None:
-            if selected_card.value == "A":
-                # From pile to foundation
-                if selected_card_pile:
-                    self._move_event_manager.on_pre_move_event(self.screen)
-
-                    selected_pile_cards = selected_card_pile.cards.copy()
-                    selected_pile_cards.remove(selected_card)
-                    selected_card.make_unselected()
-
-                    foundation_cards = foundation.cards.copy()
-                    foundation_cards[card_holder.foundation_index] = selected_card
-                    foundation.cards = foundation_cards
-
-                    if selected_pile_cards:
-                        selected_pile_cards[-1].unhide()
-
-                    selected_card_pile.cards = selected_pile_cards
-
-                    self._move_event_manager.on_post_move_event(self.screen)
-                # From waste to foundation
-                elif selected_card in stash_waste.waste:
-                    self._move_event_manager.on_pre_move_event(self.screen)
-
-                    waste_cards = stash_waste.waste.copy()
-                    waste_cards.remove(selected_card)
-                    selected_card.make_unselected()
-                    stash_waste.waste = waste_cards
-                    if waste_cards:
-                        waste_cards[-1].refresh()
-
-                    foundation = self.screen.query_one(Foundation)
-                    foundation_cards = foundation.cards.copy()
-                    foundation_cards[card_holder.foundation_index] = selected_card
-                    foundation.cards = foundation_cards
-
-                    self._move_event_manager.on_post_move_event(self.screen)
+            zone, index, _ = source
+            self._apply_move(zone, index, 1, FOUNDATION, card_holder.foundation_index)
+
+    def locate(self, card: Card) -> tuple[int, int, int] | None:
+        """
+        Look up where a card widget currently is in constant time.
+
+        Args:
+            card: The card widget
+
+        Returns:
+            The engine's ``(zone, pile index, position)`` for the card, or None for
+            the stash refresh symbol
+        """
+        if card.card_id is None:
+            return None
+        return self.game.locate(card.card_id)
+
+    def get_pile(self, card: Card) -> Pile | None:
+        """Return the tableau pile widget holding the card, if any."""
+        location = self.locate(card)
+        if location is None or location[0] != TABLEAU:
+            return None
+        return self.piles[location[1]]
+
+    def auto_complete(self) -> None:
+        """
+        Play every remaining card to the foundation as one step, once the game
+        `can_auto_complete`, and repaint the board once for all of them.
+        """
+        self._unselect_all()
+
+        with self._trace_manager.span("move.apply"):
+            step = tuple(map(self._recorded, self.game.finish()))
+        self._commit(step)
+
+    def undo(self, step: Step) -> None:
+        """Revert a recorded step and repaint only the zones it touched."""
+        self._unselect_all()
+
+        with self._trace_manager.span("move.revert"):
+            for record in reversed(step):
+                self.game.revert(record)
+                self._recorded(record, undone=True)
+        with self._trace_manager.span("move.sync"):
+            self._sync_step(step)
+
+        with self._trace_manager.span("move.post"):
+            self.event_bus.publish(MoveUndone(step))
+
+    def redo(self, step: Step) -> None:
+        """Play a previously undone step again."""
+        self._unselect_all()
+
+        with self._trace_manager.span("move.apply"):
+            step = tuple(self._recorded(self.game.apply(record[:5])) for record in step)
+        self._commit(step)
+
+    def _select(self, card_ids: tuple[int, ...] | list[int]) -> None:
+        """Make `card_ids` the selection, repainting only the cards that changed state."""
+        selection = dict.fromkeys(card_ids)
+        for card_id in self.selection:
+            if card_id not in selection:
+                self.cards[card_id].make_unselected()
+        for card_id in selection:
+            if card_id not in self.selection:
+                self.cards[card_id].make_selected()
+        self.selection = selection
+
+    def _unselect_all(self) -> None:
+        if self.selection:
+            self._select(())
+
+    def _unselect_waste(self) -> None:
+        """Drop the selection if it is a waste card, which drawing or rerolling moves."""
+        if self.selection and self.game.locate(next(iter(self.selection)))[0] == WASTE:
+            self._unselect_all()
+
+    def sync_all(self) -> None:
+        """Repaint every zone, after `game` has been replaced by another position."""
+        for pile_index in range(len(self.piles)):
+            self._sync_pile(pile_index)
+        self._sync_stash_waste()
+        self._sync_foundation()
+
+    def _sync_step(self, step: Step) -> None:
+        """Sync every zone the step touched, each of them once."""
+        # Tableau piles are synced one by one; the foundation, and the stash and waste, as a whole
+        zones: dict[tuple[int, int], None] = {}
+        for source, source_index, _, target, target_index, _ in step:
+            for zone, index in ((source, source_index), (target, target_index)):
+                if zone == TABLEAU:
+                    zones[(TABLEAU, index)] = None
+                else:
+                    zones[(WASTE if zone == STASH else zone, 0)] = None
+        for zone, index in zones:
+            self._sync_zone(zone, index)
+
+    def _sync_zone(self, zone: int, index: int) -> None:
+        if zone == TABLEAU:
+            self._sync_pile(index)
+        elif zone == FOUNDATION:
+            self._sync_foundation()
+        else:
+            self._sync_stash_waste()
+
+    def _sync_pile(self, pile_index: int) -> None:
+        self.piles[pile_index].cards = self._get_card_widgets(
+            self.game.tableau[pile_index], self.game.hidden[pile_index]
+        )
+
+    def _sync_stash_waste(self) -> None:
+        stash_waste: StashWaste = self.screen.query_one(StashWaste)
+        stash_waste.stash = self._get_card_widgets(self.game.stash, len(self.game.stash))
+        stash_waste.waste = self._get_card_widgets(self.game.waste, 0)
+
+    def _sync_foundation(self) -> None:
+        foundation: Foundation = self.screen.query_one(Foundation)
+        foundation.cards = [
+            self.cards[top] if top != EMPTY else None for top in self.game.foundation
+        ]
+
+    def _get_card_widgets(self, card_ids: list[int], hidden_count: int) -> list[Card]:
+        """Map engine cards to their widgets, hiding the first `hidden_count` of them."""
+        cards: list[Card] = []
+        for position, card_id in enumerate(card_ids):
+            card = self.cards[card_id]
+            hidden = position < hidden_count
+            if card.hidden != hidden:
+                if hidden:
+                    card.hide()
+                else:
+                    card.unhide()
+            cards.append(card)
+        return cards
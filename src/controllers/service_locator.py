@@ -1,8 +1,54 @@
-from typing import Dict, Any, Type, TypeVar
+from contextvars import ContextVar, copy_context
+from pathlib import Path
+from typing import Dict, Any, Callable, Optional, Type, TypeVar
+from uuid import uuid4
 
 T = TypeVar("T")
 
 
+class ServiceScope:
+    """
+    A set of service registrations that falls back to a parent scope.
+
+    Each game session registers its own services in a scope whose parent is the
+    process-wide shared scope, so sessions find their own game state and
+    controller but share immutable assets such as loaded sounds and the render
+    cache.
+
+    Args:
+        parent: Scope asked for services not registered in this one
+        session_id: Name of the session, which keeps its files apart from those of
+            the other sessions of the process; None for the only session
+    """
+
+    def __init__(self, parent: Optional["ServiceScope"] = None, session_id: Optional[str] = None):
+        self.parent = parent
+        self.session_id = session_id
+        self._services: Dict[Type, Any] = {}
+
+    def register(self, service_type: Type[T], instance: T) -> None:
+        """Register a service instance in this scope."""
+        self._services[service_type] = instance
+
+    def __contains__(self, service_type: Type) -> bool:
+        """Check whether a service is registered in this scope itself, ignoring the parent."""
+        return service_type in self._services
+
+    def get(self, service_type: Type[T]) -> T:
+        """
+        Get a service instance from this scope or, failing that, its parents.
+
+        Raises:
+            KeyError: If the requested service is not registered
+        """
+        scope: Optional[ServiceScope] = self
+        while scope is not None:
+            if service_type in scope._services:
+                return scope._services[service_type]
+            scope = scope.parent
+        raise KeyError(f"Service of type {service_type.__name__} not registered")
+
+
 class ServiceLocator:
     """
     A service locator implementation that provides a central registry for controllers and services.
@@ -11,26 +57,38 @@ class ServiceLocator:
     through the entire widget hierarchy. It follows the service locator pattern, which is a design
     pattern that provides a centralized registry of services.
 
+    Registrations go to the current `ServiceScope`, held in a context variable. Asyncio tasks
+    inherit the context they are created in, so every task of an app sees the scope that was
+    current when the app started, and one process can run many apps side by side, each in a
+    scope of its own made with `create_scope` and entered with `run_in_scope`. Outside any
+    session, the current scope is the shared one.
+
     Usage:
         # Register a service
         ServiceLocator.register(CardInteractController, card_controller_instance)
 
         # Get a service
         controller = ServiceLocator.get(CardInteractController)
+
+        # Run an app in a session of its own
+        scope = ServiceLocator.create_scope()
+        app = ServiceLocator.run_in_scope(scope, Pasjans)
+        task = ServiceLocator.run_in_scope(scope, asyncio.create_task, app.run_async())
     """
 
-    _services: Dict[Type, Any] = {}
+    shared = ServiceScope()
+    _current: ContextVar[ServiceScope] = ContextVar("service_scope", default=shared)
 
     @classmethod
     def register(cls, service_type: Type[T], instance: T) -> None:
         """
-        Register a service instance with the service locator.
+        Register a service instance with the service locator, in the current scope.
 
         Args:
             service_type: The type (class) of the service
             instance: The instance of the service to register
         """
-        cls._services[service_type] = instance
+        cls._current.get().register(service_type, instance)
 
     @classmethod
     def get(cls, service_type: Type[T]) -> T:
@@ -41,11 +99,69 @@ class ServiceLocator:
             service_type: The type (class) of the service to retrieve
 
         Returns:
-            The instance of the requested service
+            The instance of the requested service, from the current scope or the shared one
 
         Raises:
             KeyError: If the requested service is not registered
         """
-        if service_type not in cls._services:
-            raise KeyError(f"Service of type {service_type.__name__} not registered")
-        return cls._services[service_type]
\ No newline at end of file
+        return cls._current.get().get(service_type)
+
+    @classmethod
+    def current_scope(cls) -> ServiceScope:
+        return cls._current.get()
+
+    @classmethod
+    def create_scope(cls, session_id: Optional[str] = None) -> ServiceScope:
+        """
+        Create an empty scope for one of many sessions, falling back to the shared scope.
+
+        Args:
+            session_id: Name of the session, used as a directory name for its files; pass
+                the same one again, e.g. a player name, to resume its saved game. A new
+                unique name when omitted
+
+        Raises:
+            ValueError: If `session_id` is not a plain file name
+        """
+        if session_id is None:
+            session_id = uuid4().hex
+        elif session_id in ("", ".", "..") or Path(session_id).name != session_id:
+            raise ValueError(f"Session id {session_id!r} is not a plain file name")
+        return ServiceScope(cls.shared, session_id)
+
+    @classmethod
+    def session_path(cls, base: Path) -> Path:
+        """
+        Return where the current session keeps the files that live under `base`:
+        `base` itself for the only session of the process, else a directory in it
+        named after the session.
+        """
+        session_id = cls._current.get().session_id
+        return base if session_id is None else base / session_id
+
+    @classmethod
+    def enter_scope(cls, scope: ServiceScope) -> None:
+        """
+        Make `scope` current in the running context, and in every task created from it.
+
+        Args:
+            scope: The scope to make current
+        """
+        cls._current.set(scope)
+
+    @classmethod
+    def run_in_scope(cls, scope: ServiceScope, function: Callable[..., T], *args: Any) -> T:
+        """
+        Call `function` in a copy of the running context where `scope` is current,
+        leaving the caller's scope unchanged.
+
+        Args:
+            scope: The scope to make current
+            function: Called with `args`; tasks it creates keep the scope
+        """
+
+        def call() -> T:
+            cls.enter_scope(scope)
+            return function(*args)
+
+        return copy_context().run(call)
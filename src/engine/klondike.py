@@ -0,0 +1,580 @@
+"""
+Widget-free Klondike engine.
+
+Cards are encoded as integers ``suit * 13 + rank`` where ``suit`` indexes
+`constants.SUITS` and ``rank`` indexes `constants.VALUES`, so a whole deal is
+a handful of small lists of ints. The engine owns the game state and the move
+rules; the Textual widgets only mirror it.
+"""
+from __future__ import annotations
+
+from typing import Iterator
+
+import constants
+from engine import deals
+
+RANK_COUNT = len(constants.VALUES)
+SUIT_COUNT = len(constants.SUITS)
+DECK_SIZE = RANK_COUNT * SUIT_COUNT
+PILE_COUNT = 7
+ACE = 0
+KING = RANK_COUNT - 1
+
+# Marks an empty foundation slot.
+EMPTY = -1
+
+# Zones a card can live in.
+STASH = 0
+WASTE = 1
+FOUNDATION = 2
+TABLEAU = 3
+
+# Moves are ``(source, source_index, count, target, target_index)`` tuples.
+Move = tuple[int, int, int, int, int]
+DRAW: Move = (STASH, 0, 0, WASTE, 0)
+REROLL: Move = (WASTE, 0, 0, STASH, 0)
+
+# Records are moves with the actual card count and whether a tableau card was
+# flipped, which is all `Klondike.revert` needs to undo them.
+Record = tuple[int, int, int, int, int, bool]
+
+# One action of the player, undone and redone as a unit: a single record, or
+# every foundation move of an auto-complete.
+Step = tuple[Record, ...]
+
+_RED = tuple(suit in constants.RED_SUITS for suit in constants.SUITS)
+
+
+def make_card(suit: int, rank: int) -> int:
+    return suit * RANK_COUNT + rank
+
+
+def card_suit(card: int) -> int:
+    return card // RANK_COUNT
+
+
+def card_rank(card: int) -> int:
+    return card % RANK_COUNT
+
+
+def is_red(card: int) -> bool:
+    return _RED[card // RANK_COUNT]
+
+
+def _stacks(card: int, onto: int) -> bool:
+    if onto == EMPTY:
+        return card % RANK_COUNT == KING
+    return (
+        _RED[card // RANK_COUNT] != _RED[onto // RANK_COUNT]
+        and card % RANK_COUNT == onto % RANK_COUNT - 1
+    )
+
+
+def _founds(card: int, top: int) -> bool:
+    if top == EMPTY:
+        return card % RANK_COUNT == ACE
+    return card == top + 1 and card % RANK_COUNT != ACE
+
+
+# Legality tables with a row per card and a column per card or `EMPTY`, so every
+# rule check is one index: ``_STACK[card * _COLUMNS + onto + 1]`` for placing
+# `card` on tableau card `onto` (a King on an empty pile for `EMPTY`), and
+# ``_FOUND[card * _COLUMNS + top + 1]`` for a foundation slot whose top is `top`.
+_COLUMNS = DECK_SIZE + 1
+_STACK = bytes(_stacks(card, onto) for card in range(DECK_SIZE) for onto in range(EMPTY, DECK_SIZE))
+_FOUND = bytes(_founds(card, top) for card in range(DECK_SIZE) for top in range(EMPTY, DECK_SIZE))
+
+
+def can_stack(card: int, onto: int) -> bool:
+    """Check whether `card` may be placed on `onto` in the tableau, or on an empty pile if `onto` is `EMPTY`."""
+    return _STACK[card * _COLUMNS + onto + 1] == 1
+
+
+# The cards each card accepts on top of it in the tableau.
+_ACCEPTS = tuple(
+    tuple(card for card in range(DECK_SIZE) if can_stack(card, onto))
+    for onto in range(DECK_SIZE)
+)
+
+
+class Klondike:
+    """
+    The complete state of one Klondike game and the rules for changing it.
+
+    Tableau piles keep their face-down cards at the bottom, so each pile is a
+    plain list of cards plus a count of how many of them are still hidden. The
+    stash is always face-down and the waste always face-up. The foundation is
+    stored as the top card of each of the four slots.
+
+    Every move also keeps `locations` up to date, so finding a card never needs
+    a search.
+
+    :ivar tableau: Seven lists of cards, bottom card first.
+    :ivar hidden: Number of face-down cards at the bottom of each tableau pile.
+    :ivar stash: Face-down draw pile, top card last.
+    :ivar waste: Face-up discard pile, top card last.
+    :ivar foundation: Top card of each foundation slot or `EMPTY`.
+    :ivar draw_count: Cards turned over per draw (1 in easy mode, 3 in hard).
+    :ivar seed: Deal number the deal and every reroll shuffle are derived from.
+    :ivar rerolls: Number of times the waste has been turned back into the stash.
+    :ivar locations: ``(zone, pile index, position)`` of every card, indexed by
+        card. Foundation cards use their rank as position.
+    """
+
+    __slots__ = (
+        "tableau",
+        "hidden",
+        "stash",
+        "waste",
+        "foundation",
+        "draw_count",
+        "seed",
+        "rerolls",
+        "locations",
+    )
+
+    def __init__(
+        self,
+        tableau: list[list[int]],
+        hidden: list[int],
+        stash: list[int],
+        waste: list[int],
+        foundation: list[int],
+        draw_count: int = 1,
+        seed: int = 0,
+        rerolls: int = 0,
+        locations: list[tuple[int, int, int]] | None = None,
+    ):
+        self.tableau = tableau
+        self.hidden = hidden
+        self.stash = stash
+        self.waste = waste
+        self.foundation = foundation
+        self.draw_count = draw_count
+        self.seed = seed
+        self.rerolls = rerolls
+        self.locations = locations if locations is not None else self._index_locations()
+
+    def _index_locations(self) -> list[tuple[int, int, int]]:
+        locations: list[tuple[int, int, int]] = [(FOUNDATION, 0, 0)] * DECK_SIZE
+        for pile_index, pile in enumerate(self.tableau):
+            for position, card in enumerate(pile):
+                locations[card] = (TABLEAU, pile_index, position)
+        for position, card in enumerate(self.stash):
+            locations[card] = (STASH, 0, position)
+        for position, card in enumerate(self.waste):
+            locations[card] = (WASTE, 0, position)
+        for slot, top in enumerate(self.foundation):
+            if top != EMPTY:
+                for card in range(top - top % RANK_COUNT, top + 1):
+                    locations[card] = (FOUNDATION, slot, card % RANK_COUNT)
+        return locations
+
+    @classmethod
+    def deal(cls, draw_count: int = 1, seed: int | None = None) -> Klondike:
+        """
+        Shuffle a fresh deck and deal it the way `GameLayout` lays it out.
+
+        :param draw_count: Cards turned over per draw.
+        :param seed: Deal number for `deals.deal_order`, a random one is picked when omitted.
+        :return: The dealt game.
+        """
+        if seed is None:
+            seed = deals.random_deal_number()
+
+        deck = list(deals.deal_order(seed))
+
+        tableau: list[list[int]] = []
+        for pile_index in range(PILE_COUNT):
+            tableau.append([deck.pop() for _ in range(pile_index + 1)])
+
+        return cls(
+            tableau,
+            list(range(PILE_COUNT)),
+            deck,
+            [],
+            [EMPTY] * SUIT_COUNT,
+            draw_count,
+            seed,
+        )
+
+    def copy(self) -> Klondike:
+        return Klondike(
+            [pile.copy() for pile in self.tableau],
+            self.hidden.copy(),
+            self.stash.copy(),
+            self.waste.copy(),
+            self.foundation.copy(),
+            self.draw_count,
+            self.seed,
+            self.rerolls,
+            self.locations.copy(),
+        )
+
+    def locate(self, card: int) -> tuple[int, int, int]:
+        """
+        Find where a card currently is.
+
+        :param card: The card to look for.
+        :return: A ``(zone, pile index, position)`` tuple.
+        """
+        return self.locations[card]
+
+    def is_top(self, card: int) -> bool:
+        """Check whether `card` is the top card of whatever pile or slot it is in."""
+        zone, index, position = self.locations[card]
+        if zone == TABLEAU:
+            return position == len(self.tableau[index]) - 1
+        if zone == FOUNDATION:
+            return self.foundation[index] == card
+        cards = self.stash if zone == STASH else self.waste
+        return position == len(cards) - 1
+
+    def is_face_up(self, pile_index: int, position: int) -> bool:
+        return position >= self.hidden[pile_index]
+
+    def is_won(self) -> bool:
+        return all(top != EMPTY and top % RANK_COUNT == KING for top in self.foundation)
+
+    def can_auto_complete(self) -> bool:
+        """Check whether the game is mechanically won: stash and waste empty, every card face-up."""
+        return not self.stash and not self.waste and not any(self.hidden)
+
+    def finish(self) -> Iterator[Record]:
+        """
+        Play every card to the foundation once `can_auto_complete` holds.
+
+        Each pass plays the top card of every pile that fits, so the piles, all
+        descending runs by then, are emptied in at most one pass per rank.
+
+        :return: The records of the moves made, in order, each yielded as soon as
+            its move is made.
+        :raises ValueError: If the game cannot be auto-completed yet.
+        """
+        if not self.can_auto_complete():
+            raise ValueError("The game cannot be auto-completed yet")
+        return self._play_to_foundation()
+
+    def _play_to_foundation(self) -> Iterator[Record]:
+        while not self.is_won():
+            for pile_index, pile in enumerate(self.tableau):
+                if pile:
+                    slot = self.foundation_slot(pile[-1])
+                    if slot is not None:
+                        move = (TABLEAU, pile_index, 1, FOUNDATION, slot)
+                        yield (*move, self.move(*move))
+
+    def foundation_slot(self, card: int) -> int | None:
+        """
+        Return the foundation slot `card` can be played to, preferring its suit's slot.
+
+        A suit's slot is wherever its Ace is, so apart from Aces this is a single
+        lookup in `locations` instead of a search over the slots.
+        """
+        rank = card % RANK_COUNT
+        if rank != ACE:
+            zone, slot, _ = self.locations[card - rank]
+            if zone == FOUNDATION and self.foundation[slot] == card - 1:
+                return slot
+            return None
+        for slot, top in enumerate(self.foundation):
+            if top == EMPTY:
+                return slot
+        return None
+
+    def is_safe_to_found(self, card: int) -> bool:
+        """
+        Check whether playing `card` to the foundation can never block a win.
+
+        A card is only useful in the tableau as a home for the opposite-colour cards
+        one rank lower; once those are all on the foundation it is safe to play.
+        """
+        rank = card % RANK_COUNT
+        if rank <= ACE + 1:
+            return True
+        red = _RED[card // RANK_COUNT]
+        opposite_count = 0
+        for top in self.foundation:
+            if top != EMPTY and _RED[top // RANK_COUNT] != red and top % RANK_COUNT >= rank - 1:
+                opposite_count += 1
+        return opposite_count == 2
+
+    def play_safe_moves(self) -> Iterator[Record]:
+        """
+        Play every face-up tableau top and waste top that `is_safe_to_found`, until none is left.
+
+        :return: The records of the moves made, in order, each yielded as soon as
+            its move is made.
+        """
+        progress = True
+        while progress:
+            progress = False
+            for pile_index, pile in enumerate(self.tableau):
+                if pile and len(pile) > self.hidden[pile_index]:
+                    slot = self.foundation_slot(pile[-1])
+                    if slot is not None and self.is_safe_to_found(pile[-1]):
+                        move = (TABLEAU, pile_index, 1, FOUNDATION, slot)
+                        yield (*move, self.move(*move))
+                        progress = True
+            if self.waste:
+                slot = self.foundation_slot(self.waste[-1])
+                if slot is not None and self.is_safe_to_found(self.waste[-1]):
+                    move = (WASTE, 0, 1, FOUNDATION, slot)
+                    yield (*move, self.move(*move))
+                    progress = True
+
+    def best_move(self, source: int, source_index: int, count: int) -> Move | None:
+        """
+        Pick the best destination for the cards a move would pick up.
+
+        A single card goes to the foundation if it can; otherwise the cards go on
+        the first tableau pile that accepts them, and only onto an empty pile when
+        no other pile does and the move would not just shift a King from one
+        empty pile to another. Each pile costs one table lookup.
+
+        :return: The move, or None if the cards cannot go anywhere.
+        """
+        card = self.moving_card(source, source_index, count)
+        if card is None:
+            return None
+        if count == 1:
+            slot = self.foundation_slot(card)
+            if slot is not None:
+                return source, source_index, 1, FOUNDATION, slot
+
+        row = card * _COLUMNS + 1
+        empty_pile = None
+        for target_index, pile in enumerate(self.tableau):
+            if source == TABLEAU and target_index == source_index:
+                continue
+            if pile:
+                if _STACK[row + pile[-1]]:
+                    return source, source_index, count, TABLEAU, target_index
+            elif empty_pile is None and _STACK[row + EMPTY]:
+                empty_pile = target_index
+        if empty_pile is None or (source == TABLEAU and count == len(self.tableau[source_index])):
+            return None
+        return source, source_index, count, TABLEAU, empty_pile
+
+    def targets_for(self, card: int) -> list[tuple[int, int]]:
+        """List the ``(zone, index)`` places a single face-up `card` could be moved to."""
+        targets: list[tuple[int, int]] = []
+        slot = self.foundation_slot(card)
+        if slot is not None:
+            targets.append((FOUNDATION, slot))
+        row = card * _COLUMNS + 1
+        for target_index, pile in enumerate(self.tableau):
+            if _STACK[row + (pile[-1] if pile else EMPTY)]:
+                targets.append((TABLEAU, target_index))
+        return targets
+
+    def legal_moves(self) -> list[Move]:
+        """
+        List every move the rules allow in this position.
+
+        Foundation moves use `foundation_slot`, so an Ace is offered for the first
+        empty slot only. Drawing and rerolling are included as `DRAW` and `REROLL`.
+        """
+        moves: list[Move] = []
+        tableau = self.tableau
+
+        # Index the piles by the cards they accept so each source is a single lookup
+        targets: dict[int, list[int]] = {}
+        empty_piles: list[int] = []
+        for target_index, pile in enumerate(tableau):
+            if pile:
+                for card in _ACCEPTS[pile[-1]]:
+                    targets.setdefault(card, []).append(target_index)
+            else:
+                empty_piles.append(target_index)
+
+        sources: list[tuple[int, int, int, int]] = []
+        for pile_index, pile in enumerate(tableau):
+            size = len(pile)
+            for position in range(self.hidden[pile_index], size):
+                sources.append((TABLEAU, pile_index, size - position, pile[position]))
+        if self.waste:
+            sources.append((WASTE, 0, 1, self.waste[-1]))
+
+        for source, source_index, count, card in sources:
+            if count == 1:
+                slot = self.foundation_slot(card)
+                if slot is not None:
+                    moves.append((source, source_index, 1, FOUNDATION, slot))
+            for target_index in targets.get(card, ()):
+                if source != TABLEAU or source_index != target_index:
+                    moves.append((source, source_index, count, TABLEAU, target_index))
+            if empty_piles and _STACK[card * _COLUMNS]:
+                for target_index in empty_piles:
+                    moves.append((source, source_index, count, TABLEAU, target_index))
+
+        if self.stash:
+            moves.append(DRAW)
+        elif self.waste:
+            moves.append(REROLL)
+        return moves
+
+    def apply(self, move: Move) -> Record:
+        """
+        Apply any move, including `DRAW` and `REROLL`.
+
+        :return: A record of the move that `revert` can undo.
+        """
+        source, source_index, count, target, target_index = move
+        if source == STASH:
+            return STASH, 0, self.draw(), WASTE, 0, False
+        if target == STASH:
+            count = len(self.waste)
+            self.reroll()
+            return WASTE, 0, count, STASH, 0, False
+        flipped = self.move(source, source_index, count, target, target_index)
+        return source, source_index, count, target, target_index, flipped
+
+    def revert(self, record: Record) -> None:
+        """
+        Undo the move `record` was returned for; it must be the most recent one applied.
+
+        A reroll is undone by regenerating its shuffle from the seed and inverting it,
+        so no card order has to be stored.
+        """
+        source, source_index, count, target, target_index, flipped = record
+
+        locations = self.locations
+
+        if source == STASH:
+            stash = self.stash
+            waste = self.waste
+            for _ in range(count):
+                card = waste.pop()
+                locations[card] = (STASH, 0, len(stash))
+                stash.append(card)
+            return
+
+        if target == STASH:
+            self.rerolls -= 1
+            order = deals.reroll_order(self.seed, self.rerolls, count)
+            waste = [0] * count
+            for card, position in zip(self.stash, order):
+                waste[position] = card
+                locations[card] = (WASTE, 0, position)
+            self.waste = waste
+            self.stash = []
+            return
+
+        if flipped:
+            self.hidden[source_index] += 1
+
+        if target == TABLEAU:
+            pile = self.tableau[target_index]
+            cards = pile[-count:]
+            del pile[-count:]
+        else:
+            card = self.foundation[target_index]
+            cards = [card]
+            self.foundation[target_index] = EMPTY if card % RANK_COUNT == ACE else card - 1
+
+        self._place(source, source_index, cards)
+
+    def _place(self, target: int, target_index: int, cards: list[int]) -> None:
+        """Put `cards` on a tableau pile or the waste and record where they went."""
+        locations = self.locations
+        pile = self.tableau[target_index] if target == TABLEAU else self.waste
+        for card in cards:
+            locations[card] = (target, target_index, len(pile))
+            pile.append(card)
+
+    def draw(self) -> int:
+        """
+        Turn over up to `draw_count` cards from the stash onto the waste.
+
+        :return: The number of cards moved.
+        """
+        stash = self.stash
+        waste = self.waste
+        locations = self.locations
+        count = min(self.draw_count, len(stash))
+        for _ in range(count):
+            card = stash.pop()
+            locations[card] = (WASTE, 0, len(waste))
+            waste.append(card)
+        return count
+
+    def reroll(self) -> None:
+        """Shuffle the waste back into the stash once the stash runs out."""
+        order = deals.reroll_order(self.seed, self.rerolls, len(self.waste))
+        waste = [self.waste[position] for position in order]
+        locations = self.locations
+        for position, card in enumerate(waste):
+            locations[card] = (STASH, 0, position)
+        self.stash = waste
+        self.waste = []
+        self.rerolls += 1
+
+    def moving_card(self, source: int, source_index: int, count: int) -> int | None:
+        """Return the bottom card of the run a move would pick up, if there is one."""
+        if source == TABLEAU:
+            pile = self.tableau[source_index]
+            if count < 1 or len(pile) - count < self.hidden[source_index]:
+                return None
+            return pile[-count]
+        if source == WASTE and count == 1 and self.waste:
+            return self.waste[-1]
+        return None
+
+    def can_move(
+        self, source: int, source_index: int, count: int, target: int, target_index: int
+    ) -> bool:
+        """
+        Check a move against the Klondike rules.
+
+        Cards move from the tableau or the top of the waste onto a tableau pile
+        (descending, alternating colours, only a King on an empty pile) or onto
+        a foundation slot (one card at a time, same suit ascending from Ace).
+
+        :param source: `TABLEAU` or `WASTE`.
+        :param source_index: Tableau pile the cards come from.
+        :param count: Number of cards picked up from the top of the source.
+        :param target: `TABLEAU` or `FOUNDATION`.
+        :param target_index: Tableau pile or foundation slot receiving the cards.
+        """
+        card = self.moving_card(source, source_index, count)
+        if card is None:
+            return False
+
+        if target == TABLEAU:
+            if source == TABLEAU and source_index == target_index:
+                return False
+            pile = self.tableau[target_index]
+            return _STACK[card * _COLUMNS + (pile[-1] if pile else EMPTY) + 1] == 1
+
+        if target == FOUNDATION:
+            return count == 1 and _FOUND[card * _COLUMNS + self.foundation[target_index] + 1] == 1
+
+        return False
+
+    def move(
+        self, source: int, source_index: int, count: int, target: int, target_index: int
+    ) -> bool:
+        """
+        Apply a move that `can_move` accepted.
+
+        :return: True if the move uncovered a face-down tableau card.
+        """
+        if source == TABLEAU:
+            pile = self.tableau[source_index]
+            cards = pile[-count:]
+            del pile[-count:]
+        else:
+            cards = [self.waste.pop()]
+
+        if target == TABLEAU:
+            self._place(TABLEAU, target_index, cards)
+        else:
+            card = cards[0]
+            self.foundation[target_index] = card
+            self.locations[card] = (FOUNDATION, target_index, card % RANK_COUNT)
+
+        if source == TABLEAU and pile and self.hidden[source_index] == len(pile):
+            self.hidden[source_index] -= 1
+            return True
+        return False
@@ -0,0 +1,239 @@
+"""
+Compact binary replay log.
+
+A replay is the deal number plus every move and undo in the order they were
+made, so a game can be played back exactly. Each entry is the engine `Record`
+packed into two bytes followed by the game time as a varint, three or four
+bytes in total. After every ``interval`` entries the log also holds a
+keyframe, the packed position at that point (under 80 bytes), so the
+position after any entry is found by restoring the nearest keyframe before it
+and applying at most ``interval - 1`` entries, never by replaying the game
+from the start.
+
+File layout::
+
+    header    b"PJRP", version, draw count, deal number, keyframe interval
+    entries   record (2 bytes), varint of game milliseconds * 2 + undone
+    keyframe  length (1 byte) and packed position, after every interval-th entry
+
+The log is written as the game goes, so a file cut short by a crash still
+loads up to its last complete entry.
+"""
+from __future__ import annotations
+
+import struct
+from typing import BinaryIO, Callable
+
+from engine.klondike import PILE_COUNT, Klondike, Record
+
+MAGIC = b"PJRP"
+VERSION = 1
+
+_HEADER = struct.Struct("<4sBBQH")
+_RECORD = struct.Struct("<H")
+
+# ``(record, undone, milliseconds of game time when it was made)``
+Entry = tuple[Record, bool, int]
+
+
+def pack_record(record: Record) -> bytes:
+    """
+    Pack a record into 16 bits: zones take 2 bits, pile indexes 3, the card count 5
+    (a reroll turns back at most 24 cards) and the flipped flag 1.
+    """
+    source, source_index, count, target, target_index, flipped = record
+    return _RECORD.pack(
+        source
+        | source_index << 2
+        | count << 5
+        | target << 10
+        | target_index << 12
+        | flipped << 15
+    )
+
+
+def unpack_record(code: int) -> Record:
+    return (
+        code & 0b11,
+        code >> 2 & 0b111,
+        code >> 5 & 0b11111,
+        code >> 10 & 0b11,
+        code >> 12 & 0b111,
+        bool(code >> 15),
+    )
+
+
+def _pack_varint(value: int) -> bytes:
+    data = bytearray()
+    while value > 0x7F:
+        data.append(value & 0x7F | 0x80)
+        value >>= 7
+    data.append(value)
+    return bytes(data)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Return the varint at `offset` and the offset after it; raises IndexError when cut short."""
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def pack_state(game: Klondike) -> bytes:
+    """Pack everything about a position except the deal number and draw count."""
+    data = bytearray(top + 1 for top in game.foundation)
+    data += bytes(game.hidden)
+    data += _pack_varint(game.rerolls)
+    for cards in (game.stash, game.waste, *game.tableau):
+        data.append(len(cards))
+        data += bytes(cards)
+    return bytes(data)
+
+
+def unpack_state(data: bytes, draw_count: int, seed: int) -> Klondike:
+    """Rebuild the position `pack_state` packed."""
+    foundation = [top - 1 for top in data[:4]]
+    hidden = list(data[4 : 4 + PILE_COUNT])
+    rerolls, offset = _read_varint(data, 4 + PILE_COUNT)
+    piles: list[list[int]] = []
+    for _ in range(2 + PILE_COUNT):
+        size = data[offset]
+        piles.append(list(data[offset + 1 : offset + 1 + size]))
+        offset += 1 + size
+    stash, waste, *tableau = piles
+    return Klondike(tableau, hidden, stash, waste, foundation, draw_count, seed, rerolls)
+
+
+class Replay:
+    """
+    A recorded game loaded from a replay log.
+
+    :ivar seed: Deal number of the game.
+    :ivar draw_count: Cards turned over per draw.
+    :ivar interval: Number of entries between keyframes.
+    :ivar entries: Every move and undo in order.
+    :ivar keyframes: Packed position after every `interval` entries; the first
+        one is the deal itself.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        draw_count: int,
+        interval: int,
+        entries: list[Entry],
+        keyframes: list[bytes],
+    ) -> None:
+        self.seed = seed
+        self.draw_count = draw_count
+        self.interval = interval
+        self.entries = entries
+        self.keyframes = keyframes
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    @classmethod
+    def load(cls, path: str) -> Replay:
+        with open(path, "rb") as file:
+            return cls.from_bytes(file.read())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Replay:
+        """
+        Parse a replay log, ignoring an incomplete last entry.
+
+        :raises ValueError: If the data is not a replay log this version can read.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("Not a replay file")
+        magic, version, draw_count, seed, interval = _HEADER.unpack_from(data)
+        if magic != MAGIC or interval < 1:
+            raise ValueError("Not a replay file")
+        if version != VERSION:
+            raise ValueError(f"Unsupported replay version {version}")
+
+        entries: list[Entry] = []
+        keyframes = [pack_state(Klondike.deal(draw_count, seed))]
+        offset = _HEADER.size
+        try:
+            while offset < len(data):
+                (code,) = _RECORD.unpack_from(data, offset)
+                value, next_offset = _read_varint(data, offset + _RECORD.size)
+                if (len(entries) + 1) % interval == 0:
+                    size = data[next_offset]
+                    keyframe = data[next_offset + 1 : next_offset + 1 + size]
+                    if len(keyframe) < size:
+                        break
+                    keyframes.append(keyframe)
+                    next_offset += 1 + size
+                entries.append((unpack_record(code), bool(value & 1), value >> 1))
+                offset = next_offset
+        except (struct.error, IndexError):
+            # The game was still being written when the file was copied or the app stopped
+            pass
+        return cls(seed, draw_count, interval, entries, keyframes)
+
+    def state_at(self, position: int) -> Klondike:
+        """
+        Return the position after the first `position` entries.
+
+        Starts from the nearest keyframe, so at most ``interval - 1`` entries are applied.
+        """
+        if not 0 <= position <= len(self.entries):
+            raise ValueError(f"Move must be between 0 and {len(self.entries)}")
+        keyframe = min(position // self.interval, len(self.keyframes) - 1)
+        game = unpack_state(self.keyframes[keyframe], self.draw_count, self.seed)
+        for record, undone, _ in self.entries[keyframe * self.interval : position]:
+            if undone:
+                game.revert(record)
+            else:
+                game.apply(record[:5])
+        return game
+
+
+class ReplayWriter:
+    """
+    Writes the replay log of a game while it is played.
+
+    Entries are buffered and flushed with every keyframe and on `close`.
+
+    :param file: Binary file to write to; it is closed by `close`.
+    :param game: The game being recorded, read for keyframes.
+    :param time: Returns the game time in seconds.
+    :param interval: Number of entries between keyframes.
+    """
+
+    def __init__(
+        self, file: BinaryIO, game: Klondike, time: Callable[[], float], interval: int
+    ) -> None:
+        self._file = file
+        self._game = game
+        self._time = time
+        self._interval = interval
+        self._count = 0
+        file.write(_HEADER.pack(MAGIC, VERSION, game.draw_count, game.seed, interval))
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def record(self, record: Record, undone: bool = False) -> None:
+        """Append a move the game just applied, or one it just reverted when `undone`."""
+        if self._file.closed:
+            return
+        milliseconds = int(self._time() * 1000)
+        self._file.write(pack_record(record) + _pack_varint(milliseconds << 1 | undone))
+        self._count += 1
+        if self._count % self._interval == 0:
+            state = pack_state(self._game)
+            self._file.write(bytes([len(state)]) + state)
+            self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
@@ -0,0 +1,224 @@
+"""
+Klondike policies and a runner that plays whole games with them.
+
+A policy picks one move out of the legal moves it is offered, or None to give
+up. Policies see the whole position, like a player would, except that they
+never look at face-down cards. `play` deals nothing itself: it plays a dealt
+game to the end and can take moves back at dead ends, the way a player spends
+the undo budget of `constants.MAX_UNDO`.
+"""
+from __future__ import annotations
+
+from random import Random
+from typing import Callable, Optional
+
+import constants
+from engine.klondike import (
+    ACE,
+    FOUNDATION,
+    KING,
+    RANK_COUNT,
+    REROLL,
+    STASH,
+    TABLEAU,
+    WASTE,
+    Klondike,
+    Move,
+    Record,
+)
+
+Policy = Callable[[Klondike, list[Move], Random], Optional[Move]]
+
+
+def is_productive(game: Klondike, move: Move) -> bool:
+    """
+    Check whether a move can bring the game forward.
+
+    Moving a run between tableau piles only counts when it uncovers a card,
+    empties a pile that is not the bottom of a King run, or frees a card for
+    the foundation; any other shift could be undone by the next one.
+    """
+    source, source_index, count, target, target_index = move
+    if source != TABLEAU or target != TABLEAU:
+        return True
+    pile = game.tableau[source_index]
+    remaining = len(pile) - count
+    if remaining == 0:
+        return bool(game.tableau[target_index])
+    if remaining == game.hidden[source_index]:
+        return True
+    return game.foundation_slot(pile[remaining - 1]) is not None
+
+
+def random_policy(game: Klondike, moves: list[Move], rng: Random) -> Move | None:
+    """Play any legal move."""
+    return rng.choice(moves) if moves else None
+
+
+def greedy_policy(game: Klondike, moves: list[Move], rng: Random) -> Move | None:
+    """
+    Play to the foundation whenever possible, then uncover cards, then play from
+    the waste, and only draw when nothing else brings the game forward.
+    """
+    best: Move | None = None
+    best_tier = 5
+    for move in moves:
+        source, source_index, count, target, _ = move
+        if target == FOUNDATION:
+            tier = 0
+        elif source == WASTE:
+            tier = 2
+        elif source == TABLEAU:
+            if not is_productive(game, move):
+                continue
+            hidden = game.hidden[source_index]
+            tier = 1 if hidden and len(game.tableau[source_index]) - count == hidden else 3
+        else:
+            tier = 4
+        if tier < best_tier:
+            best, best_tier = move, tier
+    return best
+
+
+def heuristic_policy(game: Klondike, moves: list[Move], rng: Random) -> Move | None:
+    """
+    Score every productive move and play the best, breaking ties at random.
+
+    Uncovering cards in piles with many face-down cards comes first, low cards
+    go to the foundation straight away while higher ones wait until nothing
+    better is left, and a pile is only emptied when a King is free to fill it.
+    """
+    kings_waiting = any(
+        game.tableau[pile_index][position] % RANK_COUNT == KING
+        for pile_index, hidden in enumerate(game.hidden)
+        if hidden
+        for position in range(hidden, len(game.tableau[pile_index]))
+    ) or (game.waste and game.waste[-1] % RANK_COUNT == KING)
+
+    best: list[Move] = []
+    best_score = 0
+    for move in moves:
+        source, source_index, count, target, _ = move
+        if source == STASH:
+            score = 2
+        elif target == STASH:
+            score = 1
+        elif target == FOUNDATION:
+            card = game.moving_card(source, source_index, 1)
+            score = 90 if card % RANK_COUNT <= ACE + 1 else 40
+        elif source == WASTE:
+            score = 30
+        elif not is_productive(game, move):
+            continue
+        else:
+            remaining = len(game.tableau[source_index]) - count
+            hidden = game.hidden[source_index]
+            if remaining and remaining == hidden:
+                score = 50 + 5 * hidden
+            elif remaining == 0:
+                score = 35 if kings_waiting else 5
+            else:
+                score = 25
+        if score > best_score:
+            best, best_score = [move], score
+        elif score == best_score:
+            best.append(move)
+    return rng.choice(best) if best else None
+
+
+POLICIES: dict[str, Policy] = {
+    "random": random_policy,
+    "greedy": greedy_policy,
+    "heuristic": heuristic_policy,
+}
+
+
+class GameResult:
+    """
+    Outcome of one simulated game.
+
+    :ivar won: True if every card reached the foundation.
+    :ivar moves: Moves the game took, the way the game header counts them.
+    :ivar undos: Moves taken back at dead ends.
+    """
+
+    __slots__ = ("won", "moves", "undos")
+
+    def __init__(self, won: bool, moves: int, undos: int):
+        self.won = won
+        self.moves = moves
+        self.undos = undos
+
+
+def play(
+    game: Klondike,
+    policy: Policy,
+    rng: Random,
+    undo: int = 0,
+    max_moves: int = constants.SIMULATION_MAX_MOVES,
+    max_rerolls: int = constants.SIMULATION_MAX_REROLLS,
+) -> GameResult:
+    """
+    Play `game` with `policy` until it is won, stuck or too long.
+
+    Once every card is face-up and the stash and waste are empty the rest of the
+    game is played to the foundation mechanically. At a dead end, up to `undo`
+    moves are taken back and the move that led there is not offered again in
+    that position.
+
+    :param game: The dealt game; it is played on directly.
+    :param policy: Picks the moves.
+    :param rng: Random source passed to the policy.
+    :param undo: Number of moves that may be taken back.
+    :param max_moves: Moves after which the game is abandoned.
+    :param max_rerolls: Rerolls after which the stash is not turned over again.
+    """
+    # Every move made with the moves that were already rejected in the position before it
+    history: list[tuple[Move, Record, set[Move]]] = []
+    excluded: set[Move] = set()
+    moves = undos = 0
+
+    while moves < max_moves:
+        if game.can_auto_complete():
+            cards_left = sum(len(pile) for pile in game.tableau)
+            return GameResult(True, moves + cards_left, undos)
+
+        candidates = game.legal_moves()
+        if excluded or game.rerolls >= max_rerolls:
+            candidates = [
+                move for move in candidates
+                if move not in excluded and (move != REROLL or game.rerolls < max_rerolls)
+            ]
+        move = policy(game, candidates, rng)
+
+        if move is None:
+            if undos == undo or not history:
+                break
+            move, record, excluded = history.pop()
+            game.revert(record)
+            excluded.add(move)
+            moves -= 1
+            undos += 1
+            continue
+
+        history.append((move, game.apply(move), excluded))
+        excluded = set()
+        moves += 1
+
+    return GameResult(game.is_won(), moves, undos)
+
+
+def play_seed(
+    seed: int, draw_count: int, policy: str, undo: int = 0, **limits: int
+) -> GameResult:
+    """
+    Deal the game for `seed` and play it, with a random source seeded from the deal
+    so the result does not depend on which process plays it.
+
+    :param seed: Deal number as used by `Klondike.deal`.
+    :param draw_count: 1 for easy mode, 3 for hard mode.
+    :param policy: Name of a policy in `POLICIES`.
+    :param undo: Number of moves that may be taken back.
+    :param limits: ``max_moves`` and ``max_rerolls`` for `play`.
+    """
+    return play(Klondike.deal(draw_count, seed), POLICIES[policy], Random(seed), undo, **limits)
@@ -0,0 +1,285 @@
+"""
+Depth-first Klondike solver.
+
+The solver plays on `Klondike` copies with full knowledge of the face-down
+cards, so it answers "can this deal be won?" rather than "can a player win it
+without peeking?". Rerolls are deterministic because the engine derives every
+reroll shuffle from the game seed, which keeps the search reproducible.
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+import constants
+from engine.klondike import (
+    DRAW,
+    FOUNDATION,
+    RANK_COUNT,
+    REROLL,
+    SUIT_COUNT,
+    TABLEAU,
+    WASTE,
+    Klondike,
+    Move,
+)
+
+
+
+class SolveResult:
+    """
+    Outcome of a solver run.
+
+    :ivar solved: True if a winning line was found.
+    :ivar exhausted: True if every move the solver considers was explored without
+        a win. The search prunes moves, so this is no proof that the deal cannot
+        be won.
+    :ivar moves: The winning line, including the automatic foundation moves.
+    :ivar nodes: Number of positions expanded.
+    :ivar seconds: Wall time spent searching.
+    :ivar peak_memory: Estimated peak size in bytes of the transposition table
+        and search stack.
+    """
+
+    def __init__(
+        self,
+        solved: bool,
+        exhausted: bool,
+        moves: list[Move],
+        nodes: int,
+        seconds: float,
+        peak_memory: int,
+    ):
+        self.solved = solved
+        self.exhausted = exhausted
+        self.moves = moves
+        self.nodes = nodes
+        self.seconds = seconds
+        self.peak_memory = peak_memory
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.seconds if self.seconds > 0 else float(self.nodes)
+
+    def __str__(self) -> str:
+        if self.solved:
+            verdict = f"winnable in {len(self.moves)} moves"
+        elif self.exhausted:
+            verdict = "not found (pruned search)"
+        else:
+            verdict = "unknown (budget exhausted)"
+        return (
+            f"{verdict}; {self.nodes} nodes in {self.seconds:.3f}s "
+            f"({self.nodes_per_second:,.0f} nodes/s, {self.peak_memory / 1024:,.0f} KiB)"
+        )
+
+
+class Solver:
+    """
+    Searches for a winning line with a transposition table and safe auto-moves.
+
+    Positions are packed into a canonical key (tableau piles sorted, foundation
+    stored per suit) so equivalent positions reached in a different order are
+    only expanded once. Cards that can never be needed in
+    the tableau again are played to the foundation without branching.
+
+    :param max_nodes: Stop after expanding this many positions.
+    :param max_seconds: Stop after this much wall time.
+    :param max_rerolls: Do not turn the waste over more often than this.
+    """
+
+    def __init__(
+        self,
+        max_nodes: int = constants.SOLVER_MAX_NODES,
+        max_seconds: float = constants.SOLVER_MAX_SECONDS,
+        max_rerolls: int = constants.SOLVER_MAX_REROLLS,
+    ):
+        self.max_nodes = max_nodes
+        self.max_seconds = max_seconds
+        self.max_rerolls = max_rerolls
+
+    def solve(self, game: Klondike) -> SolveResult:
+        """
+        Search for a winning line from `game`, which is left untouched.
+
+        :param game: The position to solve.
+        :return: The search outcome and statistics.
+        """
+        started = time.perf_counter()
+        deadline = started + self.max_seconds
+
+        root = game.copy()
+        root_moves = _play_safe_moves(root)
+        root_key = _state_key(root)
+        seen: set[bytes] = {root_key}
+        key_memory = sys.getsizeof(root_key)
+
+        # Each stack entry is a position, its untried moves and the moves that led to it.
+        stack: list[tuple[Klondike, list[list[Move]], list[Move]]] = []
+        if not _is_solved(root):
+            stack.append((root, self._ordered_moves(root), root_moves))
+        nodes = 0
+        max_depth = 1
+        solution: list[Move] | None = None if stack else root_moves + _finish(root)
+
+        while stack and solution is None:
+            if nodes >= self.max_nodes or (
+                nodes & 1023 == 0 and time.perf_counter() > deadline
+            ):
+                break
+
+            state, moves, _ = stack[-1]
+            if not moves:
+                stack.pop()
+                continue
+
+            child_moves = moves.pop()
+            child = state.copy()
+            for move in child_moves:
+                child.apply(move)
+            child_moves.extend(_play_safe_moves(child))
+            nodes += 1
+
+            if _is_solved(child):
+                solution = [step for _, _, steps in stack for step in steps]
+                solution.extend(child_moves)
+                solution.extend(_finish(child))
+                break
+
+            key = _state_key(child)
+            if key in seen:
+                continue
+            seen.add(key)
+            key_memory += sys.getsizeof(key)
+
+            stack.append((child, self._ordered_moves(child), child_moves))
+            max_depth = max(max_depth, len(stack))
+
+        seconds = time.perf_counter() - started
+        peak_memory = (
+            sys.getsizeof(seen)
+            + key_memory
+            + max_depth * _state_size(root)
+        )
+        return SolveResult(
+            solution is not None,
+            solution is None and not stack,
+            solution or [],
+            nodes,
+            seconds,
+            peak_memory,
+        )
+
+    def _ordered_moves(self, game: Klondike) -> list[list[Move]]:
+        """
+        Return the move sequences worth trying, most promising last so `list.pop` takes it first.
+
+        Drawing is folded into the play it enables: each sequence is either a single
+        move or a run of draws followed by playing the new waste top (or by a reroll),
+        since draws commute with every tableau move. Moves that cannot make progress
+        are pruned: shifting a run that does not uncover a card, empty a pile or free
+        a card for the foundation, and moving a King that already sits at the bottom
+        of a pile.
+        """
+        foundation_moves: list[list[Move]] = []
+        uncovering_moves: list[list[Move]] = []
+        waste_moves: list[list[Move]] = []
+        other_moves: list[list[Move]] = []
+
+        for move in game.legal_moves():
+            source, source_index, count, target, target_index = move
+            if target == FOUNDATION:
+                foundation_moves.append([move])
+            elif source == WASTE:
+                waste_moves.append([move])
+            elif source == TABLEAU:
+                pile = game.tableau[source_index]
+                remaining = len(pile) - count
+                if remaining == 0:
+                    if not game.tableau[target_index]:
+                        continue
+                    other_moves.append([move])
+                elif remaining == game.hidden[source_index]:
+                    uncovering_moves.append([move])
+                elif game.foundation_slot(pile[remaining - 1]) is not None:
+                    other_moves.append([move])
+
+        uncovering_moves.sort(key=lambda sequence: game.hidden[sequence[0][1]])
+        return (
+            self._stock_sequences(game)
+            + other_moves
+            + waste_moves
+            + uncovering_moves
+            + foundation_moves
+        )
+
+    def _stock_sequences(self, game: Klondike) -> list[list[Move]]:
+        """List the plays reachable by drawing through the stash, nearest last."""
+        sequences: list[list[Move]] = []
+        probe = Klondike([], [], game.stash.copy(), game.waste.copy(), [], game.draw_count)
+        draws: list[Move] = []
+        while probe.stash:
+            probe.draw()
+            draws.append(DRAW)
+            for target, target_index in game.targets_for(probe.waste[-1]):
+                sequences.append([*draws, (WASTE, 0, 1, target, target_index)])
+        if probe.waste and game.rerolls < self.max_rerolls:
+            sequences.append([*draws, REROLL])
+        sequences.reverse()
+        return sequences
+
+
+def solve_seed(seed: int, draw_count: int = 1, **budget) -> SolveResult:
+    """
+    Deal the game for `seed` and solve it.
+
+    :param seed: Deal seed as used by `Klondike.deal`.
+    :param draw_count: 1 for easy mode, 3 for hard mode.
+    :param budget: Keyword arguments for `Solver`.
+    """
+    return Solver(**budget).solve(Klondike.deal(draw_count, seed))
+
+
+def _state_key(game: Klondike) -> bytes:
+    """
+    Pack a position so that tableau pile order and foundation slot order do not matter.
+
+    The key is the position itself rather than a hash of it, so two positions are
+    only merged when they are the same, and the search is the same in every process.
+    """
+    piles = sorted(
+        bytes((hidden, len(pile))) + bytes(pile) for pile, hidden in zip(game.tableau, game.hidden)
+    )
+    progress = [0] * SUIT_COUNT
+    for top in game.foundation:
+        if top >= 0:
+            progress[top // RANK_COUNT] = top % RANK_COUNT + 1
+    return b"".join(
+        (
+            *piles,
+            bytes(progress),
+            game.rerolls.to_bytes(4, "little"),
+            bytes((len(game.stash),)),
+            bytes(game.stash),
+            bytes(game.waste),
+        )
+    )
+
+
+def _state_size(game: Klondike) -> int:
+    lists = [*game.tableau, game.hidden, game.stash, game.waste, game.foundation]
+    return sys.getsizeof(game) + sum(sys.getsizeof(cards) for cards in lists)
+
+
+def _play_safe_moves(game: Klondike) -> list[Move]:
+    """Play every safe foundation move, returning the moves made."""
+    return [record[:5] for record in game.play_safe_moves()]
+
+
+def _is_solved(game: Klondike) -> bool:
+    return game.is_won() or game.can_auto_complete()
+
+
+def _finish(game: Klondike) -> list[Move]:
+    """Play out a position that `can_auto_complete`, returning the foundation moves."""
+    return [record[:5] for record in game.finish()]
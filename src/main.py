@@ -1,20 +1,117 @@
 """
 This module serves as the entry point for the Pasjans card game application.
 It initializes the game and starts the main application loop.
+
+Textual and the app are only imported once the arguments are parsed, so
+``--help`` and bad arguments answer straight away and ``--startup-report``
+can time the import.
 """
-from typing import NoReturn
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
+import sys
+from typing import TYPE_CHECKING, NoReturn
+
+import constants
+from engine.deals import MAX_DEAL_NUMBER
+
+if TYPE_CHECKING:
+    from engine.replay import Replay
+
+
+def deal_number(value: str) -> int:
+    number = int(value)
+    if not 0 <= number <= MAX_DEAL_NUMBER:
+        raise argparse.ArgumentTypeError(f"must be between 0 and {MAX_DEAL_NUMBER}")
+    return number
+
 
-from pasjans import Pasjans
+def replay_file(path: str) -> "Replay":
+    from engine.replay import Replay
+
+    try:
+        return Replay.load(path)
+    except (OSError, ValueError) as error:
+        raise argparse.ArgumentTypeError(f"cannot read {path}: {error}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Pasjans, Klondike solitaire in the terminal.")
+    parser.add_argument(
+        "--seed",
+        type=deal_number,
+        metavar="DEAL",
+        help="deal number to preselect, so a game can be replayed exactly",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="pasjans-trace.json",
+        metavar="PATH",
+        help="trace every click and write a Chrome trace to PATH (default: %(const)s)",
+    )
+    parser.add_argument(
+        "--replay",
+        type=replay_file,
+        metavar="PATH",
+        help="play back a recorded game instead of starting on the menu",
+    )
+    parser.add_argument(
+        "--move",
+        type=int,
+        default=0,
+        metavar="N",
+        help="with --replay, open the replay after move N",
+    )
+    parser.add_argument(
+        "--startup-report",
+        action="store_true",
+        help="start, wait for audio to load, quit and print how long each startup phase took; "
+        f"exits with status 1 when the first frame took over {constants.STARTUP_BUDGET_SECONDS * 1000:.0f} ms",
+    )
+    args = parser.parse_args()
+    if args.replay is not None and not 0 <= args.move <= len(args.replay):
+        parser.error(f"--move must be between 0 and {len(args.replay)}")
+    return args
 
 
 def main() -> NoReturn:
+    args = parse_args()
+    report = None
+    if args.startup_report:
+        from managers.startup_report import StartupReport
+
+        report = StartupReport(STARTED)
+        report.mark("parse arguments")
+
+    from controllers.service_locator import ServiceLocator
+    from managers.trace_manager import TraceManager
+    from pasjans import Pasjans
+
+    if report is not None:
+        report.mark("import Textual and the app")
     try:
-        game = Pasjans()
+        game = Pasjans(
+            seed=args.seed,
+            profile=args.profile,
+            replay=args.replay,
+            replay_position=args.move,
+            startup_report=report,
+        )
         game.run()
+        ServiceLocator.get(TraceManager).save()
     except Exception as e:
         print(f"Error running Pasjans: {e}")
         raise
 
+    if report is not None:
+        print(report.format(constants.STARTUP_BUDGET_SECONDS), file=sys.stderr)
+        if report.first_frame is None or report.first_frame > constants.STARTUP_BUDGET_SECONDS:
+            sys.exit(1)
+    sys.exit(0)
+
 
 if __name__ == "__main__":
     main()
@@ -1,7 +1,17 @@
+import atexit
+import queue
 import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from pathlib import Path
 from sqlite3 import Connection
-from typing import List, Tuple
+from typing import Callable, List, Optional, Tuple, TypeVar
+
+import constants
+
+T = TypeVar("T")
 
 # Path to the SQLite database file where scores will be stored.
 DB_PATH = Path.home() / ".pasjans_scores.db"
@@ -17,72 +27,306 @@ CREATE TABLE IF NOT EXISTS scores (
 );
 """
 
+# SQL query to create the index the leaderboard ordering reads from.
+CREATE_INDEX_SQL = """
+CREATE INDEX IF NOT EXISTS scores_by_moves_time ON scores (moves, time_seconds);
+"""
+
+# SQL queries keeping a count of scores per number of moves, which the rank lookup sums
+# instead of counting every better score.
+CREATE_COUNTS_TABLE_SQL = """
+CREATE TABLE score_counts (
+    moves INTEGER PRIMARY KEY,
+    count INTEGER NOT NULL
+);
+"""
+
+FILL_COUNTS_SQL = """
+INSERT INTO score_counts (moves, count)
+SELECT moves, COUNT(*) FROM scores GROUP BY moves;
+"""
+
+CREATE_COUNT_INSERT_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS scores_count_insert AFTER INSERT ON scores BEGIN
+    INSERT INTO score_counts (moves, count) VALUES (NEW.moves, 1)
+    ON CONFLICT (moves) DO UPDATE SET count = count + 1;
+END;
+"""
+
+CREATE_COUNT_DELETE_TRIGGER_SQL = """
+CREATE TRIGGER IF NOT EXISTS scores_count_delete AFTER DELETE ON scores BEGIN
+    UPDATE score_counts SET count = count - 1 WHERE moves = OLD.moves;
+END;
+"""
+
 # SQL query to insert a new score record into the `scores` table.
 INSERT_SCORE_SQL = """
 INSERT INTO scores (player_name, moves, time_seconds)
 VALUES (?, ?, ?);
 """
 
-# SQL query to fetch the top scores from the database, ordered by moves and time.
-SELECT_TOP_SCORES_SQL = """
-SELECT player_name, moves, time_seconds, date_played
+# SQL queries to fetch one leaderboard page, starting after the last score of the
+# previous page (keyset pagination). `id` breaks ties so every score has one place.
+SELECT_FIRST_PAGE_SQL = """
+SELECT id, player_name, moves, time_seconds, date_played
 FROM scores
-ORDER BY moves ASC, time_seconds ASC
+ORDER BY moves, time_seconds, id
 LIMIT ?;
 """
 
+SELECT_PAGE_AFTER_SQL = """
+SELECT id, player_name, moves, time_seconds, date_played
+FROM scores
+WHERE (moves, time_seconds, id) > (?, ?, ?)
+ORDER BY moves, time_seconds, id
+LIMIT ?;
+"""
+
+# SQL queries for the rank of a score: scores with fewer moves come from the per-moves
+# counts, ties on moves from an index range scan.
+SELECT_SCORE_KEY_SQL = """
+SELECT moves, time_seconds, id FROM scores WHERE id = ?;
+"""
+
+SELECT_FEWER_MOVES_COUNT_SQL = """
+SELECT COALESCE(SUM(count), 0) FROM score_counts WHERE moves < ?;
+"""
+
+SELECT_SAME_MOVES_BEFORE_COUNT_SQL = """
+SELECT COUNT(*) FROM scores WHERE moves = ? AND (time_seconds, id) < (?, ?);
+"""
+
+SELECT_SCORE_COUNT_SQL = """
+SELECT COALESCE(SUM(count), 0) FROM score_counts;
+"""
+
+# A leaderboard row: (id, player_name, moves, time_seconds, date_played).
+ScoreRow = Tuple[int, str, int, float, str]
+
 
 class DatabaseManager:
     """
     A class to manage interactions with the SQLite database for storing and retrieving game scores.
 
+    All database work runs on one background thread that owns a single long-lived
+    connection in WAL mode, so SQLite keeps the statements above prepared and the
+    event loop never waits on the disk or on another session holding the lock.
+    Operations run in the order they were submitted, so a read issued after
+    `save_score` sees the saved score. The thread is started on first use.
+
+    Leaderboard pages are cached until this manager saves a score.
+
     :param db_path: The file path to the SQLite database. Defaults to `DB_PATH`.
     """
 
     def __init__(self, db_path: Path = DB_PATH):
         """
-        Initialize the DatabaseManager and ensure the scores table exists.
+        Initialize the DatabaseManager. The database is only opened, and the `scores`
+        table created, once the first operation is submitted.
 
         :param db_path: The file path to the SQLite database. Defaults to `DB_PATH`.
         """
         self.db_path = db_path
-        self._ensure_db()
+        self._tasks: "queue.Queue[Optional[Tuple[Future, Callable[[Connection], object]]]]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._page_cache: "OrderedDict[Tuple[Optional[Tuple[int, float, int]], int], List[ScoreRow]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Bumped by every write so a page read before it is not cached after it
+        self._cache_generation = 0
 
     def _connect(self) -> Connection:
         """
-        Establish a connection to the SQLite database.
+        Establish the connection used by the database thread.
 
         :return: A connection object for the database.
         """
-        return sqlite3.connect(self.db_path)
+        conn = sqlite3.connect(
+            self.db_path, timeout=constants.DB_BUSY_TIMEOUT_MS / 1000
+        )
+        conn.execute(f"PRAGMA busy_timeout = {constants.DB_BUSY_TIMEOUT_MS}")
+        try:
+            conn.execute("PRAGMA journal_mode = WAL")
+        except sqlite3.OperationalError:
+            # Another session is switching modes right now; the default journal still works
+            pass
+        return conn
 
-    def _ensure_db(self) -> None:
+    def _ensure_db(self, conn: Connection) -> None:
         """
-        Ensure the `scores` table exists in the database. If it does not exist, it will be created.
+        Ensure the `scores` table, its index and the per-moves counts exist in the database.
         """
-        with self._connect() as conn:
+        # One write transaction, so no score is inserted between filling the counts
+        # and creating the triggers that keep them up to date
+        conn.execute("BEGIN IMMEDIATE")
+        try:
             conn.execute(CREATE_TABLE_SQL)
+            conn.execute(CREATE_INDEX_SQL)
+            has_counts = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'score_counts'"
+            ).fetchone()
+            if not has_counts:
+                conn.execute(CREATE_COUNTS_TABLE_SQL)
+                conn.execute(FILL_COUNTS_SQL)
+            conn.execute(CREATE_COUNT_INSERT_TRIGGER_SQL)
+            conn.execute(CREATE_COUNT_DELETE_TRIGGER_SQL)
             conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is not None:
+                return
+            self._thread = threading.Thread(target=self._run, name="database", daemon=True)
+            self._thread.start()
+            atexit.register(self.close)
+
+    def _run(self) -> None:
+        """Open the database, then run submitted operations until `close` is called."""
+        conn: Optional[Connection] = None
+        error: Optional[Exception] = None
+        try:
+            conn = self._connect()
+            self._with_retries(conn, self._ensure_db)
+        except Exception as e:
+            error = e
 
-    def save_score(self, player_name: str, moves: int, time_seconds: float) -> None:
+        while True:
+            task = self._tasks.get()
+            if task is None:
+                break
+            future, operation = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            if error is not None:
+                future.set_exception(error)
+                continue
+            try:
+                future.set_result(self._with_retries(conn, operation))
+            except Exception as e:
+                future.set_exception(e)
+
+        if conn is not None:
+            conn.close()
+
+    @staticmethod
+    def _with_retries(conn: Connection, operation: Callable[[Connection], T]) -> T:
+        """
+        Run an operation, retrying with backoff while another session keeps the database locked
+        for longer than the busy timeout.
         """
-        Save a new game score to the database.
+        delay = 0.05
+        for attempt in range(constants.DB_LOCK_RETRIES + 1):
+            try:
+                return operation(conn)
+            except sqlite3.OperationalError as e:
+                message = str(e)
+                if "locked" not in message and "busy" not in message:
+                    raise
+                if attempt == constants.DB_LOCK_RETRIES:
+                    raise
+                time.sleep(delay)
+                delay *= 2
+        raise AssertionError("unreachable")
+
+    def _submit(self, operation: Callable[[Connection], T]) -> "Future[T]":
+        self._start()
+        future: Future = Future()
+        self._tasks.put((future, operation))
+        return future
+
+    def save_score(self, player_name: str, moves: int, time_seconds: float) -> "Future[int]":
+        """
+        Queue a new game score to be saved and return immediately.
 
         :param player_name: The name of the player.
         :param moves: The number of moves the player took.
         :param time_seconds: The time the player took to finish, in seconds.
+        :return: A future resolving to the id of the stored score.
         """
-        with self._connect() as conn:
-            conn.execute(INSERT_SCORE_SQL, (player_name, moves, time_seconds))
-            conn.commit()
 
-    def get_top_scores(self, limit: int = 10) -> List[Tuple[str, int, int, str]]:
+        def insert(conn: Connection) -> int:
+            with conn:
+                cursor = conn.execute(INSERT_SCORE_SQL, (player_name, moves, time_seconds))
+            self._invalidate_pages()
+            return cursor.lastrowid
+
+        return self._submit(insert)
+
+    def get_scores_page(
+        self, after: Optional[ScoreRow] = None, limit: int = constants.LEADERBOARD_PAGE_SIZE
+    ) -> List[ScoreRow]:
         """
-        Retrieve the top scores from the database, ordered by moves and time.
+        Retrieve one page of the leaderboard, ordered by moves and time.
 
-        :param limit: The maximum number of scores to retrieve. Defaults to 10.
-        :return: A list of tuples containing (player_name, moves, time_seconds, date_played).
+        Pages are read with keyset pagination: each page starts right after the
+        last row of the previous one, so reading any page only touches `limit`
+        index entries. Waits for the database thread unless the page is cached.
+
+        :param after: The last row of the previous page, or None for the first page.
+        :param limit: The maximum number of scores to retrieve.
+        :return: A list of (id, player_name, moves, time_seconds, date_played) tuples.
+        """
+        start = None if after is None else (after[2], after[3], after[0])
+        key = (start, limit)
+        with self._cache_lock:
+            rows = self._page_cache.get(key)
+            if rows is not None:
+                self._page_cache.move_to_end(key)
+                return rows
+            generation = self._cache_generation
+
+        def select(conn: Connection) -> List[ScoreRow]:
+            if start is None:
+                return conn.execute(SELECT_FIRST_PAGE_SQL, (limit,)).fetchall()
+            return conn.execute(SELECT_PAGE_AFTER_SQL, (*start, limit)).fetchall()
+
+        rows = self._submit(select).result()
+        with self._cache_lock:
+            if generation == self._cache_generation:
+                self._page_cache[key] = rows
+                if len(self._page_cache) > constants.LEADERBOARD_CACHED_PAGES:
+                    self._page_cache.popitem(last=False)
+        return rows
+
+    def get_rank(self, score_id: int) -> Tuple[int, int]:
+        """
+        Find where a score places on the leaderboard.
+
+        Scores with fewer moves are summed from the per-moves counts kept by
+        triggers, and only the scores with the same number of moves are counted
+        through the index, so the lookup never scans the better scores.
+
+        :param score_id: The id returned by `save_score`.
+        :return: The 1-based rank and the total number of scores.
         """
-        with self._connect() as conn:
-            cursor = conn.execute(SELECT_TOP_SCORES_SQL, (limit,))
-            return cursor.fetchall()
\ No newline at end of file
+
+        def rank(conn: Connection) -> Tuple[int, int]:
+            key = conn.execute(SELECT_SCORE_KEY_SQL, (score_id,)).fetchone()
+            total = conn.execute(SELECT_SCORE_COUNT_SQL).fetchone()[0]
+            if key is None:
+                return 0, total
+            moves, time_seconds, _ = key
+            fewer_moves = conn.execute(SELECT_FEWER_MOVES_COUNT_SQL, (moves,)).fetchone()[0]
+            same_moves = conn.execute(SELECT_SAME_MOVES_BEFORE_COUNT_SQL, key).fetchone()[0]
+            return fewer_moves + same_moves + 1, total
+
+        return self._submit(rank).result()
+
+    def _invalidate_pages(self) -> None:
+        with self._cache_lock:
+            self._page_cache.clear()
+            self._cache_generation += 1
+
+    def close(self) -> None:
+        """Finish the queued operations and close the connection."""
+        with self._start_lock:
+            thread = self._thread
+            self._thread = None
+        if thread is None:
+            return
+        atexit.unregister(self.close)
+        self._tasks.put(None)
+        thread.join()
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from engine.klondike import Step
+
+
+class MoveApplied:
+    """
+    The player made a move, redid one, or auto-completed the game.
+
+    :ivar step: The records of the moves, in the order they were applied.
+    """
+
+    __slots__ = ("step",)
+
+    def __init__(self, step: Step) -> None:
+        self.step = step
+
+
+class MoveUndone:
+    """
+    A step was taken back.
+
+    :ivar step: The records of the moves, in the order they were originally applied.
+    """
+
+    __slots__ = ("step",)
+
+    def __init__(self, step: Step) -> None:
+        self.step = step
+
+
+class CardFlipped:
+    """
+    A face-down card was turned face-up.
+
+    :ivar pile_index: The tableau pile the card is in.
+    """
+
+    __slots__ = ("pile_index",)
+
+    def __init__(self, pile_index: int) -> None:
+        self.pile_index = pile_index
+
+
+class StashCycled:
+    """The waste was turned over into the stash."""
+
+    __slots__ = ()
+
+
+class GameWon:
+    """Every card is on the foundation."""
+
+    __slots__ = ()
+
+
+Event = MoveApplied | MoveUndone | CardFlipped | StashCycled | GameWon
+E = TypeVar("E", MoveApplied, MoveUndone, CardFlipped, StashCycled, GameWon)
+
+
+class EventBus:
+    """
+    Delivers the game events to the subscribers registered for their type.
+
+    Immediate subscribers are called with every event as it is published, for
+    state the next input must already see, like the undo history. Frame
+    subscribers are called once per frame with every event of their type
+    published since, so the header, the sounds and the winner message are
+    updated once for an auto-complete or a move with auto-played cards, however
+    many moves it holds.
+
+    :param schedule: Runs a callback on the event loop before the next frame,
+        e.g. `Screen.call_later`. Without it, frame subscribers are called as
+        soon as an event is published.
+    """
+
+    def __init__(self, schedule: Callable[[Callable[[], None]], object] | None = None) -> None:
+        self._schedule = schedule
+        self._immediate: dict[type, list[Callable]] = {}
+        self._frame: dict[type, list[Callable]] = {}
+        self._pending: list[Event] = []
+
+    def subscribe(self, event_type: type[E], handler: Callable[[E], None]) -> None:
+        """Call `handler` with every event of `event_type` as it is published."""
+        self._immediate.setdefault(event_type, []).append(handler)
+
+    def subscribe_frame(self, event_type: type[E], handler: Callable[[list[E]], None]) -> None:
+        """Call `handler` once per frame with the events of `event_type` published since."""
+        self._frame.setdefault(event_type, []).append(handler)
+
+    def publish(self, event: Event) -> None:
+        for handler in self._immediate.get(type(event), ()):
+            handler(event)
+        if type(event) not in self._frame:
+            return
+        self._pending.append(event)
+        if self._schedule is None:
+            self.flush()
+        elif len(self._pending) == 1:
+            self._schedule(self.flush)
+
+    def flush(self) -> None:
+        """Deliver the pending events to the frame subscribers, grouped by type in publishing order."""
+        pending, self._pending = self._pending, []
+        by_type: dict[type, list[Event]] = {}
+        for event in pending:
+            by_type.setdefault(type(event), []).append(event)
+        for event_type, events in by_type.items():
+            for handler in self._frame[event_type]:
+                handler(events)
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from time import monotonic
+from typing import Callable
+
+
+class GameClock:
+    """
+    Measures how long the current game has been played.
+
+    The clock runs no timer of its own: it only stores when it was last resumed
+    and the time accumulated before that, so reading it is exact and pausing it
+    while the game screen is hidden costs nothing. Once stopped, it cannot be
+    resumed again.
+
+    :param time_source: Monotonic clock returning seconds.
+    :param elapsed: Seconds already played, for a resumed game.
+    """
+
+    def __init__(self, time_source: Callable[[], float] = monotonic, elapsed: float = 0.0) -> None:
+        self._time_source = time_source
+        self._total = elapsed
+        self._resumed_at: float | None = None
+        self._stopped = False
+
+    @property
+    def running(self) -> bool:
+        return self._resumed_at is not None
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds played so far, not counting the time spent paused."""
+        if self._resumed_at is None:
+            return self._total
+        return self._total + (self._time_source() - self._resumed_at)
+
+    def resume(self) -> None:
+        if self._stopped or self._resumed_at is not None:
+            return
+        self._resumed_at = self._time_source()
+
+    def pause(self) -> None:
+        if self._resumed_at is None:
+            return
+        self._total += self._time_source() - self._resumed_at
+        self._resumed_at = None
+
+    def stop(self) -> None:
+        """Pause the clock for good, e.g. when the game is won."""
+        self.pause()
+        self._stopped = True
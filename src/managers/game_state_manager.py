@@ -2,101 +2,102 @@ from __future__ import annotations
 
 from textual.screen import Screen
 
-from widgets.card import Card
-from widgets.foundation import Foundation
-from widgets.stash_waste import StashWaste
-from widgets.tableau import Pile, Tableau
-from widgets.game_header import GameHeader
+from constants import MAX_UNDO
+from controllers.service_locator import ServiceLocator
+from engine.klondike import Step
+from managers.event_bus import MoveApplied
 
 
 class GameStateManager:
     """
-    Manages the game state by allowing operations such as undoing the last move.
+    Manages the game state by allowing operations such as undoing and redoing moves.
 
-    This class provides functionality to restore the game to a previous state
-    by managing a stack of game states. It interacts with components such as
-    the foundation, tableau, stash, and waste piles to enable reverting changes
-    made during gameplay.
+    Every move is kept as a small engine `Step`, the records of one player action,
+    rather than a snapshot of the board. Undoing reverts the most recent step and
+    redoing plays it again, and in both cases only the zones the move touched are
+    repainted. An auto-complete is one step, so it is undone in one go.
+
+    :ivar moves: Number of moves played, every card of a step counting as one.
+    :ivar remaining_undo: Number of undos the player has left.
     """
 
     def __init__(self) -> None:
-        self.previous_states: list[GameState] = []
+        self.undo_stack: list[Step] = []
+        self.redo_stack: list[Step] = []
+        self.moves = 0
+        self.remaining_undo = MAX_UNDO
+
+    def clear(self, infinite_undo: bool = False) -> None:
+        """Forget the history and counts of the previous game."""
+        self.undo_stack.clear()
+        self.redo_stack.clear()
+        self.moves = 0
+        self.remaining_undo = 9999 if infinite_undo else MAX_UNDO
+
+    def restore(self, undo_stack: list[Step], redo_stack: list[Step], moves: int, remaining_undo: int) -> None:
+        """Take over the history and counts of a resumed game."""
+        self.undo_stack[:] = undo_stack
+        self.redo_stack[:] = redo_stack
+        self.moves = moves
+        self.remaining_undo = remaining_undo
+
+    def on_move_applied(self, event: MoveApplied) -> None:
+        """Count a step the controller applied and keep it for undo."""
+        self.moves += len(event.step)
+        self.record_move(event.step)
+
+    def record_move(self, step: Step) -> None:
+        """
+        Push a move onto the undo stack.
+
+        Playing the move that would be redone next keeps the rest of the redo
+        stack; any other move makes it obsolete.
+        """
+        if self.redo_stack and self.redo_stack[-1] == step:
+            self.redo_stack.pop()
+        else:
+            self.redo_stack.clear()
+        self.undo_stack.append(step)
 
     def undo_last_operation(self, screen: Screen) -> None:
         """
         Undo the last operation performed during the game.
 
-        This method reverts the game state to the most recent one stored in the
-        `previous_states` stack. It also updates the number of moves performed
-        and checks for undo limits. The affected components include the foundation,
-        tableau, stash, and waste piles.
+        This method reverts the most recent move stored in the `undo_stack` and
+        keeps it for redo. It also updates the number of moves performed and
+        checks for undo limits.
         """
+        from controllers.card_interact_controller import CardInteractController
 
-        foundation: Foundation = screen.query_one(Foundation)
-        tableau: Tableau = screen.query_one(Tableau)
-        stash_waste: StashWaste = screen.query_one(StashWaste)
-        game_header = screen.query_one(GameHeader)
-
-        if not self.previous_states:
+        if not self.undo_stack:
             screen.notify("No more actions to undo.")
             return
 
-        if game_header.remaining_undo <= 0:
+        if self.remaining_undo <= 0:
             screen.notify("Undo limit reached.")
             return
 
-        game_header.moves -= 1
-        game_header.remaining_undo -= 1
-        previous_game_state: GameState = self.previous_states.pop()
-
-        foundation.cards = previous_game_state.foundation.copy()
-        tableau.piles = previous_game_state.piles.copy()
-        pile: Pile
-        card: Card
-        for pile in tableau.piles:
-            for card in pile.cards:
-                card.refresh()
-        stash_waste.stash = previous_game_state.stash.copy()
-        for card in stash_waste.stash:
-            card.refresh()
-        stash_waste.waste = previous_game_state.waste.copy()
-        for card in stash_waste.waste:
-            card.refresh()
-
-        # Make all cards unselected
-        for pile in tableau.piles:
-            for card in pile.cards:
-                card.make_unselected()
-        for card in stash_waste.stash:
-            card.make_unselected()
-        for card in stash_waste.waste:
-            card.make_unselected()
-
-
-class GameState:
-    """
-    Represents the current state of the game, including UI and card components.
+        ServiceLocator.get(CardInteractController).undo(self.take_undo())
 
-    This class provides a snapshot of the current game by storing references to
-    the screen, piles in the tableau, the stash, waste piles, and the foundation.
-    It enables restoring the game state during an undo operation.
+    def take_undo(self) -> Step:
+        """Move the last step from the undo stack to the redo stack, updating the counts."""
+        step = self.undo_stack.pop()
+        self.moves -= len(step)
+        self.remaining_undo -= 1
+        self.redo_stack.append(step)
+        return step
 
-    :ivar piles: A list of `Pile` objects representing tableau cards in the game.
-    :ivar stash: A list of `Card` objects representing the current stash in the game.
-    :ivar waste: A list of `Card` objects representing the waste pile in the game.
-    :ivar foundation: A list of `Card` objects or None for representing the state
-        of the foundation.
-    """
+    def redo_last_operation(self, screen: Screen) -> None:
+        """
+        Play the most recently undone move again.
 
-    def __init__(
-        self,
-        piles: list[Pile],
-        stash: list[Card],
-        waste: list[Card],
-        foundation: list[Card | None],
-    ):
-        self.piles = piles
-        self.stash = stash
-        self.waste = waste
-        self.foundation = foundation
+        The move goes through the controller like any other, so it is counted,
+        recorded for undo and checked for a win.
+        """
+        from controllers.card_interact_controller import CardInteractController
+
+        if not self.redo_stack:
+            screen.notify("No more actions to redo.")
+            return
 
+        ServiceLocator.get(CardInteractController).redo(self.redo_stack[-1])
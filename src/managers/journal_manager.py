@@ -0,0 +1,405 @@
+from __future__ import annotations
+
+import atexit
+import os
+import random
+import struct
+from pathlib import Path
+from typing import BinaryIO
+
+import constants
+from controllers.service_locator import ServiceLocator
+from engine.klondike import Klondike, Step
+from engine.replay import pack_record, pack_state, unpack_record, unpack_state
+from managers.event_bus import EventBus, GameWon, MoveApplied, MoveUndone
+from managers.game_clock import GameClock
+from managers.game_state_manager import GameStateManager
+
+# Directory the game in progress is saved to.
+SAVE_DIR = Path.home() / ".pasjans_save"
+
+SNAPSHOT_MAGIC = b"PJSV"
+JOURNAL_MAGIC = b"PJJL"
+VERSION = 1
+
+# magic, version, draw count, deal number, flags, generation, moves, remaining undo, game milliseconds
+_SNAPSHOT = struct.Struct("<4sBBQBIIIQ")
+# magic, version, generation of the snapshot the journal continues
+_JOURNAL = struct.Struct("<4sBI")
+# kind, game milliseconds, number of records that follow
+_ENTRY = struct.Struct("<BIB")
+_COUNT = struct.Struct("<I")
+_RECORD_SIZE = 2
+
+_INFINITE_UNDO = 1
+_AUTO_PLAY = 2
+
+_APPLIED = 0
+_UNDONE = 1
+
+
+def _pack_step(step: Step) -> bytes:
+    return bytes([len(step)]) + b"".join(pack_record(record) for record in step)
+
+
+def _unpack_records(data: bytes, offset: int, count: int) -> Step:
+    end = offset + count * _RECORD_SIZE
+    if end > len(data):
+        raise IndexError("step cut short")
+    return tuple(
+        unpack_record(int.from_bytes(data[position : position + _RECORD_SIZE], "little"))
+        for position in range(offset, end, _RECORD_SIZE)
+    )
+
+
+def _pack_stack(stack: list[Step]) -> bytes:
+    return _COUNT.pack(len(stack)) + b"".join(_pack_step(step) for step in stack)
+
+
+def _unpack_stack(data: bytes, offset: int) -> tuple[list[Step], int]:
+    (size,) = _COUNT.unpack_from(data, offset)
+    offset += _COUNT.size
+    stack: list[Step] = []
+    for _ in range(size):
+        count = data[offset]
+        stack.append(_unpack_records(data, offset + 1, count))
+        offset += 1 + count * _RECORD_SIZE
+    return stack, offset
+
+
+class SavedGame:
+    """
+    A game in progress, as restored from the save directory.
+
+    :ivar game: The position.
+    :ivar infinite_undo: Whether the game was started with infinite undo.
+    :ivar auto_play: Whether safe cards are played to the foundation automatically.
+    :ivar moves: Moves shown in the header.
+    :ivar remaining_undo: Undos left.
+    :ivar elapsed: Seconds played.
+    :ivar undo_stack: Steps that can be undone, oldest first.
+    :ivar redo_stack: Steps that can be redone, the next one last.
+    """
+
+    def __init__(
+        self,
+        game: Klondike,
+        infinite_undo: bool,
+        auto_play: bool,
+        moves: int,
+        remaining_undo: int,
+        elapsed: float,
+        undo_stack: list[Step],
+        redo_stack: list[Step],
+    ) -> None:
+        self.game = game
+        self.infinite_undo = infinite_undo
+        self.auto_play = auto_play
+        self.moves = moves
+        self.remaining_undo = remaining_undo
+        self.elapsed = elapsed
+        self.undo_stack = undo_stack
+        self.redo_stack = redo_stack
+
+
+class JournalWriter:
+    """
+    Saves one game as it is played, from the events published on its bus.
+
+    Every step and undo is appended to the journal as soon as it is published
+    and the journal is synced to disk once per frame, so a burst of moves costs
+    one ``fsync``. Every `snapshot_interval` entries, and on `close`, the
+    snapshot is rewritten and the journal started afresh, so resuming reads one
+    snapshot and replays a short tail however long the game was. The snapshot
+    is replaced atomically and the journal names the snapshot it continues, so
+    a crash while compacting loses nothing.
+
+    :param directory: Directory holding the snapshot and the journal.
+    :param events: Bus the game's moves are published on. The game state manager
+        must be subscribed to it first, so every entry is written after the
+        history it extends.
+    :param game: The game being saved.
+    :param clock: The game's clock.
+    :param flags: Options of the game, stored in the snapshot.
+    :param snapshot_interval: Number of journal entries between snapshots.
+    :param game_state_manager: Holds the game's history and counts.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        events: EventBus,
+        game: Klondike,
+        clock: GameClock,
+        flags: int,
+        snapshot_interval: int,
+        game_state_manager: GameStateManager,
+    ) -> None:
+        self._snapshot_path = directory / "snapshot"
+        self._journal_path = directory / "journal"
+        self._game = game
+        self._clock = clock
+        self._flags = flags
+        self._snapshot_interval = snapshot_interval
+        self._game_state_manager = game_state_manager
+        self._journal: BinaryIO | None = None
+        self._entries = 0
+        self._unsynced = False
+        self._compact()
+        events.subscribe(MoveApplied, self._on_move_applied)
+        events.subscribe(MoveUndone, self._on_move_undone)
+        events.subscribe_frame(MoveApplied, self._sync)
+        events.subscribe_frame(MoveUndone, self._sync)
+        events.subscribe(GameWon, self._on_game_won)
+
+    @property
+    def closed(self) -> bool:
+        return self._journal is None
+
+    def close(self) -> None:
+        """Write a snapshot of the game and stop saving it."""
+        if self._journal is None:
+            return
+        try:
+            self._compact()
+        except OSError:
+            pass
+        self._close_journal()
+
+    def discard(self) -> None:
+        """Stop saving and delete the save, e.g. once the game is won."""
+        self._close_journal()
+        for path in (self._journal_path, self._snapshot_path):
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+
+    def _on_move_applied(self, event: MoveApplied) -> None:
+        self._append(_APPLIED, event.step)
+
+    def _on_move_undone(self, event: MoveUndone) -> None:
+        # Replaying the undo takes the same step off the undo stack, so only the undo itself is written
+        self._append(_UNDONE, ())
+
+    def _on_game_won(self, event: GameWon) -> None:
+        self.discard()
+
+    def _append(self, kind: int, step: Step) -> None:
+        if self._journal is None:
+            return
+        milliseconds = int(self._clock.elapsed * 1000)
+        try:
+            self._journal.write(
+                _ENTRY.pack(kind, milliseconds, len(step))
+                + b"".join(pack_record(record) for record in step)
+            )
+            # Handed to the OS straight away, so a crash of the app itself loses nothing
+            self._journal.flush()
+            self._unsynced = True
+            self._entries += 1
+            if self._entries >= self._snapshot_interval:
+                self._compact()
+        except OSError:
+            self._close_journal()
+
+    def _sync(self, events: list[MoveApplied] | list[MoveUndone]) -> None:
+        """Sync the journal to disk, once for every entry of the frame."""
+        if self._journal is None or not self._unsynced:
+            return
+        try:
+            os.fsync(self._journal.fileno())
+        except OSError:
+            pass
+        self._unsynced = False
+
+    def _compact(self) -> None:
+        """Replace the snapshot with the current game and start an empty journal after it."""
+        history = self._game_state_manager
+        generation = random.getrandbits(32)
+        state = pack_state(self._game)
+        data = (
+            _SNAPSHOT.pack(
+                SNAPSHOT_MAGIC,
+                VERSION,
+                self._game.draw_count,
+                self._game.seed,
+                self._flags,
+                generation,
+                history.moves,
+                history.remaining_undo,
+                int(self._clock.elapsed * 1000),
+            )
+            + bytes([len(state)])
+            + state
+            + _pack_stack(history.undo_stack)
+            + _pack_stack(history.redo_stack)
+        )
+        temporary = self._snapshot_path.with_name("snapshot.tmp")
+        with open(temporary, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self._snapshot_path)
+
+        self._close_journal()
+        self._journal = open(self._journal_path, "wb")
+        self._journal.write(_JOURNAL.pack(JOURNAL_MAGIC, VERSION, generation))
+        self._journal.flush()
+        self._entries = 0
+        self._unsynced = True
+
+    def _close_journal(self) -> None:
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+class JournalManager:
+    """
+    Saves the game in progress as it is played, so it can be resumed after the
+    app was closed or crashed.
+
+    The save is a snapshot of the whole game, undo history included, plus an
+    append-only journal of what happened since, kept by a `JournalWriter`.
+    Only one game is saved: starting a game replaces the save, and winning it
+    deletes it. Set ``PASJANS_AUTOSAVE=0`` to save nothing.
+
+    :param directory: Directory the save is written to. Defaults to `SAVE_DIR`, or
+        a directory in it named after the current session when the process hosts
+        many, so sessions never resume or overwrite each other's game.
+    :param enabled: Whether games are saved at all.
+    :param snapshot_interval: Number of journal entries between snapshots.
+    """
+
+    def __init__(
+        self,
+        directory: Path | None = None,
+        enabled: bool = constants.AUTOSAVE_ENABLED,
+        snapshot_interval: int = constants.JOURNAL_SNAPSHOT_INTERVAL,
+        game_state_manager: GameStateManager = None,
+    ) -> None:
+        self.directory = directory or ServiceLocator.session_path(SAVE_DIR)
+        self.enabled = enabled
+        self.snapshot_interval = snapshot_interval
+        self._game_state_manager = game_state_manager or ServiceLocator.get(GameStateManager)
+        self._writer: JournalWriter | None = None
+
+    def has_saved_game(self) -> bool:
+        """Check whether there is a game to resume, without reading it."""
+        return self.enabled and (self.directory / "snapshot").exists()
+
+    def start(
+        self,
+        events: EventBus,
+        game: Klondike,
+        clock: GameClock,
+        infinite_undo: bool,
+        auto_play: bool,
+    ) -> JournalWriter | None:
+        """
+        Start saving a game, replacing the previous save. The game state manager
+        must already hold the game's history.
+
+        :return: The writer, to close when the game screen closes, or None if
+            saving is disabled or the directory cannot be written.
+        """
+        self.stop()
+        if not self.enabled:
+            return None
+        flags = (_INFINITE_UNDO if infinite_undo else 0) | (_AUTO_PLAY if auto_play else 0)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._writer = JournalWriter(
+                self.directory, events, game, clock, flags, self.snapshot_interval, self._game_state_manager
+            )
+        except OSError:
+            return None
+        # Only while a game is being saved, so a stopped manager can be collected
+        atexit.register(self.stop)
+        return self._writer
+
+    def stop(self) -> None:
+        """Close the writer of the game being saved, if any, keeping its save."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            atexit.unregister(self.stop)
+
+    def load(self) -> SavedGame | None:
+        """
+        Restore the saved game: its snapshot, then every complete journal entry after it.
+
+        :return: The game, or None if there is none or the save cannot be read.
+        """
+        try:
+            snapshot = (self.directory / "snapshot").read_bytes()
+        except OSError:
+            return None
+        try:
+            saved, generation = _parse_snapshot(snapshot)
+        except (struct.error, IndexError, ValueError):
+            return None
+
+        try:
+            journal = (self.directory / "journal").read_bytes()
+        except OSError:
+            journal = b""
+        if len(journal) >= _JOURNAL.size:
+            magic, version, journal_generation = _JOURNAL.unpack_from(journal)
+            # A journal of another generation was already folded into the snapshot
+            if magic == JOURNAL_MAGIC and version == VERSION and journal_generation == generation:
+                _replay_tail(saved, journal)
+        return saved
+
+
+def _parse_snapshot(data: bytes) -> tuple[SavedGame, int]:
+    (
+        magic, version, draw_count, seed, flags, generation, moves, remaining_undo, milliseconds,
+    ) = _SNAPSHOT.unpack_from(data)
+    if magic != SNAPSHOT_MAGIC or version != VERSION:
+        raise ValueError("Not a saved game")
+    offset = _SNAPSHOT.size
+    size = data[offset]
+    game = unpack_state(data[offset + 1 : offset + 1 + size], draw_count, seed)
+    undo_stack, offset = _unpack_stack(data, offset + 1 + size)
+    redo_stack, offset = _unpack_stack(data, offset)
+    saved = SavedGame(
+        game,
+        bool(flags & _INFINITE_UNDO),
+        bool(flags & _AUTO_PLAY),
+        moves,
+        remaining_undo,
+        milliseconds / 1000,
+        undo_stack,
+        redo_stack,
+    )
+    return saved, generation
+
+
+def _replay_tail(saved: SavedGame, data: bytes) -> None:
+    """Apply the journal entries to `saved`, up to the last complete one."""
+    # Replayed through a state manager of its own, so the history is rebuilt the way it was made
+    history = GameStateManager()
+    history.restore(saved.undo_stack, saved.redo_stack, saved.moves, saved.remaining_undo)
+    offset = _JOURNAL.size
+    try:
+        while offset < len(data):
+            kind, milliseconds, count = _ENTRY.unpack_from(data, offset)
+            step = _unpack_records(data, offset + _ENTRY.size, count)
+            if kind == _APPLIED:
+                for record in step:
+                    saved.game.apply(record[:5])
+                history.on_move_applied(MoveApplied(step))
+            else:
+                for record in reversed(history.take_undo()):
+                    saved.game.revert(record)
+            saved.elapsed = milliseconds / 1000
+            offset += _ENTRY.size + count * _RECORD_SIZE
+    except (struct.error, IndexError):
+        # The app stopped while this entry was being written
+        pass
+    saved.undo_stack = history.undo_stack
+    saved.redo_stack = history.redo_stack
+    saved.moves = history.moves
+    saved.remaining_undo = history.remaining_undo
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+from rich.panel import Panel
+
+import constants
+
+
+class RenderCacheManager:
+    """
+    Shared least-recently-used cache of the Rich panels cards and card holders render to.
+
+    A card's look only depends on a handful of values (face, hidden, selected,
+    theme and color), so widgets build a key from those and only create a new
+    panel when no other widget has rendered the same look recently. Face-up cards
+    in the rainbow theme change color every frame and are not cached.
+
+    :param max_size: Number of panels kept before the least recently used is dropped.
+    :ivar hits: Number of renders served from the cache.
+    :ivar misses: Number of renders that had to build a panel.
+    """
+
+    def __init__(self, max_size: int = constants.RENDER_CACHE_SIZE) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._panels: OrderedDict[Hashable, Panel] = OrderedDict()
+
+    def get(self, key: Hashable, build: Callable[[], Panel]) -> Panel:
+        """
+        Return the panel cached for `key`, building and caching it on a miss.
+
+        :param key: Everything the panel's look depends on.
+        :param build: Creates the panel when it is not cached.
+        :return: The cached panel.
+        """
+        panel = self._panels.get(key)
+        if panel is not None:
+            self.hits += 1
+            self._panels.move_to_end(key)
+            return panel
+
+        self.misses += 1
+        panel = build()
+        self._panels[key] = panel
+        if len(self._panels) > self.max_size:
+            self._panels.popitem(last=False)
+        return panel
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def clear(self) -> None:
+        self._panels.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._panels)
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import atexit
+from datetime import datetime
+from pathlib import Path
+
+import constants
+from controllers.service_locator import ServiceLocator
+from engine.klondike import Klondike
+from engine.replay import ReplayWriter
+from managers.game_clock import GameClock
+
+REPLAY_DIR = Path.home() / ".pasjans_replays"
+
+
+class ReplayManager:
+    """
+    Records every game into a replay file named after the time it started and its deal.
+
+    Only one game is recorded at a time: starting a game closes the replay of
+    the previous one. Set ``PASJANS_REPLAYS=0`` to record nothing.
+
+    :param directory: Directory the replays are written to. Defaults to `REPLAY_DIR`,
+        or a directory in it named after the current session when the process
+        hosts many, so two sessions starting the same deal in the same second
+        do not write one file.
+    :param enabled: Whether games are recorded at all.
+    """
+
+    def __init__(self, directory: Path | None = None, enabled: bool = constants.REPLAYS_ENABLED) -> None:
+        self.directory = directory or ServiceLocator.session_path(REPLAY_DIR)
+        self.enabled = enabled
+        self._writer: ReplayWriter | None = None
+
+    def start(self, game: Klondike, clock: GameClock) -> ReplayWriter | None:
+        """
+        Start recording a game that has just been dealt.
+
+        :return: The writer to pass every move to, or None if replays are disabled
+            or the directory cannot be written.
+        """
+        self.stop()
+        if not self.enabled:
+            return None
+
+        name = f"{datetime.now():%Y%m%d-%H%M%S}-deal{game.seed}.pjr"
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            file = open(self.directory / name, "wb")
+        except OSError:
+            return None
+        self._writer = ReplayWriter(
+            file, game, lambda: clock.elapsed, constants.REPLAY_KEYFRAME_INTERVAL
+        )
+        # Only while a game is being recorded, so a stopped manager can be collected
+        atexit.register(self.stop)
+        return self._writer
+
+    def stop(self) -> None:
+        """Close the replay being recorded, if any."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            atexit.unregister(self.stop)
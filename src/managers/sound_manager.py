@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable
+
+import constants
+
+
+class PygameAudioBackend:
+    """Plays audio through `pygame.mixer`, which is only imported once audio starts."""
+
+    def init(self) -> None:
+        import pygame.mixer
+
+        pygame.mixer.init()
+
+    def load(self, path: str) -> Any:
+        from pygame.mixer import Sound
+
+        return Sound(path)
+
+    def play(self, sound: Any) -> None:
+        sound.play()
+
+    def play_music(self, path: str) -> None:
+        import pygame.mixer
+
+        # Streamed from disk instead of being decoded into memory up front
+        pygame.mixer.music.load(path)
+        pygame.mixer.music.play(-1)
+
+    def stop(self) -> None:
+        import pygame.mixer
+
+        pygame.mixer.music.stop()
+        pygame.mixer.stop()
+
+
+class NullAudioBackend:
+    """Backend that plays nothing, used for headless runs and when no audio device is available."""
+
+    def init(self) -> None:
+        pass
+
+    def load(self, path: str) -> Any:
+        return path
+
+    def play(self, sound: Any) -> None:
+        pass
+
+    def play_music(self, path: str) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class SoundManager:
+    """
+    Plays the game's sound effects and lobby music.
+
+    The audio backend is initialised and every effect in `constants.SOUND_EFFECTS`
+    is loaded once on a background thread started by `start`, so neither the UI
+    thread nor a move ever waits on the mixer or the disk. Effects played before
+    loading finished are skipped, and music requested before then starts as soon
+    as the mixer is ready. If the backend fails to initialise, the manager falls
+    back to `NullAudioBackend`.
+
+    :param backend: Audio backend to use. Defaults to `NullAudioBackend` when
+        `constants.AUDIO_ENABLED` is False and `PygameAudioBackend` otherwise.
+    """
+
+    def __init__(self, backend: PygameAudioBackend | NullAudioBackend = None) -> None:
+        if backend is None:
+            backend = PygameAudioBackend() if constants.AUDIO_ENABLED else NullAudioBackend()
+        self._backend = backend
+        self._sounds: dict[str, Any] = {}
+        self._music: str | None = None
+        self._ready = False
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def start(self, on_ready: Callable[[float], None] | None = None) -> None:
+        """
+        Initialise the backend and load the effects on a background thread.
+
+        :param on_ready: Called on that thread with the seconds loading took.
+        """
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._load, args=(on_ready,), name="audio", daemon=True)
+        self._thread.start()
+
+    def _load(self, on_ready: Callable[[float], None] | None) -> None:
+        started = time.perf_counter()
+        try:
+            self._backend.init()
+            sounds = {
+                name: self._backend.load(path)
+                for name, path in constants.SOUND_EFFECTS.items()
+            }
+        except Exception:
+            self._backend = NullAudioBackend()
+            sounds = {}
+
+        with self._lock:
+            self._sounds = sounds
+            self._ready = True
+            if self._music is not None:
+                self._backend.play_music(self._music)
+        if on_ready is not None:
+            on_ready(time.perf_counter() - started)
+
+    def play(self, name: str) -> None:
+        """
+        Play a preloaded effect.
+
+        :param name: Key of the effect in `constants.SOUND_EFFECTS`.
+        """
+        sound = self._sounds.get(name)
+        if sound is not None:
+            self._backend.play(sound)
+
+    def play_music(self, path: str) -> None:
+        """Loop the music file at `path`, once the backend is ready."""
+        with self._lock:
+            self._music = path
+            if self._ready:
+                self._backend.play_music(path)
+
+    def stop(self) -> None:
+        """Stop the music and every playing effect."""
+        with self._lock:
+            self._music = None
+            if self._ready:
+                self._backend.stop()
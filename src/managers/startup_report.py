@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class StartupReport:
+    """
+    Times the phases of startup, for ``--startup-report``.
+
+    Phases on the main thread are marked one after the other, each lasting from
+    the previous mark, up to the first frame of the mode selection screen.
+    Work done in the background, like loading audio, is added with its own
+    duration since it overlaps the others.
+
+    :param started: `time.perf_counter()` when `main.py` started running.
+    :ivar first_frame: Seconds from `started` to the first frame, once painted.
+    """
+
+    def __init__(self, started: float) -> None:
+        self.started = started
+        self.first_frame: float | None = None
+        self._last = started
+        self._phases: list[tuple[str, float]] = []
+        self._background: list[tuple[str, float]] = []
+        self._lock = threading.Lock()
+
+    def mark(self, phase: str) -> None:
+        """End `phase`, which started at the previous mark."""
+        now = time.perf_counter()
+        self._phases.append((phase, now - self._last))
+        self._last = now
+
+    def mark_first_frame(self) -> None:
+        self.mark("first frame")
+        self.first_frame = self._last - self.started
+
+    def add_background(self, phase: str, seconds: float) -> None:
+        """Add a phase that ran off the main thread. Safe to call from any thread."""
+        with self._lock:
+            self._background.append((phase, seconds))
+
+    def format(self, budget: float) -> str:
+        """The phases in milliseconds, with time to first frame against `budget` seconds."""
+        lines = [f"{phase:<28} {seconds * 1000:>8.1f} ms" for phase, seconds in self._phases]
+        if self.first_frame is not None:
+            verdict = "over budget" if self.first_frame > budget else "within budget"
+            lines.append(
+                f"{'time to first frame':<28} {self.first_frame * 1000:>8.1f} ms"
+                f"  ({verdict} of {budget * 1000:.0f} ms)"
+            )
+        with self._lock:
+            for phase, seconds in self._background:
+                lines.append(f"{phase + ' (background)':<28} {seconds * 1000:>8.1f} ms")
+        return "\n".join(lines)
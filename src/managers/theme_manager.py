@@ -1,12 +1,19 @@
+from __future__ import annotations
+
 import time
+from typing import TYPE_CHECKING
 
 from rich import box
 from rich.box import Box
 from textual.screen import Screen
 from textual.timer import Timer
 
+import constants
 from widgets.card_holder import CardHolder
 
+if TYPE_CHECKING:
+    from widgets.card import Card
+
 
 class ThemeManager:
     """
@@ -19,6 +26,13 @@ class ThemeManager:
     def __init__(self) -> None:
         self.current_theme = "default"
         self.rainbow_timer: Timer | None = None
+        self._rainbow_palette: list[str] = []
+        # Mounted cards in screen order, dropped whenever a card is mounted or unmounted
+        self._rainbow_cards: list[Card] | None = None
+
+    def invalidate_cards(self) -> None:
+        """Forget the cached card list so the next animation frame queries the screen again."""
+        self._rainbow_cards = None
 
     def switch_theme(self, screen: Screen):
         from widgets.card import Card
@@ -43,37 +57,52 @@ class ThemeManager:
         """
         Starts the rainbow animation for the cards.
 
-        Creates dynamic color effects by updating card colors at regular intervals.
+        Creates dynamic color effects by updating card colors at regular intervals,
+        at most `constants.RAINBOW_FPS` times per second. Colors come from a palette
+        computed once, and the list of cards is only queried again after the board
+        changed. Assigning a color only repaints the card.
         """
         from widgets.card import Card
 
         self.stop_rainbow_animation()
 
-        start_time = time.time()
+        if not self._rainbow_palette:
+            size = constants.RAINBOW_PALETTE_SIZE
+            self._rainbow_palette = [
+                self.get_rainbow_color_with_phase(i / size) for i in range(size)
+            ]
+        palette = self._rainbow_palette
+        palette_size = len(palette)
+        self._rainbow_cards = None
 
-        def update_rainbow_colors() -> None:
-            if self.current_theme == "rainbow":
-                cards = list(screen.query(Card))
-                total_cards = len(cards)
+        start_time = time.time()
 
-                if total_cards > 0:
-                    current_time = time.time()
-                    elapsed_time = current_time - start_time
+        wave_speed = 0.2
+        wave_length = 0.2
 
-                    wave_speed = 0.2
-                    wave_length = 0.2
+        def update_rainbow_colors() -> None:
+            if self.current_theme != "rainbow":
+                return
 
-                    for i, card in enumerate(cards):
-                        card_position = i / max(1, total_cards - 1)
+            if self._rainbow_cards is None:
+                self._rainbow_cards = list(screen.query(Card))
+            cards = self._rainbow_cards
+            total_cards = len(cards)
 
-                        phase = (
-                            elapsed_time * wave_speed + card_position * wave_length
-                        ) % 1.0
+            if total_cards > 0:
+                offset = (time.time() - start_time) * wave_speed
+                step = wave_length / max(1, total_cards - 1)
 
-                        card.color = self.get_rainbow_color_with_phase(phase)
-                        card.refresh()
+                for i, card in enumerate(cards):
+                    # Hidden cards are always drawn dim
+                    if card.hidden:
+                        continue
+                    phase = (offset + i * step) % 1.0
+                    card.color = palette[int(phase * palette_size) % palette_size]
 
-        self.rainbow_timer = screen.set_interval(1 / 120, update_rainbow_colors)
+        self.rainbow_timer = screen.set_interval(
+            1 / constants.RAINBOW_FPS, update_rainbow_colors
+        )
 
     def get_rainbow_color_with_phase(self, phase: float) -> str:
         """
@@ -113,6 +142,7 @@ class ThemeManager:
         if self.rainbow_timer:
             self.rainbow_timer.stop()
             self.rainbow_timer = None
+        self._rainbow_cards = None
 
     def get_box(self) -> Box | None:
         match self.current_theme:
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Iterator
+
+from textual.screen import Screen
+
+
+class _NullSpan:
+    """Context manager that does nothing, shared by every span while tracing is off."""
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class TraceManager:
+    """
+    Opt-in tracing of the click path, written as a Chrome trace.
+
+    Spans (click handling, applying a move, syncing widgets, post-move events,
+    reconciling containers) are recorded as complete events, and every click
+    gets a ``frame`` span that lasts until the screen has refreshed. When that
+    frame ends, the counters collected during it are written as counter events:
+    widgets mounted, removed and moved, DOM queries and renders. Open the file
+    in a trace viewer such as ``chrome://tracing`` or Perfetto.
+
+    When disabled, `span` returns a shared no-op context manager and `count`
+    returns immediately, so instrumented code pays one method call.
+
+    :param path: File the trace is written to, or None to disable tracing.
+    """
+
+    def __init__(self, path: str | None = None) -> None:
+        self.path = path
+        self.enabled = path is not None
+        self._events: list[dict] = []
+        self._counts: Counter[str] = Counter()
+        self._origin = time.perf_counter_ns()
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+        if self.enabled:
+            self._count_dom_queries()
+
+    def _now(self) -> float:
+        """Microseconds since tracing started, the unit Chrome traces use."""
+        return (time.perf_counter_ns() - self._origin) / 1000
+
+    def _add(self, event: dict) -> None:
+        event["pid"] = self._pid
+        event["tid"] = threading.get_ident()
+        with self._lock:
+            self._events.append(event)
+
+    def span(self, name: str, **args: Any):
+        """Return a context manager recording `name` as a span around its body."""
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._span(name, args)
+
+    @contextmanager
+    def _span(self, name: str, args: dict) -> Iterator[None]:
+        start = self._now()
+        try:
+            yield
+        finally:
+            self._add({"name": name, "ph": "X", "ts": start, "dur": self._now() - start, "args": args})
+
+    def count(self, name: str, value: int = 1) -> None:
+        if self.enabled:
+            self._counts[name] += value
+
+    def click(self, screen: Screen, name: str):
+        """
+        Return a context manager for handling one click.
+
+        Besides a span for the handler itself, it records a ``frame`` span from
+        the click until the screen has refreshed, followed by the counters.
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._click(screen, name)
+
+    @contextmanager
+    def _click(self, screen: Screen, name: str) -> Iterator[None]:
+        start = self._now()
+        with self._span(name, {}):
+            yield
+        screen.call_after_refresh(self._end_frame, start)
+
+    def _end_frame(self, start: float) -> None:
+        end = self._now()
+        self._add({"name": "frame", "ph": "X", "ts": start, "dur": end - start, "args": {}})
+        if self._counts:
+            self._add({"name": "per move", "ph": "C", "ts": end, "args": dict(self._counts)})
+            self._counts.clear()
+
+    def _count_dom_queries(self) -> None:
+        """Wrap the DOM query methods so every call is counted; only done when tracing."""
+        from textual.dom import DOMNode
+
+        for method_name in ("query", "query_one"):
+            method = getattr(DOMNode, method_name)
+
+            def counted(node, *args, _method=method, _name=f"dom.{method_name}", **kwargs):
+                self._counts[_name] += 1
+                return _method(node, *args, **kwargs)
+
+            setattr(DOMNode, method_name, counted)
+
+    def save(self) -> None:
+        """Write the recorded events to `path`."""
+        if not self.enabled:
+            return
+        with self._lock:
+            events = list(self._events)
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, file)
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
-import pygame
+from typing import TYPE_CHECKING, Callable
+
 from textual.app import App
+from textual.screen import Screen
 
-from controllers.service_locator import ServiceLocator
+from controllers.service_locator import ServiceLocator, ServiceScope
 from managers.database_manager import DatabaseManager
 from managers.game_state_manager import GameStateManager
-from managers.move_event_manager import MoveEventManager
+from managers.journal_manager import JournalManager
+from managers.render_cache_manager import RenderCacheManager
+from managers.replay_manager import ReplayManager
+from managers.sound_manager import SoundManager
+from managers.startup_report import StartupReport
 from managers.theme_manager import ThemeManager
-from screens.help import Help
+from managers.trace_manager import TraceManager
 from screens.mode_selection import ModeSelectionScreen
 
+if TYPE_CHECKING:
+    from engine.replay import Replay
+
+
+def _help_screen() -> Screen:
+    # Imported on first use: the Markdown widget it needs is slow to import
+    from screens.help import Help
+
+    return Help()
+
 
 class Pasjans(App[None]):
     """
@@ -21,6 +37,11 @@ class Pasjans(App[None]):
     This class defines basic configurations, available screens, and the main
     entry point for mounting custom screens.
 
+    Startup only loads what the mode selection screen needs: the game, replay,
+    help and leaderboard screens are imported when first opened, the database
+    is opened on first use, and audio starts loading in the background once the
+    first frame has been painted.
+
     :ivar ENABLE_COMMAND_PALETTE: Indicates whether the command palette feature
         is enabled. Default is False.
     :ivar CSS_PATH: Path to the styling file for the application's user
@@ -28,31 +49,95 @@ class Pasjans(App[None]):
     :ivar SCREENS: A dictionary mapping screen identifiers to their
         corresponding screen classes.
     :ivar TITLE: Title of the application displayed in the UI.
+    :ivar seed: Deal number preselected on the mode selection screen, if any.
+    :ivar profile: Path the click-path trace is written to, or None to not trace.
+    :ivar replay: Recorded game to open on start, if any.
+    :ivar replay_position: Move of `replay` to open at.
+    :ivar startup_report: Times the startup phases when given, and makes the app
+        exit once audio has loaded so the report can be printed.
+    :ivar services: The session's service scope. An app created inside a scope made
+        current with `ServiceLocator.run_in_scope` uses that one, so one process can
+        host many sessions; otherwise the app makes a scope of its own.
     """
 
     ENABLE_COMMAND_PALETTE = False
     CSS_PATH = "pasjans.tcss"
-    SCREENS = {"help": Help}
+    SCREENS = {"help": _help_screen}
     TITLE = "Pasjans Gigathon"
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        seed: int | None = None,
+        profile: str | None = None,
+        replay: Replay | None = None,
+        replay_position: int = 0,
+        startup_report: StartupReport | None = None,
+    ) -> None:
         super().__init__()
+        self.seed = seed
+        self.profile = profile
+        self.replay = replay
+        self.replay_position = replay_position
+        self.startup_report = startup_report
+        self.services = ServiceLocator.current_scope()
+        if self.services is ServiceLocator.shared:
+            # The only session of this process, which keeps its files where they always were
+            self.services = ServiceScope(ServiceLocator.shared)
+            ServiceLocator.enter_scope(self.services)
         self._initialize_services()
+        if self.startup_report is not None:
+            self.startup_report.mark("initialise services")
 
     def _initialize_services(self) -> None:
         """
         Initialize and register all required services with the ServiceLocator.
-        This includes database, game state, move events, and theme management.
+
+        Tracing, the database, sound and the render cache hold no per-player state,
+        so they are registered once in the shared scope for every session of the
+        process. Game state, themes, replay recording and autosave belong to the
+        session, and the replays and save of a session made with
+        `ServiceLocator.create_scope` go to a directory named after it; a host may
+        also register its own beforehand. Move events are published on each game
+        screen's own event bus.
         """
-        ServiceLocator.register(DatabaseManager, DatabaseManager())
-        ServiceLocator.register(GameStateManager, GameStateManager())
-        ServiceLocator.register(MoveEventManager, MoveEventManager())
-        ServiceLocator.register(ThemeManager, ThemeManager())
+        shared = ServiceLocator.shared
+        self._register_once(shared, TraceManager, lambda: TraceManager(self.profile))
+        self._register_once(shared, DatabaseManager, DatabaseManager)
+        self._register_once(shared, SoundManager, SoundManager)
+        self._register_once(shared, RenderCacheManager, RenderCacheManager)
+        self._register_once(self.services, GameStateManager, GameStateManager)
+        self._register_once(self.services, ThemeManager, ThemeManager)
+        self._register_once(self.services, ReplayManager, ReplayManager)
+        self._register_once(self.services, JournalManager, JournalManager)
+
+    @staticmethod
+    def _register_once(scope: ServiceScope, service_type: type, create: Callable[[], object]) -> None:
+        if service_type not in scope:
+            scope.register(service_type, create())
 
     def on_mount(self) -> None:
         """
-        Initialize audio and display the mode selection screen.
-        Called when the application is mounted.
+        Display the mode selection screen, with the replay on top of it if one was
+        given, and start loading audio once it is painted. Called when the
+        application is mounted.
         """
-        pygame.mixer.init()
-        self.push_screen(ModeSelectionScreen())
\ No newline at end of file
+        if self.startup_report is not None:
+            self.startup_report.mark("start Textual")
+        self.push_screen(ModeSelectionScreen(seed=self.seed))
+        if self.replay is not None:
+            from screens.replay import ReplayScreen
+
+            self.push_screen(ReplayScreen(self.replay, self.replay_position))
+        self.call_after_refresh(self._on_first_frame)
+
+    def _on_first_frame(self) -> None:
+        if self.startup_report is None:
+            ServiceLocator.get(SoundManager).start()
+            return
+        self.startup_report.mark_first_frame()
+        ServiceLocator.get(SoundManager).start(on_ready=self._on_audio_ready)
+
+    def _on_audio_ready(self, seconds: float) -> None:
+        """Called on the audio thread once loading finished, only with a startup report."""
+        self.startup_report.add_background("load audio", seconds)
+        self.call_from_thread(self.exit)
\ No newline at end of file
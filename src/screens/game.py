@@ -1,8 +1,6 @@
 from __future__ import annotations
 
-from time import monotonic
-
-from pygame.mixer import Sound
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
@@ -10,10 +8,19 @@ from textual.widgets import Footer
 
 from controllers.card_interact_controller import CardInteractController
 from controllers.service_locator import ServiceLocator
+from engine.klondike import Klondike
+from engine.solver import Solver
+from managers.event_bus import EventBus, MoveApplied
+from managers.game_clock import GameClock
 from managers.game_state_manager import GameStateManager
+from managers.journal_manager import JournalManager, SavedGame
+from managers.replay_manager import ReplayManager
+from managers.sound_manager import SoundManager
 from managers.theme_manager import ThemeManager
+from managers.trace_manager import TraceManager
 from widgets.game_header import GameHeader
 from widgets.game_layout import GameLayout
+from widgets.time_display import TimeDisplay
 from widgets.winner_message import WinnerMessage
 
 
@@ -23,38 +30,126 @@ class Game(Screen):
     user interaction for the game.
 
     This class contains methods for managing the game state, handling user actions, and
-    rendering UI components such as the game header, grid, footer, and winner message. Game
-    also includes static methods to handle pre-move and post-move events for tracking moves
-    and determining the game's completion.
+    rendering UI components such as the game header, grid, footer, and winner message. The
+    controller publishes every move on the screen's event bus, where the game state
+    manager records it straight away and the header, sounds and winner message pick it up
+    once per frame. The game is saved as it is played, so a `SavedGame` can be resumed
+    where it was left; a resumed game is not recorded as a replay, since replays
+    start from the deal.
+
+    :ivar events: The bus this game's moves are published on.
     """
 
-    def __init__(self, easy_mode: bool, infinite_undo: bool, game_state_manager: GameStateManager = None, theme_manager: ThemeManager = None):
+    def __init__(
+        self,
+        easy_mode: bool,
+        infinite_undo: bool,
+        *,
+        # How the game is played
+        seed: int | None = None,
+        auto_play: bool = False,
+        saved_game: SavedGame | None = None,
+        # Services, taken from the ServiceLocator when omitted
+        game_state_manager: GameStateManager = None,
+        theme_manager: ThemeManager = None,
+        sound_manager: SoundManager = None,
+        trace_manager: TraceManager = None,
+        replay_manager: ReplayManager = None,
+        journal_manager: JournalManager = None,
+    ):
         super().__init__()
-        ServiceLocator.register(CardInteractController, CardInteractController(self.screen, easy_mode))
+        self.events = EventBus(self.call_later)
+        controller = CardInteractController(self.screen, easy_mode, self.events, seed=seed, auto_play=auto_play)
+        ServiceLocator.register(CardInteractController, controller)
         self.easy_mode = easy_mode
         self.infinite_undo = infinite_undo
+        self._saved_game = saved_game
         self._game_state_manager = game_state_manager or ServiceLocator.get(GameStateManager)
+        self._game_state_manager.clear(infinite_undo)
+        if saved_game is not None:
+            controller.game = saved_game.game
+            self._game_state_manager.restore(
+                saved_game.undo_stack, saved_game.redo_stack, saved_game.moves, saved_game.remaining_undo
+            )
+        self.events.subscribe(MoveApplied, self._game_state_manager.on_move_applied)
         self._theme_manager = theme_manager or ServiceLocator.get(ThemeManager)
-
-    start_time: float = monotonic()
+        self._sound_manager = sound_manager or ServiceLocator.get(SoundManager)
+        # One sound per frame, however many cards an auto-play or auto-complete moved
+        self.events.subscribe_frame(MoveApplied, lambda events: self._sound_manager.play("flip"))
+        self._trace_manager = trace_manager or ServiceLocator.get(TraceManager)
+        self.clock = GameClock(elapsed=saved_game.elapsed if saved_game is not None else 0.0)
+        self._replay_manager = replay_manager or ServiceLocator.get(ReplayManager)
+        if saved_game is None:
+            self._recorder = self._replay_manager.start(controller.game, self.clock)
+        else:
+            self._replay_manager.stop()
+            self._recorder = None
+        controller.recorder = self._recorder
+        self._journal_manager = journal_manager or ServiceLocator.get(JournalManager)
+        self._journal = self._journal_manager.start(self.events, controller.game, self.clock, infinite_undo, auto_play)
 
     BINDINGS = [
         Binding("n", "new_game", "New Game"),
         Binding("u", "undo", "Undo"),
+        Binding("r", "redo", "Redo"),
         Binding("question_mark", "app.push_screen('help')", "Help", key_display="?"),
         Binding("q", "app.quit", "Quit"),
         Binding("c", "change_theme", "Change Theme"),
+        Binding("s", "solve", "Solve"),
+        Binding("a", "auto_complete", "Auto-complete"),
+        Binding("m", "smart_move", "Smart move"),
     ]
 
     def compose(self) -> ComposeResult:
-        yield GameHeader(self.infinite_undo)
+        yield GameHeader(ServiceLocator.get(CardInteractController).game.seed)
         yield GameLayout()
         yield Footer()
         yield WinnerMessage()
-        Sound("sounds/shuffle.ogg").play()
+        self._sound_manager.play("shuffle")
+
+    def on_mount(self) -> None:
+        if self._saved_game is not None:
+            # The layout only composes the tableau and stash; the waste and foundation are synced here
+            ServiceLocator.get(CardInteractController).sync_all()
+
+    def on_screen_resume(self) -> None:
+        self.clock.resume()
+        for time_display in self.query(TimeDisplay):
+            time_display.resume()
+
+    def on_screen_suspend(self) -> None:
+        # Help or the leaderboard is on top, so the game is not being played
+        self.clock.pause()
+        for time_display in self.query(TimeDisplay):
+            time_display.pause()
+
+    def on_unmount(self) -> None:
+        if self._recorder is not None:
+            self._recorder.close()
+        if self._journal is not None:
+            self._journal.close()
 
     def action_undo(self) -> None:
-        self._game_state_manager.undo_last_operation(self.screen)
+        with self._trace_manager.click(self.screen, "undo"):
+            self._game_state_manager.undo_last_operation(self.screen)
+
+    def action_redo(self) -> None:
+        with self._trace_manager.click(self.screen, "redo"):
+            self._game_state_manager.redo_last_operation(self.screen)
+
+    def action_auto_complete(self) -> None:
+        controller = ServiceLocator.get(CardInteractController)
+        if controller.game.is_won():
+            return
+        if not controller.game.can_auto_complete():
+            self.notify("Auto-complete needs an empty stash and waste and every card face-up.")
+            return
+        with self._trace_manager.click(self.screen, "auto_complete"):
+            controller.auto_complete()
+
+    def action_smart_move(self) -> None:
+        with self._trace_manager.click(self.screen, "smart_move"):
+            ServiceLocator.get(CardInteractController).smart_move_selection()
 
     def action_new_game(self) -> None:
         self.screen.app.pop_screen()
@@ -62,3 +157,13 @@ class Game(Screen):
     def action_change_theme(self) -> None:
         self._theme_manager.switch_theme(self.screen)
         self.notify(f"Changed theme to '{self._theme_manager.current_theme}'")
+
+    def action_solve(self) -> None:
+        self.notify("Searching for a winning line...")
+        self._solve(ServiceLocator.get(CardInteractController).game.copy())
+
+    @work(thread=True, exclusive=True)
+    def _solve(self, game: Klondike) -> None:
+        """Run the solver off the event loop and report whether the position can be won."""
+        result = Solver().solve(game)
+        self.app.call_from_thread(self.notify, f"Solver: {result}")
@@ -27,12 +27,17 @@ The goal of the game is to arrange all the cards in the final four stacks by col
 ### Keys
 - **n** - New game
 - **u** - Undo
+- **r** - Redo
+- **s** - Check whether the current position can be won
+- **m** - Smart move: move the selected cards to the foundation or the first column that takes them
+- **a** - Auto-complete: play every card to the foundation once the stash and waste are empty and all cards are face-up
 - **?** - Help
 - **q** - Exit
 ### Controls
 - Click on a hidden card from the stack to reveal cards
 - Click a card from the top to select it. 
 - Click a card from under the top to select all cards from the top card to the current card
+- Double-click a card to move it (with the cards on top of it) to the foundation, or else to the first column that takes it
 - When one card is selected, if rules allow, you can move it:
   - to the end stack by clicking on it
   - to another card from another stack by clicking on the top card
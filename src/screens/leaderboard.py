@@ -1,53 +1,124 @@
+from __future__ import annotations
+
+import sqlite3
+from concurrent.futures import Future
+
+from textual import work
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import Screen
 from textual.widgets import DataTable, Footer
 
+import constants
 from controllers.service_locator import ServiceLocator
-from managers.database_manager import DatabaseManager
+from managers.database_manager import DatabaseManager, ScoreRow
 
 
 class Leaderboard(Screen):
     """
     Represents a leaderboard screen that displays player scores including
     player name, number of moves, time taken, and the date played. The data
-    is retrieved from the database and displayed in a sorted table format.
+    is retrieved from the database already sorted, one page at a time, and
+    loaded on a worker thread so the screen opens immediately.
+
+    :param saved_score: The pending result of `DatabaseManager.save_score` when
+        the screen is opened right after saving, used to show the player's rank.
     """
 
-    BINDINGS = [Binding("n", "back", "Back")]
+    BINDINGS = [
+        Binding("n", "back", "Back"),
+        Binding("left_square_bracket", "previous_page", "Previous page", key_display="["),
+        Binding("right_square_bracket", "next_page", "Next page", key_display="]"),
+    ]
 
-    def __init__(self, database_manager: DatabaseManager = None):
+    def __init__(self, database_manager: DatabaseManager = None, saved_score: Future[int] | None = None):
         super().__init__()
         self._database_manager = database_manager or ServiceLocator.get(DatabaseManager)
+        self._saved_score = saved_score
+        # Last row of every page before the current one; None starts the first page
+        self._page_starts: list[ScoreRow | None] = [None]
+        self._rows: list[ScoreRow] = []
+        self._has_next_page = False
 
     def compose(self) -> ComposeResult:
         table: DataTable = DataTable()
-        keys = table.add_columns("Player Name", "Moves", "Time", "Date")
+        table.add_columns("#", "Player Name", "Moves", "Time", "Date")
+        yield table
+
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._load_page()
+        if self._saved_score is not None:
+            self._show_rank(self._saved_score)
+
+    def action_next_page(self) -> None:
+        if not self._has_next_page:
+            return
+        self._page_starts.append(self._rows[-1])
+        self._load_page()
 
-        scores: list[tuple[str, int, int, str]] = self._database_manager.get_top_scores()
-        for score in scores:
-            player_name: str = score[0]
-            moves: int = score[1]
-            time_seconds: int = score[2]
-            date_player: str = score[3]
+    def action_previous_page(self) -> None:
+        if len(self._page_starts) == 1:
+            return
+        self._page_starts.pop()
+        self._load_page()
+
+    @work(thread=True, exclusive=True, group="page")
+    def _load_page(self) -> None:
+        try:
+            # One row more than a page tells whether there is a next page, even when
+            # the number of scores is an exact multiple of the page size
+            rows = self._database_manager.get_scores_page(
+                self._page_starts[-1], constants.LEADERBOARD_PAGE_SIZE + 1
+            )
+        except sqlite3.Error as e:
+            # Still locked after the retries; an uncaught error in a worker would quit the app
+            self._notify_database_error("load the scores", e)
+            return
+        self.app.call_from_thread(self._show_scores, rows)
+
+    @work(thread=True, group="rank")
+    def _show_rank(self, saved_score: Future[int]) -> None:
+        try:
+            rank, total = self._database_manager.get_rank(saved_score.result())
+        except sqlite3.Error as e:
+            self._notify_database_error("save your score or find its rank", e)
+            return
+        self.app.call_from_thread(self.notify, f"Your rank: {rank} of {total}")
+
+    def _notify_database_error(self, action: str, error: sqlite3.Error) -> None:
+        """Tell the player a database operation failed. Called from a worker thread."""
+        self.app.call_from_thread(
+            self.notify, f"Could not {action}: {error}", severity="error"
+        )
+
+    def _show_scores(self, rows: list[ScoreRow]) -> None:
+        self._has_next_page = len(rows) > constants.LEADERBOARD_PAGE_SIZE
+        rows = rows[: constants.LEADERBOARD_PAGE_SIZE]
+        self._rows = rows
+        first_rank = (len(self._page_starts) - 1) * constants.LEADERBOARD_PAGE_SIZE + 1
+
+        table: DataTable = self.query_one(DataTable)
+        table.clear()
+        for rank, score in enumerate(rows, first_rank):
+            player_name: str = score[1]
+            moves: int = score[2]
+            time_seconds: float = score[3]
+            date_player: str = score[4]
 
             minutes, seconds = divmod(time_seconds, 60)
             hours, minutes = divmod(minutes, 60)
 
             table.add_row(
+                rank,
                 player_name,
                 moves,
                 f"{hours:02,.0f}:{minutes:02.0f}:{seconds:05.2f}",
                 date_player,
             )
 
-        table.sort(keys[1])
-        yield table
-
-        yield Footer()
-
     def action_back(self) -> None:
         from screens.mode_selection import ModeSelectionScreen
 
         self.screen.app.push_screen(ModeSelectionScreen())
-
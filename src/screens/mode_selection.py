@@ -1,14 +1,17 @@
 from __future__ import annotations
 
-import pygame.mixer
-from pygame.mixer import Sound
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Middle, Center
 from textual.screen import Screen
-from textual.widgets import Label, Button, Checkbox
+from textual.validation import Integer
+from textual.widgets import Label, Button, Checkbox, Input
 
-from screens.leaderboard import Leaderboard
+import constants
+from controllers.service_locator import ServiceLocator
+from engine.deals import MAX_DEAL_NUMBER
+from managers.journal_manager import JournalManager
+from managers.sound_manager import SoundManager
 
 
 class ModeSelectionScreen(Screen):
@@ -16,12 +19,18 @@ class ModeSelectionScreen(Screen):
     This class provides a user interface to choose the difficulty level of the game.
     It displays two buttons, "Easy" and "Hard," and handles user input accordingly.
     When either button is pressed, it navigates to the game screen with the selected
-    difficulty.
+    difficulty. An optional deal number replays a specific deal, and "Resume" continues
+    the saved game, if there is one.
+
+    :param seed: Deal number to prefill, e.g. from the ``--seed`` option.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, sound_manager: SoundManager = None, seed: int | None = None, journal_manager: JournalManager = None) -> None:
         super().__init__()
-        Sound("./sounds/lobby.mp3").play(-1)
+        self.seed = seed
+        self._sound_manager = sound_manager or ServiceLocator.get(SoundManager)
+        self._journal_manager = journal_manager or ServiceLocator.get(JournalManager)
+        self._sound_manager.play_music(constants.LOBBY_MUSIC)
 
     def compose(self) -> ComposeResult:
         with Middle():
@@ -39,23 +48,70 @@ class ModeSelectionScreen(Screen):
             with Center():
                 yield Label("Select Difficulty Level:", id="choose-mode-label")
             with Center(id="button-group"):
+                yield Button("Resume", id="resume", variant="primary")
                 yield Button("Easy", id="easy")
                 yield Button("Hard", id="hard")
             with Center():
                 yield Checkbox("Infinite Undo", id="infinite-undo")
+            with Center():
+                yield Checkbox("Auto-play Safe Cards", id="auto-play")
+            with Center():
+                yield Input(
+                    "" if self.seed is None else str(self.seed),
+                    placeholder="Deal number (random)",
+                    type="integer",
+                    validators=Integer(0, MAX_DEAL_NUMBER),
+                    id="deal-number",
+                )
             with Center():
                 yield Button("Show Leaderboard", id="leaderboard")
 
+    def on_screen_resume(self) -> None:
+        # Checked every time the menu is shown, as the game just left may have been won
+        self.query_one("#resume", Button).display = self._journal_manager.has_saved_game()
+
     @on(Button.Pressed)
     def button_pressed(self, event: Button.Pressed) -> None:
+        # Imported on first use, so the menu paints without loading the game
         from screens.game import Game
+        from screens.leaderboard import Leaderboard
+
+        if event.button.id == "resume":
+            self._resume()
+            return
 
-        pygame.mixer.stop()
         infinite_undo: bool = self.screen.query_one("#infinite-undo", Checkbox).value
+        auto_play: bool = self.screen.query_one("#auto-play", Checkbox).value
+        deal_number_input = self.screen.query_one("#deal-number", Input)
+        deal_number: str = deal_number_input.value
+        if event.button.id != "leaderboard" and deal_number and not deal_number_input.is_valid:
+            self.notify(f"Deal number must be between 0 and {MAX_DEAL_NUMBER}!")
+            return
+        seed = int(deal_number) if deal_number and deal_number_input.is_valid else None
+
+        self._sound_manager.stop()
         match event.button.id:
             case "easy":
-                self.screen.app.push_screen(Game(True, infinite_undo))
+                self.screen.app.push_screen(Game(True, infinite_undo, seed=seed, auto_play=auto_play))
             case "hard":
-                self.screen.app.push_screen(Game(False, infinite_undo))
+                self.screen.app.push_screen(Game(False, infinite_undo, seed=seed, auto_play=auto_play))
             case "leaderboard":
                 self.screen.app.push_screen(Leaderboard())
+
+    def _resume(self) -> None:
+        from screens.game import Game
+
+        saved_game = self._journal_manager.load()
+        if saved_game is None:
+            self.notify("The saved game could not be read.")
+            return
+        self._sound_manager.stop()
+        self.screen.app.push_screen(
+            Game(
+                saved_game.game.draw_count == 1,
+                saved_game.infinite_undo,
+                seed=saved_game.game.seed,
+                auto_play=saved_game.auto_play,
+                saved_game=saved_game,
+            )
+        )
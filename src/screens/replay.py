@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+from textual import on
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.validation import Integer
+from textual.widgets import Footer, Input, Label
+
+from controllers.card_interact_controller import CardInteractController
+from controllers.service_locator import ServiceLocator
+from engine.replay import Replay
+from managers.event_bus import EventBus
+from widgets.game_layout import GameLayout
+
+
+class ReplayScreen(Screen):
+    """
+    Plays back a recorded game, in real time or one move per frame.
+
+    Every move goes through `CardInteractController` the same way it did in the
+    game, so the board is repainted by the same code, but the board cannot be
+    clicked. The moves go to a bus of their own without subscribers, so they
+    are not counted, kept for undo or checked for a win. Seeking to a move
+    restores the replay's nearest keyframe and repaints the whole board, so
+    jumping to move 240 costs a few moves at most.
+
+    :param replay: The recorded game.
+    :param position: Number of recorded moves to start after.
+    """
+
+    AUTO_FOCUS = None
+
+    BINDINGS = [
+        Binding("space", "toggle_play", "Play/Pause"),
+        Binding("left", "step(-1)", "Back"),
+        Binding("right", "step(1)", "Forward"),
+        Binding("home", "seek_start", "Start"),
+        Binding("end", "seek_end", "End"),
+        Binding("g", "go_to", "Go to move"),
+        Binding("f", "toggle_speed", "Speed"),
+        Binding("n", "back", "Back"),
+        Binding("escape", "close_go_to", show=False),
+    ]
+
+    def __init__(self, replay: Replay, position: int = 0) -> None:
+        super().__init__()
+        self._replay = replay
+        # Read by the board widgets, as on the game screen
+        self.easy_mode = replay.draw_count == 1
+        self._controller = CardInteractController(
+            self, self.easy_mode, EventBus(), seed=replay.seed
+        )
+        ServiceLocator.register(CardInteractController, self._controller)
+        self._start_position = position
+        self._position = 0
+        self._playing = False
+        self._max_speed = False
+        # Bumped whenever playback stops or changes speed, so a step scheduled before is dropped
+        self._playback = 0
+
+    def compose(self) -> ComposeResult:
+        yield Label(id="replay-status")
+        yield GameLayout(disabled=True)
+        yield Input(
+            placeholder=f"Go to move (0-{len(self._replay)})",
+            type="integer",
+            validators=Integer(0, len(self._replay)),
+            id="seek",
+        )
+        yield Footer()
+
+    def on_mount(self) -> None:
+        self._show_seek_input(False)
+        if self._start_position:
+            self._seek(self._start_position)
+        self._update_status()
+
+    def action_toggle_play(self) -> None:
+        if self._playing:
+            self._pause()
+        else:
+            if self._position == len(self._replay):
+                self._seek(0)
+            self._playing = True
+            self._schedule_next()
+        self._update_status()
+
+    def action_toggle_speed(self) -> None:
+        self._max_speed = not self._max_speed
+        if self._playing:
+            self._playback += 1
+            self._schedule_next()
+        self._update_status()
+
+    def action_step(self, direction: int) -> None:
+        self._pause()
+        if 0 <= self._position + direction <= len(self._replay):
+            self._step(direction)
+        self._update_status()
+
+    def action_seek_start(self) -> None:
+        self._pause()
+        self._seek(0)
+
+    def action_seek_end(self) -> None:
+        self._pause()
+        self._seek(len(self._replay))
+
+    def action_go_to(self) -> None:
+        self._pause()
+        self._show_seek_input(True)
+        self.query_one("#seek", Input).focus()
+
+    @on(Input.Submitted, "#seek")
+    def go_to_submitted(self, event: Input.Submitted) -> None:
+        if not event.input.is_valid:
+            self.notify(f"Move must be between 0 and {len(self._replay)}!")
+            return
+        event.input.clear()
+        self._show_seek_input(False)
+        self._seek(int(event.value))
+
+    def action_close_go_to(self) -> None:
+        self._show_seek_input(False)
+
+    def _show_seek_input(self, show: bool) -> None:
+        # Disabled while hidden, so clicking the board cannot focus it
+        seek_input = self.query_one("#seek", Input)
+        seek_input.display = show
+        seek_input.disabled = not show
+
+    def action_back(self) -> None:
+        self._pause()
+        self.app.pop_screen()
+
+    def _pause(self) -> None:
+        self._playing = False
+        self._playback += 1
+
+    def _schedule_next(self) -> None:
+        if self._position == len(self._replay):
+            self._playing = False
+            self._update_status()
+            return
+        playback = self._playback
+        if self._max_speed:
+            self.call_after_refresh(self._advance, playback)
+        else:
+            elapsed = self._replay.entries[self._position][2]
+            delay = (elapsed - self._time_at(self._position)) / 1000
+            self.set_timer(max(delay, 0), lambda: self._advance(playback))
+
+    def _advance(self, playback: int) -> None:
+        if playback != self._playback:
+            return
+        self._step(1)
+        self._update_status()
+        self._schedule_next()
+
+    def _step(self, direction: int) -> None:
+        """Play the next recorded move, or take back the previous one."""
+        if direction > 0:
+            record, undone, _ = self._replay.entries[self._position]
+            forward = not undone
+        else:
+            record, undone, _ = self._replay.entries[self._position - 1]
+            forward = undone
+        if forward:
+            self._controller.redo((record,))
+        else:
+            self._controller.undo((record,))
+        self._position += direction
+
+    def _seek(self, position: int) -> None:
+        self._controller.game = self._replay.state_at(position)
+        self._controller.sync_all()
+        self._position = position
+        self._update_status()
+
+    def _time_at(self, position: int) -> int:
+        """Game time in milliseconds after the first `position` moves."""
+        return self._replay.entries[position - 1][2] if position else 0
+
+    def _update_status(self) -> None:
+        minutes, seconds = divmod(self._time_at(self._position) / 1000, 60)
+        hours, minutes = divmod(minutes, 60)
+        mode = "Easy" if self._replay.draw_count == 1 else "Hard"
+        state = "Playing" if self._playing else "Paused"
+        speed = "max speed" if self._max_speed else "real time"
+        self.query_one("#replay-status", Label).update(
+            f"Replay · Deal {self._replay.seed} ({mode}) · Move {self._position} of "
+            f"{len(self._replay)} · Time: {hours:02,.0f}:{minutes:02.0f}:{seconds:02.0f} · "
+            f"{state}, {speed}"
+        )
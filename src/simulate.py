@@ -0,0 +1,133 @@
+"""
+Monte Carlo simulation of Klondike policies.
+
+Plays many seeded deals with each policy in easy and hard mode, spread over a
+process pool. Deals are handed out in batches of consecutive deal numbers and
+every worker sends back only its totals, so the run scales with the number of
+cores. Each game's random choices are seeded from its deal number, so a run
+gives the same numbers whatever the number of workers.
+
+Usage::
+
+    python simulate.py                              # 10,000 deals per policy and mode
+    python simulate.py --games 100000 --policy heuristic --undo 0 3 10
+    python simulate.py --json results.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+MODES = {"easy": 1, "hard": 3}
+
+
+def run_batch(policy: str, draw_count: int, undo: int, start: int, count: int) -> tuple[int, int, int, int]:
+    """
+    Play the deals ``start`` to ``start + count - 1``.
+
+    :return: Games won, moves over all games, moves over the won games and undos used.
+    """
+    from engine.simulation import play_seed
+
+    wins = moves = winning_moves = undos = 0
+    for seed in range(start, start + count):
+        result = play_seed(seed, draw_count, policy, undo)
+        moves += result.moves
+        undos += result.undos
+        if result.won:
+            wins += 1
+            winning_moves += result.moves
+    return wins, moves, winning_moves, undos
+
+
+def simulate(
+    executor: ProcessPoolExecutor, policy: str, mode: str, undo: int, args: argparse.Namespace
+) -> dict:
+    started = time.perf_counter()
+    futures = [
+        executor.submit(
+            run_batch, policy, MODES[mode], undo, start, min(args.batch, args.start + args.games - start)
+        )
+        for start in range(args.start, args.start + args.games, args.batch)
+    ]
+    wins = moves = winning_moves = undos = 0
+    for future in futures:
+        batch_wins, batch_moves, batch_winning_moves, batch_undos = future.result()
+        wins += batch_wins
+        moves += batch_moves
+        winning_moves += batch_winning_moves
+        undos += batch_undos
+    seconds = time.perf_counter() - started
+
+    return {
+        "policy": policy,
+        "mode": mode,
+        "undo": undo,
+        "games": args.games,
+        "win_rate": wins / args.games,
+        "mean_moves": moves / args.games,
+        "mean_winning_moves": winning_moves / wins if wins else 0.0,
+        "mean_undos": undos / args.games,
+        "games_per_second": args.games / seconds,
+    }
+
+
+def _report(result: dict) -> None:
+    print(
+        f"{result['policy']:<10} {result['mode']:<5} undo {result['undo']:<5} "
+        f"win {result['win_rate']:>7.2%}  moves {result['mean_moves']:>7.1f} "
+        f"(won {result['mean_winning_moves']:>6.1f})  {result['games_per_second']:>9,.0f} games/s",
+        file=sys.stderr,
+    )
+
+
+def parse_args() -> argparse.Namespace:
+    from engine.simulation import POLICIES
+
+    parser = argparse.ArgumentParser(description="Simulate Klondike policies over many deals.")
+    parser.add_argument("--games", type=int, default=10_000, help="deals per policy and mode")
+    parser.add_argument("--start", type=int, default=0, help="first deal number")
+    parser.add_argument(
+        "--policy", nargs="+", choices=sorted(POLICIES), default=sorted(POLICIES), help="policies to run"
+    )
+    parser.add_argument("--mode", nargs="+", choices=list(MODES), default=list(MODES), help="modes to run")
+    parser.add_argument(
+        "--undo", nargs="+", type=int, default=[0], help="undo budgets to compare, e.g. 0 3 10"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--batch", type=int, default=250, help="deals per task sent to a worker")
+    parser.add_argument("--json", metavar="PATH", help="write results as JSON ('-' for stdout)")
+    args = parser.parse_args()
+    if args.games < 1 or args.batch < 1:
+        parser.error("--games and --batch must be positive")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+
+    results: list[dict] = []
+    with ProcessPoolExecutor(args.workers) as executor:
+        for policy in args.policy:
+            for mode in args.mode:
+                for undo in args.undo:
+                    results.append(simulate(executor, policy, mode, undo, args))
+                    _report(results[-1])
+
+    if args.json:
+        output = {"workers": args.workers, "start": args.start, "results": results}
+        if args.json == "-":
+            json.dump(output, sys.stdout, indent=2)
+            print()
+        else:
+            with open(args.json, "w", encoding="utf-8") as file:
+                json.dump(output, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Batch solver for ranges of deal numbers.
+
+Solves every deal in a range on a process pool and streams one result per
+deal to a JSON Lines file or an SQLite database, chosen by the output's
+extension (``.db``, ``.sqlite`` or ``.sqlite3`` for SQLite). Deals are solved
+in batches and a batch is only recorded as done once its results are on disk,
+so an interrupted sweep picks up where it stopped when run again with the
+same arguments.
+
+Only the engine is imported, never Textual or pygame, so workers start fast.
+
+Usage::
+
+    python solve.py --count 1000000 --output easy.jsonl
+    python solve.py --count 1000000 --mode hard --output deals.db --max-seconds 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import signal
+import sqlite3
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Iterator
+
+import constants
+
+MODES = {"easy": 1, "hard": 3}
+SQLITE_SUFFIXES = {".db", ".sqlite", ".sqlite3"}
+
+# ``(deal number, "winnable" | "not found" | "unknown", solution length, nodes, seconds)``, where
+# "not found" means the solver's pruned search ended without a win, not that none exists
+Row = tuple[int, str, int, int, float]
+
+
+def solve_batch(start: int, count: int, draw_count: int, budget: dict) -> list[Row]:
+    from engine.solver import solve_seed
+
+    rows: list[Row] = []
+    for seed in range(start, start + count):
+        result = solve_seed(seed, draw_count, **budget)
+        if result.solved:
+            verdict = "winnable"
+        elif result.exhausted:
+            verdict = "not found"
+        else:
+            verdict = "unknown"
+        rows.append((seed, verdict, len(result.moves), result.nodes, result.seconds))
+    return rows
+
+
+class JsonLinesSink:
+    """
+    Appends results to a JSON Lines file.
+
+    Done batches are listed in ``<output>.checkpoint`` together with the file size
+    after their lines, and the file is cut back to the last listed size when a
+    sweep resumes, so results of a batch that was not finished are not kept twice.
+
+    :param path: The results file.
+    :param run: Arguments of the sweep, which must not change between runs.
+    """
+
+    def __init__(self, path: Path, run: dict) -> None:
+        self.path = path
+        self.checkpoint_path = path.with_name(path.name + ".checkpoint")
+        self.done: set[int] = set()
+        size = 0
+        if self.checkpoint_path.exists():
+            with open(self.checkpoint_path, encoding="utf-8") as checkpoint:
+                lines = checkpoint.read().splitlines()
+            if not lines or json.loads(lines[0]) != run:
+                raise ValueError(f"{self.checkpoint_path} belongs to a sweep with other arguments")
+            for line in lines[1:]:
+                try:
+                    batch = json.loads(line)
+                except ValueError:
+                    # The sweep was stopped while this line was being written
+                    break
+                self.done.add(batch["start"])
+                size = batch["size"]
+        elif path.exists() and path.stat().st_size:
+            raise ValueError(f"{path} exists and has no checkpoint to resume from")
+
+        self._file = open(path, "ab")
+        self._file.truncate(size)
+        self._file.seek(size)
+        self._checkpoint = open(self.checkpoint_path, "a", encoding="utf-8")
+        if not self.done:
+            self._checkpoint.truncate(0)
+            self._checkpoint.write(json.dumps(run) + "\n")
+
+    def write_batch(self, start: int, rows: list[Row]) -> None:
+        for seed, verdict, moves, nodes, seconds in rows:
+            line = {"seed": seed, "result": verdict, "moves": moves, "nodes": nodes, "seconds": seconds}
+            self._file.write(json.dumps(line).encode() + b"\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._checkpoint.write(json.dumps({"start": start, "size": self._file.tell()}) + "\n")
+        self._checkpoint.flush()
+        self.done.add(start)
+
+    def close(self) -> None:
+        self._file.close()
+        self._checkpoint.close()
+
+
+class SqliteSink:
+    """
+    Stores results in an SQLite database.
+
+    Each batch is written in one transaction together with its checkpoint row,
+    so the two can never disagree.
+
+    :param path: The database file.
+    :param run: Arguments of the sweep, which must not change between runs.
+    """
+
+    def __init__(self, path: Path, run: dict) -> None:
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        with self._conn:
+            self._conn.execute("CREATE TABLE IF NOT EXISTS sweep (arguments TEXT NOT NULL)")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS deals (
+                    seed INTEGER PRIMARY KEY,
+                    result TEXT NOT NULL,
+                    moves INTEGER NOT NULL,
+                    nodes INTEGER NOT NULL,
+                    seconds REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE TABLE IF NOT EXISTS batches (start INTEGER PRIMARY KEY)")
+            saved = self._conn.execute("SELECT arguments FROM sweep").fetchone()
+            if saved is None:
+                self._conn.execute("INSERT INTO sweep VALUES (?)", (json.dumps(run),))
+            elif json.loads(saved[0]) != run:
+                raise ValueError(f"{path} belongs to a sweep with other arguments")
+        self.done = {start for (start,) in self._conn.execute("SELECT start FROM batches")}
+
+    def write_batch(self, start: int, rows: list[Row]) -> None:
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO deals VALUES (?, ?, ?, ?, ?)", rows)
+            self._conn.execute("INSERT INTO batches VALUES (?)", (start,))
+        self.done.add(start)
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def open_sink(path: Path, run: dict) -> JsonLinesSink | SqliteSink:
+    if path.suffix.lower() in SQLITE_SUFFIXES:
+        return SqliteSink(path, run)
+    return JsonLinesSink(path, run)
+
+
+def batches(args: argparse.Namespace) -> Iterator[tuple[int, int]]:
+    end = args.start + args.count
+    for start in range(args.start, end, args.batch):
+        yield start, min(args.batch, end - start)
+
+
+def sweep(args: argparse.Namespace, sink: JsonLinesSink | SqliteSink) -> None:
+    """Solve every batch that is not done yet, keeping a few batches per worker in flight."""
+    budget = {
+        "max_nodes": args.max_nodes,
+        "max_seconds": args.max_seconds,
+        "max_rerolls": args.max_rerolls,
+    }
+    pending = ((start, count) for start, count in batches(args) if start not in sink.done)
+    solved = sum(count for start, count in batches(args) if start in sink.done)
+    deals = winnable = 0
+    started = time.perf_counter()
+
+    # Workers ignore Ctrl+C; the main process stops them and keeps what is already written
+    with ProcessPoolExecutor(
+        args.workers, initializer=signal.signal, initargs=(signal.SIGINT, signal.SIG_IGN)
+    ) as executor:
+        in_flight: dict[Future[list[Row]], int] = {}
+        try:
+            while True:
+                while len(in_flight) < 2 * args.workers:
+                    batch = next(pending, None)
+                    if batch is None:
+                        break
+                    start, count = batch
+                    future = executor.submit(solve_batch, start, count, MODES[args.mode], budget)
+                    in_flight[future] = start
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    rows = future.result()
+                    sink.write_batch(in_flight.pop(future), rows)
+                    deals += len(rows)
+                    winnable += sum(row[1] == "winnable" for row in rows)
+                    solved += len(rows)
+                    elapsed = time.perf_counter() - started
+                    print(
+                        f"{solved:,}/{args.count:,} deals  {winnable / deals:.1%} winnable  "
+                        f"{deals / elapsed:,.1f} deals/s",
+                        file=sys.stderr,
+                    )
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve a range of deals on every core.")
+    parser.add_argument("--start", type=int, default=0, help="first deal number")
+    parser.add_argument("--count", type=int, required=True, help="number of deals")
+    parser.add_argument("--mode", choices=list(MODES), default="easy", help="draw one (easy) or three (hard)")
+    parser.add_argument(
+        "--output", type=Path, required=True, help="results file: .jsonl, or .db/.sqlite for SQLite"
+    )
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+    parser.add_argument("--batch", type=int, default=100, help="deals per task and per checkpoint")
+    parser.add_argument("--max-nodes", type=int, default=constants.SOLVER_MAX_NODES)
+    parser.add_argument("--max-seconds", type=float, default=constants.SOLVER_MAX_SECONDS)
+    parser.add_argument("--max-rerolls", type=int, default=constants.SOLVER_MAX_REROLLS)
+    args = parser.parse_args()
+    if args.start < 0 or args.count < 1 or args.batch < 1 or args.workers < 1:
+        parser.error("--start must not be negative and --count, --batch and --workers must be positive")
+    return args
+
+
+def main() -> int:
+    args = parse_args()
+    # Everything that decides which deals a batch holds and what its results mean
+    run = {
+        "start": args.start,
+        "count": args.count,
+        "mode": args.mode,
+        "batch": args.batch,
+        "max_nodes": args.max_nodes,
+        "max_seconds": args.max_seconds,
+        "max_rerolls": args.max_rerolls,
+    }
+    try:
+        sink = open_sink(args.output, run)
+    except (OSError, ValueError, sqlite3.Error) as error:
+        print(f"Cannot open {args.output}: {error}", file=sys.stderr)
+        return 2
+
+    try:
+        sweep(args, sink)
+    except KeyboardInterrupt:
+        print("Interrupted; run the same command again to resume.", file=sys.stderr)
+        return 130
+    finally:
+        sink.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,12 +4,16 @@ from typing import TYPE_CHECKING
 
 from rich.box import Box
 from rich.panel import Panel
+from rich.text import Text
+from textual import events
 from textual.reactive import reactive
 from textual.widget import Widget
 
-from constants import RED_SUITS
 from controllers.service_locator import ServiceLocator
+from engine.klondike import is_red
+from managers.render_cache_manager import RenderCacheManager
 from managers.theme_manager import ThemeManager
+from managers.trace_manager import TraceManager
 
 if TYPE_CHECKING:
     from widgets.tableau import Pile
@@ -27,17 +31,24 @@ class Card(Widget):
     :ivar suit: The suit of the card (e.g., ♥, ♦, ♠, ♣).
     :ivar value: The value of the card (e.g., "A", "2", ... "K").
     :ivar hidden: Indicates if the card is in a hidden state or visible.
+    :ivar card_id: The engine card this widget shows, or None for the stash refresh symbol.
+    :ivar red: Whether the suit is red.
+    :ivar selected: Whether the card is part of the controller's selection, which
+        sets it through `make_selected` and `make_unselected`.
     """
 
-    color = reactive("dim", recompose=True)
+    color = reactive("dim")
 
     def __init__(
         self,
         suit: str,
         value: str,
         hidden: bool = False,
+        card_id: int | None = None,
         card_controller: CardInteractController = None,
         theme_manager: ThemeManager = None,
+        render_cache_manager: RenderCacheManager = None,
+        trace_manager: TraceManager = None,
         **kwargs,
     ):
         from controllers.card_interact_controller import CardInteractController
@@ -46,8 +57,13 @@ class Card(Widget):
         self.suit = suit
         self.value = value
         self.hidden = hidden
+        self.card_id = card_id
+        self.red = card_id is not None and is_red(card_id)
+        self.selected = False
         self._card_controller = card_controller or ServiceLocator.get(CardInteractController)
         self._theme_manager = theme_manager or ServiceLocator.get(ThemeManager)
+        self._render_cache_manager = render_cache_manager or ServiceLocator.get(RenderCacheManager)
+        self._trace_manager = trace_manager or ServiceLocator.get(TraceManager)
 
     def __str__(self) -> str:
         return f"{self.suit}{self.value}"
@@ -55,31 +71,41 @@ class Card(Widget):
     def __repr__(self) -> str:
         return f"{self.suit}{self.value}"
 
-    def copy(self) -> Card:
-        return Card(self.suit, self.value, self.hidden)
-
     def render(self) -> Panel:
         """Render the card as a Panel with appropriate styling based on card state."""
+        self._trace_manager.count("render")
         self._set_card_color()
-        content = self._generate_card_content()
-        border_box = self._get_border_box()
+        # The rainbow animation gives every face card a new color each frame, so its
+        # panels would never be reused and would only push other looks out of the cache
+        if self._theme_manager.current_theme == "rainbow" and not self.hidden:
+            return self._build_panel()
+        # Hidden cards all look the same whatever their face
+        face = (None, None) if self.hidden else (self.suit, self.value)
+        key = (
+            *face,
+            self.hidden,
+            self.is_selected(),
+            self._theme_manager.current_theme,
+            self.color,
+        )
+        return self._render_cache_manager.get(key, self._build_panel)
 
+    def _build_panel(self) -> Panel:
         return Panel.fit(
-            content,
+            Text.from_markup(self._generate_card_content()),
             border_style=self.color,
-            box=border_box,
+            box=self._get_border_box(),
             padding=(0, 0),
             title_align="left",
         )
 
     def _set_card_color(self) -> None:
         """Determine and set the appropriate color for the card based on suit and state."""
-        is_red_suit = self.suit in RED_SUITS
-
+        # Set without triggering another refresh, since we are already rendering
         if self.hidden:
-            self.color = "dim"
+            self.set_reactive(Card.color, "dim")
         elif self._theme_manager.current_theme != "rainbow":
-            self.color = "red" if is_red_suit else "white"
+            self.set_reactive(Card.color, "red" if self.red else "white")
 
     def _generate_card_content(self) -> str:
         """Generate the visible content for the card based on its state."""
@@ -100,8 +126,18 @@ class Card(Widget):
         assert border_box is not None
         return border_box
 
-    def on_click(self) -> None:
-        self._card_controller.handle_card_click(self)
+    def on_mount(self) -> None:
+        self._theme_manager.invalidate_cards()
+
+    def on_unmount(self) -> None:
+        self._theme_manager.invalidate_cards()
+
+    def on_click(self, event: events.Click) -> None:
+        with self._trace_manager.click(self.screen, "click"):
+            if event.chain == 2:
+                self._card_controller.handle_card_double_click(self)
+            else:
+                self._card_controller.handle_card_click(self)
 
     def hide(self) -> None:
         self.hidden = True
@@ -112,20 +148,18 @@ class Card(Widget):
         self.refresh()
 
     def get_pile(self) -> Pile | None:
-        from widgets.tableau import Pile
-
-        for pile in self.screen.query(Pile):
-            if self in pile.cards:
-                return pile
-        return None
+        return self._card_controller.get_pile(self)
 
     def make_selected(self) -> None:
-        self.add_class("selected")
-        self.refresh()
+        # A plain attribute rather than a CSS class, so selecting restyles nothing but this card's border
+        if not self.selected:
+            self.selected = True
+            self.refresh()
 
     def make_unselected(self) -> None:
-        self.remove_class("selected")
-        self.refresh()
+        if self.selected:
+            self.selected = False
+            self.refresh()
 
     def is_selected(self) -> bool:
-        return self.has_class("selected")
+        return self.selected
@@ -11,7 +11,9 @@ from controllers.service_locator import ServiceLocator
 if TYPE_CHECKING:
     from widgets.tableau import Pile
     from controllers.card_interact_controller import CardInteractController
+    from managers.render_cache_manager import RenderCacheManager
     from managers.theme_manager import ThemeManager
+    from managers.trace_manager import TraceManager
 
 
 class CardHolder(Widget):
@@ -33,9 +35,13 @@ class CardHolder(Widget):
         foundation_index: int | None = None,
         card_interact_controller: CardInteractController = None,
         theme_manager: ThemeManager = None,
+        render_cache_manager: RenderCacheManager = None,
+        trace_manager: TraceManager = None,
     ):
         from controllers.card_interact_controller import CardInteractController
+        from managers.render_cache_manager import RenderCacheManager
         from managers.theme_manager import ThemeManager
+        from managers.trace_manager import TraceManager
 
         super().__init__()
         self.pile = pile
@@ -44,11 +50,19 @@ class CardHolder(Widget):
             self.add_class("invisible")
         self._card_interact_controller = card_interact_controller or ServiceLocator.get(CardInteractController)
         self._theme_manager = theme_manager or ServiceLocator.get(ThemeManager)
+        self._render_cache_manager = render_cache_manager or ServiceLocator.get(RenderCacheManager)
+        self._trace_manager = trace_manager or ServiceLocator.get(TraceManager)
 
     def copy(self) -> CardHolder:
         return CardHolder(self.has_class("invisible"))
 
     def render(self) -> RenderableType:
+        self._trace_manager.count("render")
+        return self._render_cache_manager.get(
+            ("holder", self._theme_manager.current_theme), self._build_panel
+        )
+
+    def _build_panel(self) -> Panel:
         box = self._theme_manager.get_box()
         assert box is not None
         return Panel.fit(
@@ -59,4 +73,5 @@ class CardHolder(Widget):
         )
 
     def on_click(self) -> None:
-        self._card_interact_controller.handle_card_holder_click(self)
+        with self._trace_manager.click(self.screen, "click"):
+            self._card_interact_controller.handle_card_holder_click(self)
@@ -7,12 +7,13 @@ from textual.containers import HorizontalGroup
 from textual.reactive import reactive
 
 from widgets.card_holder import CardHolder
+from widgets.keyed_compose import KeyedCompose
 
 if TYPE_CHECKING:
     from widgets.card import Card
 
 
-class Foundation(HorizontalGroup):
+class Foundation(KeyedCompose, HorizontalGroup):
     """
     Represents a foundation in a card game.
 
@@ -26,23 +27,25 @@ class Foundation(HorizontalGroup):
         None in the list represents an empty place in the foundation.
     """
 
-    cards: reactive[list[Card | None]] = reactive(
-        [None, None, None, None], recompose=True
-    )
+    cards: reactive[list[Card | None]] = reactive([None, None, None, None])
 
     def __init__(self, cards: list[Card | None] | None = None):
         super().__init__()
         if cards is None:
             cards = [None, None, None, None]
         self.cards = cards
+        self._holders: list[CardHolder] = []
+
+    def watch_cards(self) -> None:
+        self.request_reconcile()
 
     def compose(self) -> ComposeResult:
+        if not self._holders:
+            self._holders = [CardHolder(foundation_index=i) for i in range(len(self.cards))]
+
         for i, card in enumerate(self.cards):
             if card is None:
-                yield CardHolder(foundation_index=i)
+                yield self._holders[i]
             else:
                 card.offset = (0, 0)  # type: ignore
                 yield card
-
-    def copy_cards(self) -> list[Card | None]:
-        return [card.copy() if card else None for card in self.cards]
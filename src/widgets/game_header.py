@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, cast
+
 from textual.app import ComposeResult
 from textual.containers import Horizontal
 from textual.reactive import reactive
@@ -7,32 +9,59 @@ from textual.widget import Widget
 from textual.widgets import Label
 
 from constants import MAX_UNDO
+from controllers.service_locator import ServiceLocator
+from managers.event_bus import MoveApplied, MoveUndone
+from managers.game_state_manager import GameStateManager
 from widgets.time_display import TimeDisplay
 
+if TYPE_CHECKING:
+    from screens.game import Game
+
 
 class GameHeader(Widget):
     """
     This class represents a widget that displays game information including the
     title, number of moves the player has made, and the remaining undo actions.
     It is designed to be reactive, ensuring updates to its fields are dynamically
-    reflected in the widget. The widget contains labels for each piece of
-    information, organized in a horizontal layout.
+    reflected in the widget by updating only the affected label, so the time
+    display keeps running across moves. The widget contains labels for each piece of
+    information, organized in a horizontal layout. The counts are read from the
+    `GameStateManager` once per frame in which moves were played or undone.
 
     :ivar remaining_undo: Tracks the number of undo actions left for the player.
     :ivar moves: Tracks the number of moves performed by the player.
+    :ivar deal_number: Number of the deal being played, shown so it can be replayed.
     """
 
-    def __init__(self, infinite_undo: bool):
+    def __init__(self, deal_number: int, game_state_manager: GameStateManager = None):
         super().__init__()
-        if infinite_undo:
-            self.remaining_undo = 9999
+        self.deal_number = deal_number
+        self._game_state_manager = game_state_manager or ServiceLocator.get(GameStateManager)
+        self.update_counts()
 
-    remaining_undo = reactive(MAX_UNDO, recompose=True)
-    moves = reactive(0, recompose=True)
+    remaining_undo = reactive(MAX_UNDO)
+    moves = reactive(0)
 
     def compose(self) -> ComposeResult:
         with Horizontal():
-            yield Label(self.app.title, id="app-title")
+            yield Label(f"{self.app.title} · Deal {self.deal_number}", id="app-title")
             yield Label(f"Moves: {self.moves}", id="moves")
             yield Label(f"Remaining undo: {self.remaining_undo}", id="remaining-undo")
             yield TimeDisplay(id="time")
+
+    def on_mount(self) -> None:
+        events = cast("Game", self.screen).events
+        events.subscribe_frame(MoveApplied, self.update_counts)
+        events.subscribe_frame(MoveUndone, self.update_counts)
+
+    def update_counts(self, events: list[MoveApplied] | list[MoveUndone] | None = None) -> None:
+        self.moves = self._game_state_manager.moves
+        self.remaining_undo = self._game_state_manager.remaining_undo
+
+    def watch_moves(self, moves: int) -> None:
+        if self.is_mounted:
+            self.query_one("#moves", Label).update(f"Moves: {moves}")
+
+    def watch_remaining_undo(self, remaining_undo: int) -> None:
+        if self.is_mounted:
+            self.query_one("#remaining-undo", Label).update(f"Remaining undo: {remaining_undo}")
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-from random import shuffle
-
 from textual.app import ComposeResult
 from textual.containers import VerticalGroup
 
 import constants
+from controllers.card_interact_controller import CardInteractController
+from controllers.service_locator import ServiceLocator
+from engine.klondike import Klondike
 from widgets.card import Card
 from widgets.tableau import Pile, Tableau
 from widgets.top_container import TopContainer
@@ -14,75 +15,77 @@ from widgets.top_container import TopContainer
 class GameLayout(VerticalGroup):
     """
     Represents the layout of a card game displayed vertically. Responsible for
-    initializing the deck, shuffling cards, and organizing them into piles and
-    stash for gameplay. This class orchestrates the visual components of the
-    game's layout such as tableau and top container.
+    creating the card widgets and organizing them into piles and stash the way
+    the controller's engine dealt them. This class orchestrates the visual
+    components of the game's layout such as tableau and top container.
     """
 
     def compose(self) -> ComposeResult:
         """Compose the game layout with tableau and stash."""
+        card_controller = ServiceLocator.get(CardInteractController)
+        game = card_controller.game
 
-        # Create and shuffle the deck
+        # Create one widget per card and hand them to the controller
         deck = self.create_deck()
-        shuffle(deck)
+        card_controller.cards = deck
 
         # Create tableau piles
-        tableau_piles = self._create_tableau_piles(deck)
+        tableau_piles = self._create_tableau_piles(deck, game)
+        card_controller.piles = tableau_piles
 
         # Prepare stash with remaining cards
-        remaining_cards = self._prepare_stash(deck)
+        remaining_cards = self._prepare_stash(deck, game)
 
         yield TopContainer(remaining_cards)
         yield Tableau(tableau_piles)
 
-    def _create_tableau_piles(
-        self, deck: list[Card], pile_count: int = 7
-    ) -> list[Pile]:
-        """Create tableau piles with cards distributed according to solitaire rules.
+    def _create_tableau_piles(self, deck: list[Card], game: Klondike) -> list[Pile]:
+        """Create tableau piles with cards distributed according to the dealt game.
 
         Args:
-            deck: The deck of cards to distribute from
-            pile_count: Number of piles to create
+            deck: The card widgets, indexed by engine card
+            game: The dealt game to mirror
 
         Returns:
             List of tableau piles with cards distributed
         """
         piles: list[Pile] = []
 
-        for pile_index in range(pile_count):
+        for pile_index, pile_cards in enumerate(game.tableau):
             cards_for_pile: list[Card] = []
-            cards_in_pile = pile_index + 1
 
-            for card_index in range(cards_in_pile):
-                card = deck.pop()
+            for card_index, card_id in enumerate(pile_cards):
+                card = deck[card_id]
                 # Only the top card in each pile is visible
-                if card_index != pile_index:
+                if card_index < game.hidden[pile_index]:
                     card.hide()
                 cards_for_pile.append(card)
 
-            pile = Pile()
+            pile = Pile(pile_index=pile_index)
             pile.cards = cards_for_pile
             piles.append(pile)
 
         return piles
 
-    def _prepare_stash(self, deck: list[Card]) -> list[Card]:
+    def _prepare_stash(self, deck: list[Card], game: Klondike) -> list[Card]:
         """Prepare the stash with remaining cards from the deck.
 
         Args:
-            deck: The remaining cards after tableau distribution
+            deck: The card widgets, indexed by engine card
+            game: The dealt game to mirror
 
         Returns:
             The prepared stash with all cards hidden
         """
-        for card in deck:
+        stash = [deck[card_id] for card_id in game.stash]
+        for card in stash:
             card.hide()
-        return deck
+        return stash
 
     @staticmethod
     def create_deck() -> list[Card]:
         deck = []
         for suit in constants.SUITS:
             for value in constants.VALUES:
-                deck.append(Card(suit, value))
-        return deck
\ No newline at end of file
+                deck.append(Card(suit, value, card_id=len(deck)))
+        return deck
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import asyncio
+from weakref import WeakKeyDictionary
+
+from textual.screen import Screen
+from textual.widget import Widget
+
+from controllers.service_locator import ServiceLocator
+from managers.trace_manager import TraceManager
+
+# One lock per screen so a widget moving between two containers is removed from
+# the old one before the new one mounts it.
+_handover_locks: WeakKeyDictionary[Screen, asyncio.Lock] = WeakKeyDictionary()
+
+
+class KeyedCompose:
+    """
+    Mixin for containers whose `compose` yields long-lived widgets.
+
+    Instead of recomposing, which removes every child and mounts whatever
+    `compose` returns, `request_reconcile` runs `compose` again and diffs the
+    result against the current children by widget identity: widgets that are no
+    longer yielded are removed, new ones are mounted in place and the rest are
+    only moved if their order changed. Containers keep their declarative
+    `compose`; they just have to yield the same widget instance for the same
+    thing every time, including placeholders.
+    """
+
+    _reconcile_pending: bool = False
+
+    def request_reconcile(self: KeyedCompose | Widget) -> None:
+        """Schedule a reconcile; several requests before it runs are merged into one."""
+        if self._reconcile_pending or not self.is_attached:
+            return
+        self._reconcile_pending = True
+        self.call_later(self._reconcile)
+
+    async def _reconcile(self: KeyedCompose | Widget) -> None:
+        if not self.is_attached:
+            self._reconcile_pending = False
+            return
+
+        trace_manager = ServiceLocator.get(TraceManager)
+        lock = _handover_locks.setdefault(self.screen, asyncio.Lock())
+        async with lock:
+            with trace_manager.span("reconcile", container=type(self).__name__):
+                await self._reconcile_children(trace_manager)
+
+    async def _reconcile_children(self: KeyedCompose | Widget, trace_manager: TraceManager) -> None:
+        self._reconcile_pending = False
+        desired = list(self.compose())
+        desired_set = set(desired)
+
+        stale = [child for child in self.children if child not in desired_set]
+        if stale:
+            trace_manager.count("widgets.removed", len(stale))
+            await self.remove_children(stale)
+
+        for index, widget in enumerate(desired):
+            children = self.children
+            if index < len(children) and children[index] is widget:
+                continue
+
+            if widget.parent is self:
+                trace_manager.count("widgets.moved")
+                self.move_child(widget, before=index)
+                continue
+
+            # Moving in from another container
+            if widget.parent is not None:
+                await widget.remove()
+
+            trace_manager.count("widgets.mounted")
+            if index < len(children):
+                await self.mount(widget, before=index)
+            else:
+                await self.mount(widget)
+
+            # Textual refuses mounts while the app is shutting down
+            if widget.parent is not self:
+                return
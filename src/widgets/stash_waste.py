@@ -7,32 +7,41 @@ from textual.containers import HorizontalGroup
 from textual.reactive import reactive
 
 from widgets.card_holder import CardHolder
+from widgets.keyed_compose import KeyedCompose
 
 if TYPE_CHECKING:
     from widgets.card import Card
 
 
-class StashWaste(HorizontalGroup):
+class StashWaste(KeyedCompose, HorizontalGroup):
     """
     Represents a group of card stacks, including a stash and a waste pile, for managing
-    and rendering cards within a game. Provides mechanisms for card arrangement, copying,
-    and selection handling.
+    and rendering cards within a game. Provides mechanisms for card arrangement and
+    selection handling.
 
     This class is designed to visually and functionally manage a stash and waste pile of
-    cards. It allows rendering the top cards of both piles, handles card selection
-    state, and supports deep copying for both stash and waste piles.
+    cards. It allows rendering the top cards of both piles and handles card selection
+    state.
 
     :ivar stash: The list of cards in the stash pile.
     :ivar waste: The list of cards in the waste pile.
     """
 
-    stash = reactive([], recompose=True)  # type: ignore
-    waste = reactive([], recompose=True)  # type: ignore
+    stash = reactive([])  # type: ignore
+    waste = reactive([])  # type: ignore
 
     def __init__(self, stash: list[Card]):
         super().__init__()
         self.stash = stash
         self.waste = []
+        self._refresh_card: Card | None = None
+        self._holder: CardHolder | None = None
+
+    def watch_stash(self) -> None:
+        self.request_reconcile()
+
+    def watch_waste(self) -> None:
+        self.request_reconcile()
 
     def compose(self) -> ComposeResult:
         """
@@ -63,7 +72,10 @@ class StashWaste(HorizontalGroup):
             top_stash_card.offset = (0, 0)  # type: ignore
             return top_stash_card
 
-        return Card(" ", "⟳")  # Return refresh symbol when stash is empty
+        # Refresh symbol when stash is empty
+        if self._refresh_card is None:
+            self._refresh_card = Card(" ", "⟳")
+        return self._refresh_card
 
     def _prepare_easy_mode_waste_display(self) -> Card | CardHolder:
         """Prepare waste display for easy mode (only top card)."""
@@ -73,12 +85,12 @@ class StashWaste(HorizontalGroup):
             top_waste_card.offset = (0, 0)  # type: ignore
             return top_waste_card
 
-        return CardHolder()  # Empty placeholder when no waste card is available
+        return self._get_holder()  # Empty placeholder when no waste card is available
 
     def _prepare_standard_waste_display(self) -> Iterator[Card | CardHolder]:
         """Prepare waste display for standard mode (showing up to three cards)."""
         if not self.waste:
-            yield CardHolder()
+            yield self._get_holder()
             return
 
         # Display the last three cards with offset positioning
@@ -87,22 +99,13 @@ class StashWaste(HorizontalGroup):
             card.offset = (index * -4, 0)  # type: ignore
             yield card
 
+    def _get_holder(self) -> CardHolder:
+        if self._holder is None:
+            self._holder = CardHolder()
+        return self._holder
+
     def get_top_stash_card(self) -> Card | None:
         return self.stash[-1] if self.stash else None
 
     def get_top_waste_card(self) -> Card | None:
         return self.waste[-1] if self.waste else None
-
-    def deep_copy_stash(self) -> list[Card]:
-        copied_cards = [card.copy() for card in self.stash]
-        return copied_cards
-
-    def deep_copy_waste(self) -> list[Card]:
-        copied_cards = [card.copy() for card in self.waste]
-        return copied_cards
-
-    def unselect_all_cards(self) -> None:
-        for card in self.stash:
-            card.make_unselected()
-        for card in self.waste:
-            card.make_unselected()
@@ -7,9 +7,10 @@ from textual.widget import Widget
 
 
 from widgets.card_holder import CardHolder
+from widgets.keyed_compose import KeyedCompose
 
 
-class Tableau(HorizontalGroup):
+class Tableau(KeyedCompose, HorizontalGroup):
     """
     Represents a tableau in a card game layout.
 
@@ -20,54 +21,54 @@ class Tableau(HorizontalGroup):
     :ivar piles: A list of `Pile` objects that the tableau manages.
     """
 
-    piles = reactive([], recompose=True)
+    piles = reactive([])
 
     def __init__(self, piles: list[Pile]):
         super().__init__()
         self.piles = piles
 
+    def watch_piles(self) -> None:
+        self.request_reconcile()
+
     def compose(self) -> ComposeResult:
         for pile in self.piles:
             yield pile
 
 
-class Pile(Vertical):
+class Pile(KeyedCompose, Vertical):
     """
     Represents a vertical stack of Card objects that can be dynamically composed and managed.
 
-    This class is designed to organize and render a vertical collection of cards. The cards
-    can be manipulated, deeply copied, and unselected using the available methods. The offset
+    This class is designed to organize and render a vertical collection of cards, which
+    the controller sets from the engine. The offset
     of each card is adjusted dynamically based on its position in the stack. The composition
     logic yields appropriate widgets based on the state of the card collection.
 
     :ivar cards: The list of Card objects managed by this Pile. Each card's offset is adjusted
         dynamically based on its position in the list.
+    :ivar pile_index: Index of the engine tableau pile this Pile shows.
     """
 
-    cards = reactive([], recompose=True)  # type: ignore
+    cards = reactive([])  # type: ignore
 
-    def __init__(self, cards=None, *children: Widget):
+    def __init__(self, cards=None, *children: Widget, pile_index: int = 0):
         super().__init__(*children)
         if cards is None:
             cards = []
         self.cards = cards
+        self.pile_index = pile_index
+        self._holder: CardHolder | None = None
+
+    def watch_cards(self) -> None:
+        self.request_reconcile()
 
     def compose(self) -> ComposeResult:
         if not self.cards:
-            yield CardHolder(True, self)
+            if self._holder is None:
+                self._holder = CardHolder(True, self)
+            yield self._holder
             return
 
         for i, card in enumerate(self.cards):
             card.styles.offset = (0, -4 * i)
             yield card
-
-    def deep_copy(self) -> Pile:
-        copied_cards = [card.copy() for card in self.cards]
-        return Pile(copied_cards)
-
-    def unselect_cards(self) -> None:
-        from widgets.card import Card
-
-        card: Card
-        for card in self.cards:
-            card.make_unselected()
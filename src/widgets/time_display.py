@@ -1,35 +1,66 @@
 from __future__ import annotations
 
-from time import monotonic
+import math
+from typing import TYPE_CHECKING, cast
 
 from textual.reactive import reactive
+from textual.timer import Timer
 from textual.widgets import Label
 
+import constants
+
+if TYPE_CHECKING:
+    from managers.game_clock import GameClock
+
 
 class TimeDisplay(Label):
-    """A widget to display elapsed time."""
+    """
+    A widget to display the elapsed time of the game screen's `GameClock`.
+
+    The label is refreshed every `constants.CLOCK_RESOLUTION` seconds and shows
+    the time with as many decimals as that resolution needs. Updates are paused
+    together with the clock, so nothing ticks while another screen is on top.
+    """
 
     time = reactive(0.0)
-    total = reactive(0.0)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._clock: GameClock | None = None
+        self._update_timer: Timer | None = None
+        self._resolution = constants.CLOCK_RESOLUTION
+        self._decimals = max(0, -math.floor(math.log10(self._resolution)))
 
     def on_mount(self) -> None:
         """Event handler called when widget is added to the app."""
-        # noinspection PyAttributeOutsideInit
-        self.update_timer = self.set_interval(1 / 60, self.update_time)
+        from screens.game import Game
+
+        self._clock = cast(Game, self.screen).clock
+        self._update_timer = self.set_interval(self._resolution, self.update_time)
+        self.update_time()
 
     def update_time(self) -> None:
         """Method to update time to current."""
-        from screens.game import Game
-        self.time = self.total + (monotonic() - Game.start_time)
+        self.time = self._clock.elapsed
 
     def watch_time(self, time: float) -> None:
         """Called when the time attribute changes."""
+        # Round down so the label never shows a time that has not been reached yet
+        time = math.floor(time / self._resolution) * self._resolution
         minutes, seconds = divmod(time, 60)
         hours, minutes = divmod(minutes, 60)
-        self.update(f"Time: {hours:02,.0f}:{minutes:02.0f}:{seconds:05.2f}")
+        width = 2 if self._decimals == 0 else 3 + self._decimals
+        self.update(
+            f"Time: {hours:02,.0f}:{minutes:02.0f}:{seconds:0{width}.{self._decimals}f}"
+        )
+
+    def pause(self) -> None:
+        """Stop updating, e.g. while the game screen is hidden."""
+        if self._update_timer is not None:
+            self._update_timer.pause()
+            self.update_time()
 
-    def stop(self) -> None:
-        """Method to stop the time display updating."""
-        self.update_timer.pause()
-        self.total += monotonic() - self.start_time
-        self.time = self.total
+    def resume(self) -> None:
+        if self._update_timer is not None:
+            self.update_time()
+            self._update_timer.resume()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from pygame.mixer import Sound
+from typing import TYPE_CHECKING, cast
+
 from textual import on
 from textual.app import ComposeResult
 from textual.containers import Center
@@ -11,9 +12,15 @@ from textual.widgets import Static, Input, Button
 
 from controllers.service_locator import ServiceLocator
 from managers.database_manager import DatabaseManager
+from managers.event_bus import GameWon
+from managers.game_state_manager import GameStateManager
+from managers.sound_manager import SoundManager
 from screens.leaderboard import Leaderboard
 from widgets.time_display import TimeDisplay
 
+if TYPE_CHECKING:
+    from screens.game import Game
+
 
 class WinnerMessage(Widget):
     """
@@ -26,9 +33,17 @@ class WinnerMessage(Widget):
 
     moves = reactive(0, recompose=True)
 
-    def __init__(self, database_manager: DatabaseManager = None) -> None:
+    def __init__(self, database_manager: DatabaseManager = None, sound_manager: SoundManager = None, game_state_manager: GameStateManager = None) -> None:
         super().__init__()
         self._database_manager = database_manager or ServiceLocator.get(DatabaseManager)
+        self._sound_manager = sound_manager or ServiceLocator.get(SoundManager)
+        self._game_state_manager = game_state_manager or ServiceLocator.get(GameStateManager)
+
+    def on_mount(self) -> None:
+        cast("Game", self.screen).events.subscribe_frame(GameWon, self._on_game_won)
+
+    def _on_game_won(self, events: list[GameWon]) -> None:
+        self.show(self._game_state_manager.moves)
 
     def compose(self) -> ComposeResult:
         yield Static(
@@ -43,29 +58,27 @@ class WinnerMessage(Widget):
 
     @on(Button.Pressed)
     def save_score(self) -> None:
-        from widgets.game_header import GameHeader
-
         winner_name_input = self.screen.query_one("#winner-name", Input)
         if not winner_name_input.is_valid:
             self.notify("Podaj nazwę od 4 do 16 znaków!")
             return
         winner_name = winner_name_input.value
-        time_display: TimeDisplay = self.screen.query_one(TimeDisplay)
-        game_header: GameHeader = self.screen.query_one(GameHeader)
-        moves = game_header.moves
-        self._database_manager.save_score(winner_name, moves, time_display.time)
-        self.screen.app.push_screen(Leaderboard())
+        moves = self._game_state_manager.moves
+        clock = cast("Game", self.screen).clock
+        saved_score = self._database_manager.save_score(winner_name, moves, clock.elapsed)
+        self.screen.app.push_screen(Leaderboard(saved_score=saved_score))
 
     @staticmethod
     def _plural(value: int) -> str:
         return "" if value == 1 else "s"
 
     def show(self, moves: int) -> None:
-        Sound("./sounds/winscreen.ogg").play()
+        self._sound_manager.play("win")
         self.moves = moves
         self.add_class("visible")
+        cast("Game", self.screen).clock.stop()
         time_display: TimeDisplay = self.screen.query_one(TimeDisplay)
-        time_display.stop()
+        time_display.pause()
 
     def hide(self) -> None:
         self.remove_class("visible")
@@ -0,0 +1,10 @@
+import os
+import sys
+from pathlib import Path
+
+# Run the app headless, without sound or files written to the home directory
+os.environ.setdefault("PASJANS_AUDIO", "0")
+os.environ.setdefault("PASJANS_REPLAYS", "0")
+os.environ.setdefault("PASJANS_AUTOSAVE", "0")
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -0,0 +1,67 @@
+import asyncio
+
+from controllers.card_interact_controller import CardInteractController
+from controllers.service_locator import ServiceLocator
+from engine.klondike import TABLEAU, WASTE
+from pasjans import Pasjans
+from screens.game import Game
+
+# A deal whose opening position has a move between tableau piles
+DEAL_NUMBER = 1
+
+
+def test_clicks_select_move_and_draw_cards():
+    async def play() -> None:
+        app = Pasjans()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await app.push_screen(Game(True, True, seed=DEAL_NUMBER))
+            await pilot.pause()
+            controller = ServiceLocator.get(CardInteractController)
+            game = controller.game
+            cards = controller.cards
+            _, source, _, _, target = next(
+                move
+                for move in game.legal_moves()
+                if isinstance(move, tuple) and move[0] == TABLEAU and move[3] == TABLEAU
+            )
+            moved = game.tableau[source][-1]
+            under = game.tableau[target][-1]
+
+            # Clicking a card selects it, and clicking it again lets it go
+            controller.handle_card_click(cards[moved])
+            assert list(controller.selection) == [moved]
+            assert cards[moved].selected
+            controller.handle_card_click(cards[moved])
+            assert not controller.selection
+            assert not cards[moved].selected
+
+            # Clicking the top card of another pile moves the selection onto it
+            controller.handle_card_click(cards[moved])
+            controller.handle_card_click(cards[under])
+            await pilot.pause()
+            assert game.tableau[target][-2:] == [under, moved]
+            assert not controller.selection
+            assert not cards[moved].selected
+
+            # A card further down a pile selects it and every card above it, bottom card first
+            controller.handle_card_click(cards[under])
+            assert list(controller.selection) == [under, moved]
+            assert cards[under].selected and cards[moved].selected
+
+            # Drawing from the stash keeps a tableau selection and turns a card over
+            stash_top = game.stash[-1]
+            controller.handle_card_click(cards[stash_top])
+            await pilot.pause()
+            assert game.locate(stash_top)[0] == WASTE
+            assert list(controller.selection) == [under, moved]
+
+            # A selected waste card is dropped when drawing moves it
+            controller.handle_card_click(cards[stash_top])
+            assert list(controller.selection) == [stash_top]
+            controller.handle_card_click(cards[game.stash[-1]])
+            await pilot.pause()
+            assert not controller.selection
+            assert not cards[stash_top].selected
+
+    asyncio.run(play())
@@ -0,0 +1,80 @@
+import gc
+import weakref
+
+import pytest
+
+from managers.database_manager import DatabaseManager
+
+
+@pytest.fixture
+def database(tmp_path):
+    manager = DatabaseManager(tmp_path / "scores.db")
+    yield manager
+    manager.close()
+
+
+def _save(database: DatabaseManager, scores: list[tuple[int, float]]) -> list[int]:
+    futures = [database.save_score(f"player{i}", moves, time) for i, (moves, time) in enumerate(scores)]
+    return [future.result() for future in futures]
+
+
+def _all_pages(database: DatabaseManager, page_size: int) -> list[list]:
+    pages = []
+    after = None
+    while True:
+        page = database.get_scores_page(after, page_size)
+        pages.append(page)
+        if len(page) < page_size:
+            return pages
+        after = page[-1]
+
+
+def test_pages_follow_the_leaderboard_order(database):
+    # Ties on moves, and on moves and time, so the order falls back to time and then id
+    scores = [(100 + i % 7, float(i % 3)) for i in range(45)]
+    ids = _save(database, scores)
+
+    pages = _all_pages(database, 20)
+
+    assert [len(page) for page in pages] == [20, 20, 5]
+    expected = sorted(zip(scores, ids), key=lambda score: (*score[0], score[1]))
+    assert [row[0] for page in pages for row in page] == [score_id for _, score_id in expected]
+
+
+def test_last_full_page_is_followed_by_an_empty_one(database):
+    _save(database, [(100 + i, 10.0) for i in range(40)])
+
+    pages = _all_pages(database, 20)
+
+    assert [len(page) for page in pages] == [20, 20, 0]
+
+
+def test_rank_counts_every_better_score(database):
+    scores = [(120, 30.0), (100, 50.0), (120, 10.0), (90, 99.0), (120, 30.0)]
+    ids = _save(database, scores)
+
+    order = sorted(range(len(scores)), key=lambda i: (*scores[i], ids[i]))
+    for rank, index in enumerate(order, start=1):
+        assert database.get_rank(ids[index]) == (rank, len(scores))
+
+
+def test_saving_a_score_refreshes_cached_pages(database):
+    _save(database, [(100, 10.0)])
+    assert len(database.get_scores_page()) == 1
+
+    _save(database, [(50, 10.0)])
+
+    first_page = database.get_scores_page()
+    assert [row[2] for row in first_page] == [50, 100]
+
+
+def test_a_closed_manager_is_not_kept_alive(tmp_path):
+    manager = DatabaseManager(tmp_path / "scores.db")
+    manager.save_score("player", 100, 10.0).result()
+    manager.close()
+    reference = weakref.ref(manager)
+
+    del manager
+    gc.collect()
+
+    assert reference() is None
@@ -0,0 +1,35 @@
+import pytest
+
+from engine import deals
+
+
+def test_deal_order_is_a_permutation_of_the_deck():
+    for deal_number in (0, 1, 2**40, deals.MAX_DEAL_NUMBER):
+        assert sorted(deals.deal_order(deal_number)) == list(range(deals.DECK_SIZE))
+
+
+def test_deal_numbers_keep_their_deal():
+    # Changing these breaks every shared deal number and recorded replay
+    assert list(deals.deal_order(0)[:10]) == [14, 8, 46, 9, 32, 22, 33, 1, 5, 21]
+    assert list(deals.deal_order(123456789)[:10]) == [4, 43, 44, 17, 26, 19, 10, 13, 28, 25]
+    assert list(deals.reroll_order(0, 0, 24)[:10]) == [22, 13, 15, 23, 14, 10, 12, 21, 11, 1]
+
+
+def test_bulk_deals_match_single_deals():
+    assert list(deals.deal_orders(1000, 50)) == [deals.deal_order(n) for n in range(1000, 1050)]
+
+
+def test_reroll_orders_differ_per_reroll():
+    first = deals.reroll_order(9, 0, 24)
+    assert sorted(first) == list(range(24))
+    assert first != deals.reroll_order(9, 1, 24)
+    assert deals.reroll_order(9, 0, 24) == first
+
+
+def test_deal_numbers_out_of_range_are_rejected():
+    with pytest.raises(ValueError):
+        deals.deal_order(-1)
+    with pytest.raises(ValueError):
+        deals.deal_order(deals.MAX_DEAL_NUMBER + 1)
+    with pytest.raises(ValueError):
+        list(deals.deal_orders(deals.MAX_DEAL_NUMBER, 2))
@@ -0,0 +1,63 @@
+from managers.event_bus import CardFlipped, EventBus, GameWon, MoveApplied
+
+
+def test_frame_subscribers_get_the_events_of_a_frame_at_once():
+    scheduled = []
+    bus = EventBus(scheduled.append)
+    immediate = []
+    frames = []
+    bus.subscribe(MoveApplied, immediate.append)
+    bus.subscribe_frame(MoveApplied, frames.append)
+
+    events = [MoveApplied(((3, i, 1, 2, 0, False),)) for i in range(3)]
+    for event in events:
+        bus.publish(event)
+
+    assert immediate == events
+    assert frames == []
+    # One flush is scheduled for the whole frame
+    assert len(scheduled) == 1
+
+    scheduled.pop()()
+
+    assert frames == [events]
+
+
+def test_a_flush_delivers_each_type_to_its_own_subscribers():
+    scheduled = []
+    bus = EventBus(scheduled.append)
+    flips = []
+    wins = []
+    bus.subscribe_frame(CardFlipped, flips.append)
+    bus.subscribe_frame(GameWon, wins.append)
+
+    bus.publish(CardFlipped(2))
+    bus.publish(CardFlipped(5))
+    bus.publish(GameWon())
+    scheduled.pop()()
+
+    assert [[event.pile_index for event in frame] for frame in flips] == [[2, 5]]
+    assert len(wins) == 1 and len(wins[0]) == 1
+
+    # The next frame starts afresh
+    bus.publish(CardFlipped(1))
+    assert len(scheduled) == 1
+
+
+def test_without_a_scheduler_frame_subscribers_are_called_straight_away():
+    bus = EventBus()
+    frames = []
+    bus.subscribe_frame(GameWon, frames.append)
+
+    bus.publish(GameWon())
+
+    assert len(frames) == 1
+
+
+def test_events_nobody_subscribed_to_are_dropped():
+    scheduled = []
+    bus = EventBus(scheduled.append)
+
+    bus.publish(GameWon())
+
+    assert scheduled == []
@@ -0,0 +1,82 @@
+import gc
+import random
+import weakref
+
+from engine.klondike import Klondike
+from engine.replay import pack_state
+from managers.event_bus import EventBus, MoveApplied, MoveUndone
+from managers.game_clock import GameClock
+from managers.game_state_manager import GameStateManager
+from managers.journal_manager import JournalManager
+
+
+def _play(tmp_path, snapshot_interval: int, moves: int):
+    """Play random moves and undos into a journal, returning its manager, the game and its history."""
+    history = GameStateManager()
+    history.clear(infinite_undo=True)
+    events = EventBus()
+    events.subscribe(MoveApplied, history.on_move_applied)
+    game = Klondike.deal(1, 11)
+    now = [0.0]
+    clock = GameClock(time_source=lambda: now[0])
+    clock.resume()
+    manager = JournalManager(tmp_path, True, snapshot_interval, history)
+    manager.start(events, game, clock, infinite_undo=True, auto_play=False)
+
+    rng = random.Random(3)
+    for _ in range(moves):
+        now[0] += 1.5
+        if history.undo_stack and rng.random() < 0.25:
+            step = history.take_undo()
+            for record in reversed(step):
+                game.revert(record)
+            events.publish(MoveUndone(step))
+        else:
+            step = (game.apply(rng.choice(game.legal_moves())),)
+            events.publish(MoveApplied(step))
+    return manager, game, history, clock
+
+
+def test_resume_restores_the_game_left_without_closing(tmp_path):
+    # A short interval, so the save is a snapshot plus a journal tail as after a crash
+    manager, game, history, clock = _play(tmp_path, snapshot_interval=8, moves=61)
+
+    saved = JournalManager(tmp_path, True, 8, GameStateManager()).load()
+
+    assert saved is not None
+    assert pack_state(saved.game) == pack_state(game)
+    assert saved.moves == history.moves
+    assert saved.remaining_undo == history.remaining_undo
+    assert saved.undo_stack == history.undo_stack
+    assert saved.redo_stack == history.redo_stack
+    assert saved.elapsed == clock.elapsed
+    assert saved.infinite_undo and not saved.auto_play
+
+
+def test_an_entry_cut_short_is_ignored(tmp_path):
+    manager, game, history, _ = _play(tmp_path, snapshot_interval=1000, moves=10)
+    manager.stop()
+    journal = tmp_path / "journal"
+    journal.write_bytes(journal.read_bytes() + b"\x00\x01")
+
+    saved = JournalManager(tmp_path, True, 1000, GameStateManager()).load()
+
+    assert saved is not None and pack_state(saved.game) == pack_state(game)
+
+
+def test_nothing_to_resume_without_a_save(tmp_path):
+    manager = JournalManager(tmp_path, True, 8, GameStateManager())
+
+    assert not manager.has_saved_game()
+    assert manager.load() is None
+
+
+def test_a_stopped_manager_is_not_kept_alive(tmp_path):
+    manager, *_ = _play(tmp_path, snapshot_interval=8, moves=5)
+    manager.stop()
+    reference = weakref.ref(manager)
+
+    del manager, _
+    gc.collect()
+
+    assert reference() is None
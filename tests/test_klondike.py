@@ -0,0 +1,123 @@
+import random
+
+from engine.klondike import (
+    DECK_SIZE,
+    EMPTY,
+    FOUNDATION,
+    KING,
+    REROLL,
+    STASH,
+    TABLEAU,
+    WASTE,
+    Klondike,
+    make_card,
+)
+
+HEARTS, DIAMONDS, SPADES, CLUBS = range(4)
+
+
+def _snapshot(game: Klondike) -> tuple:
+    return (
+        [pile.copy() for pile in game.tableau],
+        game.hidden.copy(),
+        game.stash.copy(),
+        game.waste.copy(),
+        game.foundation.copy(),
+        game.rerolls,
+        game.locations.copy(),
+    )
+
+
+def _reindexed_locations(game: Klondike) -> list:
+    """The locations a position built from scratch has, to check the incremental index against."""
+    return Klondike(game.tableau, game.hidden, game.stash, game.waste, game.foundation).locations
+
+
+def _empty_tableau() -> list[list[int]]:
+    return [[] for _ in range(7)]
+
+
+def test_deal_lays_out_every_card_once():
+    game = Klondike.deal(1, 42)
+
+    assert [len(pile) for pile in game.tableau] == [1, 2, 3, 4, 5, 6, 7]
+    assert game.hidden == [0, 1, 2, 3, 4, 5, 6]
+    assert len(game.stash) == 24 and game.waste == []
+    assert game.foundation == [EMPTY] * 4
+    cards = [card for pile in game.tableau for card in pile] + game.stash
+    assert sorted(cards) == list(range(DECK_SIZE))
+
+
+def test_same_deal_number_gives_same_deal():
+    assert _snapshot(Klondike.deal(3, 7)) == _snapshot(Klondike.deal(3, 7))
+    assert Klondike.deal(1, 7).tableau != Klondike.deal(1, 8).tableau
+
+
+def test_tableau_takes_alternating_colours_one_rank_lower():
+    tableau = _empty_tableau()
+    tableau[0] = [make_card(SPADES, 9)]  # black 10
+    tableau[1] = [make_card(HEARTS, 8)]  # red 9
+    tableau[2] = [make_card(CLUBS, 8)]  # black 9
+    tableau[3] = [make_card(DIAMONDS, KING)]
+    game = Klondike(tableau, [0] * 7, [], [], [EMPTY] * 4)
+
+    assert game.can_move(TABLEAU, 1, 1, TABLEAU, 0)
+    assert not game.can_move(TABLEAU, 2, 1, TABLEAU, 0)
+    assert not game.can_move(TABLEAU, 0, 1, TABLEAU, 1)
+    # Only a King goes on an empty pile
+    assert game.can_move(TABLEAU, 3, 1, TABLEAU, 4)
+    assert not game.can_move(TABLEAU, 1, 1, TABLEAU, 4)
+
+
+def test_foundation_builds_up_by_suit_from_the_ace():
+    tableau = _empty_tableau()
+    tableau[0] = [make_card(HEARTS, 1)]
+    tableau[1] = [make_card(HEARTS, 0)]
+    tableau[2] = [make_card(SPADES, 1)]
+    game = Klondike(tableau, [0] * 7, [], [], [EMPTY] * 4)
+
+    assert not game.can_move(TABLEAU, 0, 1, FOUNDATION, 0)
+    game.move(TABLEAU, 1, 1, FOUNDATION, 0)
+    assert game.foundation[0] == make_card(HEARTS, 0)
+    assert not game.can_move(TABLEAU, 2, 1, FOUNDATION, 0)
+    assert game.can_move(TABLEAU, 0, 1, FOUNDATION, 0)
+
+
+def test_moving_the_last_face_up_card_flips_the_one_below():
+    tableau = _empty_tableau()
+    tableau[0] = [make_card(CLUBS, 4), make_card(HEARTS, 0)]
+    game = Klondike(tableau, [1, 0, 0, 0, 0, 0, 0], [], [], [EMPTY] * 4)
+
+    assert game.move(TABLEAU, 0, 1, FOUNDATION, 0) is True
+    assert game.hidden[0] == 0
+    assert game.locate(make_card(HEARTS, 0)) == (FOUNDATION, 0, 0)
+
+
+def test_apply_and_revert_keep_the_locations_index_exact():
+    for draw_count in (1, 3):
+        game = Klondike.deal(draw_count, 2024)
+        start = _snapshot(game)
+        rng = random.Random(draw_count)
+        records = []
+        for _ in range(300):
+            records.append(game.apply(rng.choice(game.legal_moves())))
+            assert game.locations == _reindexed_locations(game)
+
+        while records:
+            game.revert(records.pop())
+            assert game.locations == _reindexed_locations(game)
+        assert _snapshot(game) == start
+
+
+def test_reroll_turns_the_waste_back_and_revert_restores_its_order():
+    game = Klondike.deal(1, 5)
+    while game.stash:
+        game.apply((STASH, 0, 0, WASTE, 0))
+    waste = game.waste.copy()
+
+    record = game.apply(REROLL)
+    assert game.waste == [] and sorted(game.stash) == sorted(waste)
+    assert game.rerolls == 1
+
+    game.revert(record)
+    assert game.waste == waste and game.stash == [] and game.rerolls == 0
@@ -0,0 +1,43 @@
+import asyncio
+
+import pytest
+from textual.widgets import DataTable
+
+from managers.database_manager import DatabaseManager
+from pasjans import Pasjans
+from screens.leaderboard import Leaderboard
+
+
+async def _turn_pages(database: DatabaseManager, keys: list[str]) -> list[list]:
+    """Open the leaderboard, press `keys` one at a time and return the rows shown after each."""
+    app = Pasjans()
+    shown = []
+    async with app.run_test() as pilot:
+        await pilot.pause()
+        await app.push_screen(Leaderboard(database))
+        for key in [None, *keys]:
+            if key is not None:
+                await pilot.press(key)
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            table = app.screen.query_one(DataTable)
+            shown.append([table.get_row_at(row) for row in range(table.row_count)])
+    return shown
+
+
+@pytest.mark.parametrize(("score_count", "last_page_ranks"), [(40, [21, 40]), (41, [41, 41])])
+def test_next_page_is_offered_only_when_there_are_more_scores(tmp_path, score_count, last_page_ranks):
+    database = DatabaseManager(tmp_path / "scores.db")
+    for future in [database.save_score(f"player{i}", 100 + i, 10.0) for i in range(score_count)]:
+        future.result()
+
+    try:
+        pages = asyncio.run(_turn_pages(database, ["right_square_bracket", "right_square_bracket"]))
+    finally:
+        database.close()
+
+    first, second, third = pages
+    assert [first[0][0], first[-1][0]] == [1, 20]
+    assert [second[0][0], second[-1][0]] == [21, 40]
+    # With exactly two pages of scores the second press leaves the last page showing
+    assert [third[0][0], third[-1][0]] == last_page_ranks
@@ -0,0 +1,109 @@
+import asyncio
+import gc
+import io
+import weakref
+
+from textual.pilot import Pilot
+
+from controllers.card_interact_controller import CardInteractController
+from controllers.service_locator import ServiceLocator
+from engine.klondike import DRAW, EMPTY, FOUNDATION, REROLL, TABLEAU, Klondike, Move
+from engine.replay import Replay, ReplayWriter, pack_state
+from engine.solver import Solver
+from managers.game_clock import GameClock
+from managers.replay_manager import ReplayManager
+from pasjans import Pasjans
+from screens.game import Game
+from widgets.card import Card
+from widgets.card_holder import CardHolder
+
+DEAL_NUMBER = 0
+# Small enough that keyframes fall inside the auto-complete step and its undo
+KEYFRAME_INTERVAL = 5
+
+
+def _holds(target: int, target_index: int):
+    def holds(holder: CardHolder) -> bool:
+        if target == FOUNDATION:
+            return holder.foundation_index == target_index
+        return holder.pile is not None and holder.pile.pile_index == target_index
+
+    return holds
+
+
+async def click_move(pilot: Pilot, controller: CardInteractController, move: Move) -> None:
+    """Make a move the way a player would, by clicking its source and then its target."""
+    game = controller.game
+    screen = pilot.app.screen
+    if move == DRAW:
+        controller.handle_card_click(controller.cards[game.stash[-1]])
+    elif move == REROLL:
+        controller.handle_card_click(next(card for card in screen.query(Card) if card.card_id is None))
+    else:
+        source, source_index, count, target, target_index = move
+        if source == TABLEAU:
+            controller.handle_card_click(controller.cards[game.tableau[source_index][-count]])
+        else:
+            controller.handle_card_click(controller.cards[game.waste[-1]])
+        if target == TABLEAU and game.tableau[target_index]:
+            controller.handle_card_click(controller.cards[game.tableau[target_index][-1]])
+        elif target == FOUNDATION and game.foundation[target_index] != EMPTY:
+            controller.handle_card_click(controller.cards[game.foundation[target_index]])
+        else:
+            controller.handle_card_holder_click(next(filter(_holds(target, target_index), screen.query(CardHolder))))
+    await pilot.pause()
+
+
+def test_state_at_matches_the_game_after_every_entry():
+    """Keyframes inside a multi-record step hold the position at their own entry."""
+
+    async def play() -> tuple[bytes, list[bytes]]:
+        app = Pasjans()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            await app.push_screen(Game(True, True, seed=DEAL_NUMBER))
+            await pilot.pause()
+            controller = ServiceLocator.get(CardInteractController)
+            solution = Solver().solve(controller.game.copy())
+            assert solution.solved
+
+            file = io.BytesIO()
+            states: list[bytes] = []
+            writer = ReplayWriter(file, controller.game, lambda: 0.0, KEYFRAME_INTERVAL)
+            record = writer.record
+
+            def record_and_snapshot(*args) -> None:
+                record(*args)
+                states.append(pack_state(controller.game))
+
+            writer.record = record_and_snapshot
+            controller.recorder = writer
+
+            await click_move(pilot, controller, DRAW)
+            await pilot.press("u")
+            for move in solution.moves:
+                if controller.game.can_auto_complete():
+                    break
+                await click_move(pilot, controller, move)
+            await pilot.press("a", "u", "r")
+            await pilot.pause()
+            assert controller.game.is_won()
+            return file.getvalue(), states
+
+    data, states = asyncio.run(play())
+    replay = Replay.from_bytes(data)
+    assert len(replay) == len(states)
+    for position, state in enumerate(states, start=1):
+        assert pack_state(replay.state_at(position)) == state
+
+
+def test_a_stopped_manager_is_not_kept_alive(tmp_path):
+    manager = ReplayManager(tmp_path, True)
+    assert manager.start(Klondike.deal(1, DEAL_NUMBER), GameClock(time_source=lambda: 0.0)) is not None
+    manager.stop()
+    reference = weakref.ref(manager)
+
+    del manager
+    gc.collect()
+
+    assert reference() is None
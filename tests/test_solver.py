@@ -0,0 +1,41 @@
+from engine.klondike import Klondike
+from engine.solver import Solver, solve_seed
+
+
+def test_solution_wins_the_deal():
+    result = solve_seed(0, 1)
+
+    assert result.solved and not result.exhausted
+    game = Klondike.deal(1, 0)
+    for move in result.moves:
+        game.apply(move)
+    assert game.is_won()
+
+
+def test_search_is_the_same_every_run():
+    budget = {"max_nodes": 5_000, "max_seconds": 60.0}
+    first = solve_seed(2, 3, **budget)
+    second = solve_seed(2, 3, **budget)
+
+    assert (first.solved, first.exhausted, first.nodes, first.moves) == (
+        second.solved,
+        second.exhausted,
+        second.nodes,
+        second.moves,
+    )
+
+
+def test_solving_leaves_the_position_untouched():
+    game = Klondike.deal(1, 0)
+    tableau = [pile.copy() for pile in game.tableau]
+
+    Solver().solve(game)
+
+    assert game.tableau == tableau and len(game.stash) == 24
+
+
+def test_node_budget_stops_the_search_without_a_verdict():
+    result = Solver(max_nodes=10).solve(Klondike.deal(1, 2))
+
+    assert not result.solved and not result.exhausted
+    assert result.nodes == 10